@@ -0,0 +1,13 @@
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+from griptape.drivers.sql.sql_driver import SqlDriver
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+from griptape.loaders import SqlLoader
+
+loader = SqlLoader(sql_driver=SqlDriver(engine_url="sqlite:///:memory:"), batch_size=500)
+vector_store = LocalVectorStoreDriver(embedding_driver=OpenAiEmbeddingDriver())
+
+query = "WITH RECURSIVE nums(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM nums WHERE n < 2000) SELECT n FROM nums"
+
+# Each batch is embedded and stored before the next batch is fetched
+for artifacts in loader.load_batches(query):
+    vector_store.upsert_collection({"rows": artifacts.value})
@@ -0,0 +1,10 @@
+from griptape.drivers.cache.local import LocalCacheDriver
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+
+cache_driver = LocalCacheDriver(max_size=1000, ttl=60 * 60 * 24, persist_file="embeddings.db")
+embedding_driver = OpenAiEmbeddingDriver(cache_driver=cache_driver)
+
+embedding_driver.embed("Hello Griptape!")
+embedding_driver.embed("Hello Griptape!")
+
+print(cache_driver.hits, cache_driver.misses)
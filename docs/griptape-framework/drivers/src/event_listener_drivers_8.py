@@ -0,0 +1,23 @@
+import os
+
+from griptape.drivers.event_listener.webhook import WebhookEventListenerDriver
+from griptape.events import EventBus, EventListener, TextChunkEvent
+from griptape.structures import Agent
+
+event_listener_driver = WebhookEventListenerDriver(
+    webhook_url=os.environ["WEBHOOK_URL"],
+    batch_size=50,
+    flush_interval=0.5,
+    max_queue_size=500,
+    backpressure_policy="drop_oldest",
+)
+
+EventBus.add_event_listeners(
+    [EventListener(event_types=[TextChunkEvent], event_listener_driver=event_listener_driver)],
+)
+
+agent = Agent(stream=True)
+
+agent.run("Write a haiku about queues")
+
+print(f"Dropped {event_listener_driver.dropped_events} events")
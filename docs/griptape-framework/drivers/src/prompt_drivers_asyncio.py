@@ -0,0 +1,30 @@
+import asyncio
+
+from griptape.artifacts import TextArtifact
+from griptape.common import TextDeltaMessageContent
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.structures import Agent
+
+
+async def main() -> None:
+    driver = OpenAiChatPromptDriver(model="gpt-4.1")
+
+    # Await a single completion
+    message = await driver.arun(TextArtifact("What is the capital of France?"))
+    print(message.value)
+
+    # Stream a completion
+    async for message_delta in driver.astream(TextArtifact("Write a haiku about the sea.")):
+        if isinstance(message_delta.content, TextDeltaMessageContent):
+            print(message_delta.content.text, end="")
+    print()
+
+    # Run many conversations concurrently on the same event loop
+    agents = [Agent(prompt_driver=driver) for _ in range(3)]
+    await asyncio.gather(*(agent.arun(f"What is {i} + {i}?") for i, agent in enumerate(agents)))
+
+    for agent in agents:
+        print(agent.output.value)
+
+
+asyncio.run(main())
@@ -0,0 +1,12 @@
+from griptape.drivers.cache.local import LocalCacheDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.structures import Agent
+
+cache_driver = LocalCacheDriver(max_size=1000, ttl=60 * 60, persist_file="prompts.db")
+agent = Agent(prompt_driver=OpenAiChatPromptDriver(model="gpt-4.1", temperature=0, cache_driver=cache_driver))
+
+agent.run("What is the capital of France?")
+agent.conversation_memory.runs.clear()
+agent.run("What is the capital of France?")
+
+print(f"Hit rate: {cache_driver.hit_rate:.0%}")
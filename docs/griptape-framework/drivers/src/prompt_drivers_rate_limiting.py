@@ -0,0 +1,17 @@
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+from griptape.utils import RateLimiter
+
+rate_limiter = RateLimiter.get_shared(
+    "openai/gpt-4.1", requests_per_minute=500, tokens_per_minute=30_000, max_concurrency=8
+)
+prompt_driver = OpenAiChatPromptDriver(model="gpt-4.1", rate_limiter=rate_limiter)
+
+workflow = Workflow(
+    tasks=[PromptTask(f"Write a haiku about the number {i}.", prompt_driver=prompt_driver) for i in range(20)]
+)
+workflow.run()
+
+print(f"Throttled {rate_limiter.throttled_requests} of {rate_limiter.requests} requests")
+print(f"Average wait: {rate_limiter.average_wait_time:.2f}s")
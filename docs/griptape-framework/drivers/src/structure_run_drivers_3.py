@@ -0,0 +1,37 @@
+from griptape.drivers.structure_run.local import ProcessPoolStructureRunDriver
+from griptape.rules import Rule
+from griptape.structures import Agent, Workflow
+from griptape.tasks import StructureRunTask
+
+
+def build_summarizer() -> Agent:
+    return Agent(
+        rules=[
+            Rule(
+                value="Summarize the text in one sentence.",
+            )
+        ],
+    )
+
+
+if __name__ == "__main__":
+    structure_run_driver = ProcessPoolStructureRunDriver(
+        create_structure=build_summarizer,
+        max_workers=4,
+        max_runs_per_worker=100,
+        timeout=120,
+    )
+
+    workflow = Workflow(
+        tasks=[
+            StructureRunTask((text,), structure_run_driver=structure_run_driver)
+            for text in [
+                "Griptape is a modular Python framework for building AI applications.",
+                "Structure Run Drivers run Structures in a variety of runtime environments.",
+            ]
+        ]
+    )
+
+    workflow.run()
+
+    structure_run_driver.shutdown()
@@ -0,0 +1,20 @@
+from concurrent import futures
+
+from griptape.artifacts import ListArtifact, TextArtifact
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.engines import CsvExtractionEngine
+from griptape.loaders import WebLoader
+
+csv_engine = CsvExtractionEngine(
+    prompt_driver=OpenAiChatPromptDriver(model="gpt-4.1"),
+    column_names=["name", "occupation"],
+    # Extract at most 4 chunks at a time
+    create_futures_executor=lambda: futures.ThreadPoolExecutor(max_workers=4),
+    deduplicate=True,
+)
+
+text = WebLoader().load("https://en.wikipedia.org/wiki/List_of_physicists").to_text()
+
+# Rows are yielded as soon as the chunk they were extracted from completes
+for row in csv_engine.extract_artifacts_stream(ListArtifact([TextArtifact(text)])):
+    print(row.to_text())
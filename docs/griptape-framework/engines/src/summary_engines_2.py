@@ -0,0 +1,23 @@
+from concurrent import futures
+
+import requests
+
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.engines import PromptSummaryEngine
+from griptape.loaders import PdfLoader
+from griptape.tasks import TextSummaryTask
+
+response = requests.get("https://arxiv.org/pdf/1706.03762.pdf")
+engine = PromptSummaryEngine(
+    prompt_driver=OpenAiChatPromptDriver(model="gpt-4.1"),
+    strategy="map_reduce",
+    # Summarize at most 4 chunks at a time.
+    create_futures_executor=lambda: futures.ThreadPoolExecutor(max_workers=4),
+)
+
+artifact = PdfLoader().parse(response.content)
+
+engine.summarize_artifacts(artifact)
+
+# Tasks and Tools that take a Summary Engine use the strategy too.
+task = TextSummaryTask(artifact.to_text(), summary_engine=engine)
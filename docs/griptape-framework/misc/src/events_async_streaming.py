@@ -0,0 +1,14 @@
+import asyncio
+
+from griptape.events import BaseEvent
+from griptape.structures import Agent
+
+
+async def main() -> None:
+    agent = Agent()
+
+    async for event in agent.arun_stream("Hi!", event_types=[BaseEvent]):  # All Events
+        print(type(event))
+
+
+asyncio.run(main())
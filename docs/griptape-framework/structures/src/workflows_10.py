@@ -0,0 +1,13 @@
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+
+workflow = Workflow(
+    tasks=[
+        PromptTask("Summarize the latest release notes", priority=1),
+        PromptTask("Write a haiku about software releases"),
+        PromptTask("List three facts about the moon", priority=-1),
+    ],
+    max_concurrency=2,
+)
+
+workflow.run()
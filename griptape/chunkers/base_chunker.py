@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Optional
+from typing import Callable, Optional
 
 from attrs import Attribute, Factory, define, field
 
@@ -13,6 +13,7 @@ from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 @define
 class BaseChunker(ABC):
     DEFAULT_SEPARATORS = [ChunkSeparator(" ")]
+    MIDPOINT_TOKEN_TOLERANCE = 8
 
     separators: list[ChunkSeparator] = field(
         default=Factory(lambda self: self.DEFAULT_SEPARATORS, takes_self=True),
@@ -97,15 +98,98 @@ class BaseChunker(ABC):
         return first_subchunk, second_subchunk
 
     def __find_midpoint_index(self, separator: ChunkSeparator, subchunks: list[str], half_token_count: int) -> int:
-        midpoint_index = -1
-        best_midpoint_distance = float("inf")
+        # Returns the first index whose prefix token count is closest to `half_token_count`. Prefix token counts grow
+        # as subchunks are appended, except for dips where tokens merge across a separator. Instead of tokenizing every
+        # prefix, binary search for where the counts cross the midpoint, then scan outwards until the counts are more
+        # than `MIDPOINT_TOKEN_TOLERANCE` past the best distance found. That finds the same index as tokenizing every
+        # prefix as long as no count dips by more than the tolerance.
+        #
+        # A single separator only merges with the tokens next to it, so larger dips come from runs of separators
+        # (empty subchunks): tokenizers count a trailing run as up to one token per separator, then merge it once a
+        # subchunk follows. Every prefix is tokenized if a run could dip past the tolerance, or if a larger dip is
+        # seen anyway.
+        if self.__has_long_separator_run(subchunks):
+            return self.__find_midpoint_index_exhaustively(separator, subchunks, half_token_count)
+
+        prefix_token_counts: dict[int, int] = {}
+
+        def count_prefix_tokens(index: int) -> int:
+            if index not in prefix_token_counts:
+                prefix_token_counts[index] = self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
+
+            return prefix_token_counts[index]
+
+        start_index = max(self.__find_crossing_index(count_prefix_tokens, len(subchunks), half_token_count), 1) - 1
+        midpoint_index = start_index
+        best_midpoint_distance = abs(count_prefix_tokens(start_index) - half_token_count)
+
+        for index in range(start_index + 1, len(subchunks)):
+            token_count = count_prefix_tokens(index)
+
+            if abs(token_count - half_token_count) < best_midpoint_distance:
+                midpoint_index = index
+                best_midpoint_distance = abs(token_count - half_token_count)
+            elif token_count > half_token_count + best_midpoint_distance + self.MIDPOINT_TOKEN_TOLERANCE:
+                break
 
-        for index, _ in enumerate(subchunks):
-            subchunk_tokens_count = self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
+        for index in range(start_index - 1, -1, -1):
+            token_count = count_prefix_tokens(index)
 
-            midpoint_distance = abs(subchunk_tokens_count - half_token_count)
-            if midpoint_distance < best_midpoint_distance:
+            if abs(token_count - half_token_count) <= best_midpoint_distance:
                 midpoint_index = index
-                best_midpoint_distance = midpoint_distance
+                best_midpoint_distance = abs(token_count - half_token_count)
+            elif token_count < half_token_count - best_midpoint_distance - self.MIDPOINT_TOKEN_TOLERANCE:
+                break
+
+        if self.__has_large_dip(prefix_token_counts):
+            return self.__find_midpoint_index_exhaustively(separator, subchunks, half_token_count)
 
         return midpoint_index
+
+    def __find_midpoint_index_exhaustively(
+        self, separator: ChunkSeparator, subchunks: list[str], half_token_count: int
+    ) -> int:
+        return min(
+            range(len(subchunks)),
+            key=lambda index: abs(
+                self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1])) - half_token_count
+            ),
+        )
+
+    def __has_long_separator_run(self, subchunks: list[str]) -> bool:
+        run_length = 0
+
+        for subchunk in subchunks:
+            run_length = 0 if subchunk else run_length + 1
+
+            if run_length > self.MIDPOINT_TOKEN_TOLERANCE // 2:
+                return True
+
+        return False
+
+    def __has_large_dip(self, prefix_token_counts: dict[int, int]) -> bool:
+        max_token_count = 0
+
+        for index in sorted(prefix_token_counts):
+            token_count = prefix_token_counts[index]
+
+            if max_token_count - token_count > self.MIDPOINT_TOKEN_TOLERANCE:
+                return True
+            max_token_count = max(max_token_count, token_count)
+
+        return False
+
+    def __find_crossing_index(
+        self, count_prefix_tokens: Callable[[int], int], subchunk_count: int, half_token_count: int
+    ) -> int:
+        low, high = 0, subchunk_count
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if count_prefix_tokens(middle) >= half_token_count:
+                high = middle
+            else:
+                low = middle + 1
+
+        return low
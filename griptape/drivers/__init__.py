@@ -1,137 +1,269 @@
-from griptape.utils.deprecation import DeprecationModuleWrapper
 import sys
+from typing import TYPE_CHECKING
+
+from griptape.utils.deprecation import DeprecationModuleWrapper
+from griptape.utils.import_utils import lazy_imports
 
-from .prompt import BasePromptDriver
-from .prompt.openai import OpenAiChatPromptDriver
-from .prompt.openai import AzureOpenAiChatPromptDriver
-from .prompt.cohere import CoherePromptDriver
-from .prompt.huggingface_pipeline import HuggingFacePipelinePromptDriver
-from .prompt.huggingface_hub import HuggingFaceHubPromptDriver
-from .prompt.anthropic import AnthropicPromptDriver
-from .prompt.amazon_sagemaker_jumpstart import AmazonSageMakerJumpstartPromptDriver
-from .prompt.amazon_bedrock import AmazonBedrockPromptDriver
-from .prompt.google import GooglePromptDriver
-from .prompt.dummy import DummyPromptDriver
-from .prompt.ollama import OllamaPromptDriver
-from .prompt.grok import GrokPromptDriver
-from .prompt.griptape_cloud import GriptapeCloudPromptDriver
-from .prompt.perplexity import PerplexityPromptDriver
-from .prompt.openrouter import OpenRouterPromptDriver # my customed node
+if TYPE_CHECKING:
+    from .prompt import BasePromptDriver
+    from .prompt.openai import OpenAiChatPromptDriver
+    from .prompt.openai import AzureOpenAiChatPromptDriver
+    from .prompt.cohere import CoherePromptDriver
+    from .prompt.huggingface_pipeline import HuggingFacePipelinePromptDriver
+    from .prompt.huggingface_hub import HuggingFaceHubPromptDriver
+    from .prompt.anthropic import AnthropicPromptDriver
+    from .prompt.amazon_sagemaker_jumpstart import AmazonSageMakerJumpstartPromptDriver
+    from .prompt.amazon_bedrock import AmazonBedrockPromptDriver
+    from .prompt.google import GooglePromptDriver
+    from .prompt.dummy import DummyPromptDriver
+    from .prompt.ollama import OllamaPromptDriver
+    from .prompt.grok import GrokPromptDriver
+    from .prompt.griptape_cloud import GriptapeCloudPromptDriver
+    from .prompt.perplexity import PerplexityPromptDriver
+    from .prompt.openrouter import OpenRouterPromptDriver  # my customed node
 
-from .memory.conversation import BaseConversationMemoryDriver
-from .memory.conversation.local import LocalConversationMemoryDriver
-from .memory.conversation.amazon_dynamodb import AmazonDynamoDbConversationMemoryDriver
-from .memory.conversation.redis import RedisConversationMemoryDriver
-from .memory.conversation.griptape_cloud import GriptapeCloudConversationMemoryDriver
+    from .memory.conversation import BaseConversationMemoryDriver
+    from .memory.conversation.local import LocalConversationMemoryDriver
+    from .memory.conversation.amazon_dynamodb import AmazonDynamoDbConversationMemoryDriver
+    from .memory.conversation.redis import RedisConversationMemoryDriver
+    from .memory.conversation.griptape_cloud import GriptapeCloudConversationMemoryDriver
 
-from .embedding import BaseEmbeddingDriver
-from .embedding.openai import OpenAiEmbeddingDriver
-from .embedding.openai import AzureOpenAiEmbeddingDriver
-from .embedding.amazon_sagemaker_jumpstart import AmazonSageMakerJumpstartEmbeddingDriver
-from .embedding.amazon_bedrock import AmazonBedrockTitanEmbeddingDriver, AmazonBedrockCohereEmbeddingDriver
-from .embedding.voyageai import VoyageAiEmbeddingDriver
-from .embedding.huggingface_hub import HuggingFaceHubEmbeddingDriver
-from .embedding.google import GoogleEmbeddingDriver
-from .embedding.dummy import DummyEmbeddingDriver
-from .embedding.cohere import CohereEmbeddingDriver
-from .embedding.ollama import OllamaEmbeddingDriver
+    from .embedding import BaseEmbeddingDriver
+    from .embedding.openai import OpenAiEmbeddingDriver
+    from .embedding.openai import AzureOpenAiEmbeddingDriver
+    from .embedding.amazon_sagemaker_jumpstart import AmazonSageMakerJumpstartEmbeddingDriver
+    from .embedding.amazon_bedrock import AmazonBedrockTitanEmbeddingDriver, AmazonBedrockCohereEmbeddingDriver
+    from .embedding.voyageai import VoyageAiEmbeddingDriver
+    from .embedding.huggingface_hub import HuggingFaceHubEmbeddingDriver
+    from .embedding.google import GoogleEmbeddingDriver
+    from .embedding.dummy import DummyEmbeddingDriver
+    from .embedding.cohere import CohereEmbeddingDriver
+    from .embedding.ollama import OllamaEmbeddingDriver
 
-from .vector import BaseVectorStoreDriver
-from .vector.local import LocalVectorStoreDriver
-from .vector.pinecone import PineconeVectorStoreDriver
-from .vector.marqo import MarqoVectorStoreDriver
-from .vector.mongodb_atlas import MongoDbAtlasVectorStoreDriver
-from .vector.redis import RedisVectorStoreDriver
-from .vector.opensearch import OpenSearchVectorStoreDriver
-from .vector.amazon_opensearch import AmazonOpenSearchVectorStoreDriver
-from .vector.pgvector import PgVectorVectorStoreDriver
-from .vector.azure_mongodb import AzureMongoDbVectorStoreDriver
-from .vector.dummy import DummyVectorStoreDriver
-from .vector.qdrant import QdrantVectorStoreDriver
-from .vector.astradb import AstraDbVectorStoreDriver
-from .vector.griptape_cloud import GriptapeCloudVectorStoreDriver
-from .vector.pgai import PgAiKnowledgeBaseVectorStoreDriver
+    from .cache import BaseCacheDriver
+    from .cache.local import LocalCacheDriver
 
-from .sql import BaseSqlDriver
-from .sql.sql_driver import SqlDriver
-from .sql.amazon_redshift import AmazonRedshiftSqlDriver
-from .sql.snowflake import SnowflakeSqlDriver
+    from .vector import BaseVectorStoreDriver
+    from .vector.local import LocalVectorStoreDriver
+    from .vector.pinecone import PineconeVectorStoreDriver
+    from .vector.marqo import MarqoVectorStoreDriver
+    from .vector.mongodb_atlas import MongoDbAtlasVectorStoreDriver
+    from .vector.redis import RedisVectorStoreDriver
+    from .vector.opensearch import OpenSearchVectorStoreDriver
+    from .vector.amazon_opensearch import AmazonOpenSearchVectorStoreDriver
+    from .vector.pgvector import PgVectorVectorStoreDriver
+    from .vector.azure_mongodb import AzureMongoDbVectorStoreDriver
+    from .vector.dummy import DummyVectorStoreDriver
+    from .vector.qdrant import QdrantVectorStoreDriver
+    from .vector.astradb import AstraDbVectorStoreDriver
+    from .vector.griptape_cloud import GriptapeCloudVectorStoreDriver
+    from .vector.pgai import PgAiKnowledgeBaseVectorStoreDriver
 
-from .image_generation_model import BaseImageGenerationModelDriver
-from .image_generation_model.bedrock_stable_diffusion import BedrockStableDiffusionImageGenerationModelDriver
-from .image_generation_model.bedrock_titan import BedrockTitanImageGenerationModelDriver
+    from .sql import BaseSqlDriver
+    from .sql.sql_driver import SqlDriver
+    from .sql.amazon_redshift import AmazonRedshiftSqlDriver
+    from .sql.snowflake import SnowflakeSqlDriver
 
-from .image_generation_pipeline import BaseDiffusionImageGenerationPipelineDriver
-from .image_generation_pipeline.stable_diffusion_3 import StableDiffusion3ImageGenerationPipelineDriver
-from .image_generation_pipeline.stable_diffusion_3_img_2_img import StableDiffusion3Img2ImgImageGenerationPipelineDriver
-from .image_generation_pipeline.stable_diffusion_3_controlnet import (
-    StableDiffusion3ControlNetImageGenerationPipelineDriver,
-)
+    from .image_generation_model import BaseImageGenerationModelDriver
+    from .image_generation_model.bedrock_stable_diffusion import BedrockStableDiffusionImageGenerationModelDriver
+    from .image_generation_model.bedrock_titan import BedrockTitanImageGenerationModelDriver
+
+    from .image_generation_pipeline import BaseDiffusionImageGenerationPipelineDriver
+    from .image_generation_pipeline.stable_diffusion_3 import StableDiffusion3ImageGenerationPipelineDriver
+    from .image_generation_pipeline.stable_diffusion_3_img_2_img import (
+        StableDiffusion3Img2ImgImageGenerationPipelineDriver,
+    )
+    from .image_generation_pipeline.stable_diffusion_3_controlnet import (
+        StableDiffusion3ControlNetImageGenerationPipelineDriver,
+    )
+
+    from .image_generation import BaseImageGenerationDriver
+    from .image_generation import BaseMultiModelImageGenerationDriver
+    from .image_generation.openai import OpenAiImageGenerationDriver, AzureOpenAiImageGenerationDriver
+    from .image_generation.leonardo import LeonardoImageGenerationDriver
+    from .image_generation.amazon_bedrock import AmazonBedrockImageGenerationDriver
+    from .image_generation.dummy import DummyImageGenerationDriver
+    from .image_generation.huggingface_pipeline import HuggingFacePipelineImageGenerationDriver
+    from .image_generation.griptape_cloud import GriptapeCloudImageGenerationDriver
+    from .image_generation.openrouter import OpenRouterImageGenerationDriver  # my customed node
+
+    from .web_scraper import BaseWebScraperDriver
+    from .web_scraper.trafilatura import TrafilaturaWebScraperDriver
+    from .web_scraper.markdownify import MarkdownifyWebScraperDriver
+    from .web_scraper.proxy import ProxyWebScraperDriver
+
+    from .web_search import BaseWebSearchDriver
+    from .web_search.google import GoogleWebSearchDriver
+    from .web_search.duck_duck_go import DuckDuckGoWebSearchDriver
+    from .web_search.exa import ExaWebSearchDriver
+    from .web_search.tavily import TavilyWebSearchDriver
+    from .web_search.perplexity import PerplexityWebSearchDriver
 
-from .image_generation import BaseImageGenerationDriver
-from .image_generation import BaseMultiModelImageGenerationDriver
-from .image_generation.openai import OpenAiImageGenerationDriver, AzureOpenAiImageGenerationDriver
-from .image_generation.leonardo import LeonardoImageGenerationDriver
-from .image_generation.amazon_bedrock import AmazonBedrockImageGenerationDriver
-from .image_generation.dummy import DummyImageGenerationDriver
-from .image_generation.huggingface_pipeline import HuggingFacePipelineImageGenerationDriver
-from .image_generation.griptape_cloud import GriptapeCloudImageGenerationDriver
-from .image_generation.openrouter import OpenRouterImageGenerationDriver # my customed node
+    from .event_listener import BaseEventListenerDriver
+    from .event_listener.amazon_sqs import AmazonSqsEventListenerDriver
+    from .event_listener.webhook import WebhookEventListenerDriver
+    from .event_listener.aws_iot_core import AwsIotCoreEventListenerDriver
+    from .event_listener.griptape_cloud import GriptapeCloudEventListenerDriver
+    from .event_listener.pusher import PusherEventListenerDriver
 
-from .web_scraper import BaseWebScraperDriver
-from .web_scraper.trafilatura import TrafilaturaWebScraperDriver
-from .web_scraper.markdownify import MarkdownifyWebScraperDriver
-from .web_scraper.proxy import ProxyWebScraperDriver
+    from .file_manager import BaseFileManagerDriver
+    from .file_manager.local import LocalFileManagerDriver
+    from .file_manager.amazon_s3 import AmazonS3FileManagerDriver
+    from .file_manager.griptape_cloud import GriptapeCloudFileManagerDriver
 
-from .web_search import BaseWebSearchDriver
-from .web_search.google import GoogleWebSearchDriver
-from .web_search.duck_duck_go import DuckDuckGoWebSearchDriver
-from .web_search.exa import ExaWebSearchDriver
-from .web_search.tavily import TavilyWebSearchDriver
-from .web_search.perplexity import PerplexityWebSearchDriver
+    from .rerank import BaseRerankDriver
+    from .rerank.cohere import CohereRerankDriver
+    from .rerank.local import LocalRerankDriver
 
-from .event_listener import BaseEventListenerDriver
-from .event_listener.amazon_sqs import AmazonSqsEventListenerDriver
-from .event_listener.webhook import WebhookEventListenerDriver
-from .event_listener.aws_iot_core import AwsIotCoreEventListenerDriver
-from .event_listener.griptape_cloud import GriptapeCloudEventListenerDriver
-from .event_listener.pusher import PusherEventListenerDriver
+    from .ruleset import BaseRulesetDriver
+    from .ruleset.local import LocalRulesetDriver
+    from .ruleset.griptape_cloud import GriptapeCloudRulesetDriver
 
-from .file_manager import BaseFileManagerDriver
-from .file_manager.local import LocalFileManagerDriver
-from .file_manager.amazon_s3 import AmazonS3FileManagerDriver
-from .file_manager.griptape_cloud import GriptapeCloudFileManagerDriver
+    from .text_to_speech import BaseTextToSpeechDriver
+    from .text_to_speech.dummy import DummyTextToSpeechDriver
+    from .text_to_speech.elevenlabs import ElevenLabsTextToSpeechDriver
+    from .text_to_speech.openai import OpenAiTextToSpeechDriver, AzureOpenAiTextToSpeechDriver
 
-from .rerank import BaseRerankDriver
-from .rerank.cohere import CohereRerankDriver
-from .rerank.local import LocalRerankDriver
+    from .structure_run import BaseStructureRunDriver
+    from .structure_run.griptape_cloud import GriptapeCloudStructureRunDriver
+    from .structure_run.local import LocalStructureRunDriver, ProcessPoolStructureRunDriver
 
-from .ruleset import BaseRulesetDriver
-from .ruleset.local import LocalRulesetDriver
-from .ruleset.griptape_cloud import GriptapeCloudRulesetDriver
+    from .audio_transcription import BaseAudioTranscriptionDriver
+    from .audio_transcription.dummy import DummyAudioTranscriptionDriver
+    from .audio_transcription.openai import OpenAiAudioTranscriptionDriver
 
-from .text_to_speech import BaseTextToSpeechDriver
-from .text_to_speech.dummy import DummyTextToSpeechDriver
-from .text_to_speech.elevenlabs import ElevenLabsTextToSpeechDriver
-from .text_to_speech.openai import OpenAiTextToSpeechDriver, AzureOpenAiTextToSpeechDriver
+    from .observability import BaseObservabilityDriver
+    from .observability.no_op import NoOpObservabilityDriver
+    from .observability.open_telemetry import OpenTelemetryObservabilityDriver
+    from .observability.griptape_cloud import GriptapeCloudObservabilityDriver
+    from .observability.datadog import DatadogObservabilityDriver
 
-from .structure_run import BaseStructureRunDriver
-from .structure_run.griptape_cloud import GriptapeCloudStructureRunDriver
-from .structure_run.local import LocalStructureRunDriver
+    from .assistant import BaseAssistantDriver
+    from .assistant.griptape_cloud import GriptapeCloudAssistantDriver
+    from .assistant.openai import OpenAiAssistantDriver
 
-from .audio_transcription import BaseAudioTranscriptionDriver
-from .audio_transcription.dummy import DummyAudioTranscriptionDriver
-from .audio_transcription.openai import OpenAiAudioTranscriptionDriver
 
-from .observability import BaseObservabilityDriver
-from .observability.no_op import NoOpObservabilityDriver
-from .observability.open_telemetry import OpenTelemetryObservabilityDriver
-from .observability.griptape_cloud import GriptapeCloudObservabilityDriver
-from .observability.datadog import DatadogObservabilityDriver
+_LAZY_IMPORTS = {
+    "BasePromptDriver": ".prompt",
+    "OpenAiChatPromptDriver": ".prompt.openai",
+    "AzureOpenAiChatPromptDriver": ".prompt.openai",
+    "CoherePromptDriver": ".prompt.cohere",
+    "HuggingFacePipelinePromptDriver": ".prompt.huggingface_pipeline",
+    "HuggingFaceHubPromptDriver": ".prompt.huggingface_hub",
+    "AnthropicPromptDriver": ".prompt.anthropic",
+    "AmazonSageMakerJumpstartPromptDriver": ".prompt.amazon_sagemaker_jumpstart",
+    "AmazonBedrockPromptDriver": ".prompt.amazon_bedrock",
+    "GooglePromptDriver": ".prompt.google",
+    "DummyPromptDriver": ".prompt.dummy",
+    "OllamaPromptDriver": ".prompt.ollama",
+    "GrokPromptDriver": ".prompt.grok",
+    "GriptapeCloudPromptDriver": ".prompt.griptape_cloud",
+    "PerplexityPromptDriver": ".prompt.perplexity",
+    "OpenRouterPromptDriver": ".prompt.openrouter",
+    "BaseConversationMemoryDriver": ".memory.conversation",
+    "LocalConversationMemoryDriver": ".memory.conversation.local",
+    "AmazonDynamoDbConversationMemoryDriver": ".memory.conversation.amazon_dynamodb",
+    "RedisConversationMemoryDriver": ".memory.conversation.redis",
+    "GriptapeCloudConversationMemoryDriver": ".memory.conversation.griptape_cloud",
+    "BaseEmbeddingDriver": ".embedding",
+    "OpenAiEmbeddingDriver": ".embedding.openai",
+    "AzureOpenAiEmbeddingDriver": ".embedding.openai",
+    "AmazonSageMakerJumpstartEmbeddingDriver": ".embedding.amazon_sagemaker_jumpstart",
+    "AmazonBedrockTitanEmbeddingDriver": ".embedding.amazon_bedrock",
+    "AmazonBedrockCohereEmbeddingDriver": ".embedding.amazon_bedrock",
+    "VoyageAiEmbeddingDriver": ".embedding.voyageai",
+    "HuggingFaceHubEmbeddingDriver": ".embedding.huggingface_hub",
+    "GoogleEmbeddingDriver": ".embedding.google",
+    "DummyEmbeddingDriver": ".embedding.dummy",
+    "CohereEmbeddingDriver": ".embedding.cohere",
+    "OllamaEmbeddingDriver": ".embedding.ollama",
+    "BaseCacheDriver": ".cache",
+    "LocalCacheDriver": ".cache.local",
+    "BaseVectorStoreDriver": ".vector",
+    "LocalVectorStoreDriver": ".vector.local",
+    "PineconeVectorStoreDriver": ".vector.pinecone",
+    "MarqoVectorStoreDriver": ".vector.marqo",
+    "MongoDbAtlasVectorStoreDriver": ".vector.mongodb_atlas",
+    "RedisVectorStoreDriver": ".vector.redis",
+    "OpenSearchVectorStoreDriver": ".vector.opensearch",
+    "AmazonOpenSearchVectorStoreDriver": ".vector.amazon_opensearch",
+    "PgVectorVectorStoreDriver": ".vector.pgvector",
+    "AzureMongoDbVectorStoreDriver": ".vector.azure_mongodb",
+    "DummyVectorStoreDriver": ".vector.dummy",
+    "QdrantVectorStoreDriver": ".vector.qdrant",
+    "AstraDbVectorStoreDriver": ".vector.astradb",
+    "GriptapeCloudVectorStoreDriver": ".vector.griptape_cloud",
+    "PgAiKnowledgeBaseVectorStoreDriver": ".vector.pgai",
+    "BaseSqlDriver": ".sql",
+    "SqlDriver": ".sql.sql_driver",
+    "AmazonRedshiftSqlDriver": ".sql.amazon_redshift",
+    "SnowflakeSqlDriver": ".sql.snowflake",
+    "BaseImageGenerationModelDriver": ".image_generation_model",
+    "BedrockStableDiffusionImageGenerationModelDriver": ".image_generation_model.bedrock_stable_diffusion",
+    "BedrockTitanImageGenerationModelDriver": ".image_generation_model.bedrock_titan",
+    "BaseDiffusionImageGenerationPipelineDriver": ".image_generation_pipeline",
+    "StableDiffusion3ImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3",
+    "StableDiffusion3Img2ImgImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_img_2_img",
+    "StableDiffusion3ControlNetImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_controlnet",
+    "BaseImageGenerationDriver": ".image_generation",
+    "BaseMultiModelImageGenerationDriver": ".image_generation",
+    "OpenAiImageGenerationDriver": ".image_generation.openai",
+    "AzureOpenAiImageGenerationDriver": ".image_generation.openai",
+    "LeonardoImageGenerationDriver": ".image_generation.leonardo",
+    "AmazonBedrockImageGenerationDriver": ".image_generation.amazon_bedrock",
+    "DummyImageGenerationDriver": ".image_generation.dummy",
+    "HuggingFacePipelineImageGenerationDriver": ".image_generation.huggingface_pipeline",
+    "GriptapeCloudImageGenerationDriver": ".image_generation.griptape_cloud",
+    "OpenRouterImageGenerationDriver": ".image_generation.openrouter",
+    "BaseWebScraperDriver": ".web_scraper",
+    "TrafilaturaWebScraperDriver": ".web_scraper.trafilatura",
+    "MarkdownifyWebScraperDriver": ".web_scraper.markdownify",
+    "ProxyWebScraperDriver": ".web_scraper.proxy",
+    "BaseWebSearchDriver": ".web_search",
+    "GoogleWebSearchDriver": ".web_search.google",
+    "DuckDuckGoWebSearchDriver": ".web_search.duck_duck_go",
+    "ExaWebSearchDriver": ".web_search.exa",
+    "TavilyWebSearchDriver": ".web_search.tavily",
+    "PerplexityWebSearchDriver": ".web_search.perplexity",
+    "BaseEventListenerDriver": ".event_listener",
+    "AmazonSqsEventListenerDriver": ".event_listener.amazon_sqs",
+    "WebhookEventListenerDriver": ".event_listener.webhook",
+    "AwsIotCoreEventListenerDriver": ".event_listener.aws_iot_core",
+    "GriptapeCloudEventListenerDriver": ".event_listener.griptape_cloud",
+    "PusherEventListenerDriver": ".event_listener.pusher",
+    "BaseFileManagerDriver": ".file_manager",
+    "LocalFileManagerDriver": ".file_manager.local",
+    "AmazonS3FileManagerDriver": ".file_manager.amazon_s3",
+    "GriptapeCloudFileManagerDriver": ".file_manager.griptape_cloud",
+    "BaseRerankDriver": ".rerank",
+    "CohereRerankDriver": ".rerank.cohere",
+    "LocalRerankDriver": ".rerank.local",
+    "BaseRulesetDriver": ".ruleset",
+    "LocalRulesetDriver": ".ruleset.local",
+    "GriptapeCloudRulesetDriver": ".ruleset.griptape_cloud",
+    "BaseTextToSpeechDriver": ".text_to_speech",
+    "DummyTextToSpeechDriver": ".text_to_speech.dummy",
+    "ElevenLabsTextToSpeechDriver": ".text_to_speech.elevenlabs",
+    "OpenAiTextToSpeechDriver": ".text_to_speech.openai",
+    "AzureOpenAiTextToSpeechDriver": ".text_to_speech.openai",
+    "BaseStructureRunDriver": ".structure_run",
+    "GriptapeCloudStructureRunDriver": ".structure_run.griptape_cloud",
+    "LocalStructureRunDriver": ".structure_run.local",
+    "ProcessPoolStructureRunDriver": ".structure_run.local",
+    "BaseAudioTranscriptionDriver": ".audio_transcription",
+    "DummyAudioTranscriptionDriver": ".audio_transcription.dummy",
+    "OpenAiAudioTranscriptionDriver": ".audio_transcription.openai",
+    "BaseObservabilityDriver": ".observability",
+    "NoOpObservabilityDriver": ".observability.no_op",
+    "OpenTelemetryObservabilityDriver": ".observability.open_telemetry",
+    "GriptapeCloudObservabilityDriver": ".observability.griptape_cloud",
+    "DatadogObservabilityDriver": ".observability.datadog",
+    "BaseAssistantDriver": ".assistant",
+    "GriptapeCloudAssistantDriver": ".assistant.griptape_cloud",
+    "OpenAiAssistantDriver": ".assistant.openai",
+}
 
-from .assistant import BaseAssistantDriver
-from .assistant.griptape_cloud import GriptapeCloudAssistantDriver
-from .assistant.openai import OpenAiAssistantDriver
+__getattr__, __dir__ = lazy_imports(globals(), _LAZY_IMPORTS)
 
 
 __all__ = [
@@ -156,6 +288,7 @@ __all__ = [
     "AzureOpenAiTextToSpeechDriver",
     "BaseAssistantDriver",
     "BaseAudioTranscriptionDriver",
+    "BaseCacheDriver",
     "BaseConversationMemoryDriver",
     "BaseDiffusionImageGenerationPipelineDriver",
     "BaseEmbeddingDriver",
@@ -207,11 +340,13 @@ __all__ = [
     "HuggingFacePipelineImageGenerationDriver",
     "HuggingFacePipelinePromptDriver",
     "LeonardoImageGenerationDriver",
+    "LocalCacheDriver",
     "LocalConversationMemoryDriver",
     "LocalFileManagerDriver",
     "LocalRerankDriver",
     "LocalRulesetDriver",
     "LocalStructureRunDriver",
+    "ProcessPoolStructureRunDriver",
     "LocalVectorStoreDriver",
     "MarkdownifyWebScraperDriver",
     "MarqoVectorStoreDriver",
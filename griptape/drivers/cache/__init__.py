@@ -0,0 +1,3 @@
+from .base_cache_driver import BaseCacheDriver
+
+__all__ = ["BaseCacheDriver"]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from attrs import Factory, define, field
+
+from griptape.mixins.serializable_mixin import SerializableMixin
+
+
+@define
+class BaseCacheDriver(SerializableMixin, ABC):
+    """Base class for cache drivers.
+
+    Cache drivers store JSON-serializable values under string keys.
+
+    Attributes:
+        ttl: Optional number of seconds after which a cached value expires.
+        hits: The number of `get` calls that found a value.
+        misses: The number of `get` calls that did not find a value.
+    """
+
+    ttl: Optional[float] = field(default=None, kw_only=True, metadata={"serializable": True})
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _stats_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the value cached under `key`, or `None` if there is no unexpired value."""
+        value = self.try_get(key, now=time.time())
+
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Caches `value` under `key`, replacing any existing value."""
+        self.try_set(key, value, expires_at=None if self.ttl is None else time.time() + self.ttl)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    @abstractmethod
+    def try_get(self, key: str, *, now: float) -> Optional[Any]: ...
+
+    @abstractmethod
+    def try_set(self, key: str, value: Any, *, expires_at: Optional[float]) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
@@ -0,0 +1,3 @@
+from griptape.drivers.cache.local_cache_driver import LocalCacheDriver
+
+__all__ = ["LocalCacheDriver"]
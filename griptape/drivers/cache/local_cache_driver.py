@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import copy
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from attrs import Factory, define, field
+
+from griptape.drivers.cache import BaseCacheDriver
+
+
+@define(kw_only=True)
+class LocalCacheDriver(BaseCacheDriver):
+    """A cache driver that keeps values in an in-memory LRU, optionally backed by a SQLite file.
+
+    Values that are evicted from memory are still served from `persist_file` and are promoted back into memory on
+    access. Values are copied on the way in and out of memory, so callers can modify what they get or set without
+    changing the cached value.
+
+    Attributes:
+        max_size: Optional maximum number of values kept in memory. The least recently used values are evicted first.
+        persist_file: Optional path to a SQLite database file that values are written through to.
+        max_persist_size: Optional number of most recent writes kept in `persist_file`. Older values are evicted.
+    """
+
+    max_size: Optional[int] = field(default=10_000, metadata={"serializable": True})
+    persist_file: Optional[str] = field(default=None, metadata={"serializable": True})
+    max_persist_size: Optional[int] = field(default=None, metadata={"serializable": True})
+    _entries: OrderedDict[str, tuple[Any, Optional[float]]] = field(factory=OrderedDict, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _lock: threading.RLock = field(default=Factory(lambda: threading.RLock()), init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.persist_file is not None:
+            self._connection = sqlite3.connect(self.persist_file, check_same_thread=False)
+
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+                )
+
+    def try_get(self, key: str, *, now: float) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                if entry[1] is not None and entry[1] <= now:
+                    self.delete(key)
+
+                    return None
+                self._entries.move_to_end(key)
+
+                return copy.deepcopy(entry[0])
+
+            if self._connection is None:
+                return None
+
+            row = self._connection.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self.delete(key)
+
+                return None
+
+            value = json.loads(row[0])
+            self.__set_in_memory(key, copy.deepcopy(value), row[1])
+
+            return value
+
+    def try_set(self, key: str, value: Any, *, expires_at: Optional[float]) -> None:
+        with self._lock:
+            self.__set_in_memory(key, copy.deepcopy(value), expires_at)
+
+            if self._connection is not None:
+                with self._connection:
+                    # Replacing deletes and re-inserts the row, so rowid order is insertion order.
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), expires_at),
+                    )
+
+                    if self.max_persist_size is not None:
+                        self._connection.execute(
+                            "DELETE FROM cache WHERE rowid <= (SELECT MAX(rowid) FROM cache) - ?",
+                            (self.max_persist_size,),
+                        )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM cache")
+
+    def __set_in_memory(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
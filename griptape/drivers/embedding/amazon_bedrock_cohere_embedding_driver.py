@@ -29,12 +29,15 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         session: Optionally provide custom `boto3.Session`.
         tokenizer: Optionally provide custom `BedrockCohereTokenizer`.
         client: Optionally provide custom `bedrock-runtime` client.
+        max_batch_size: Maximum number of texts per request. Defaults to Cohere's limit of 96.
     """
 
     DEFAULT_MODEL = "cohere.embed-english-v3"
+    DEFAULT_MAX_BATCH_SIZE = 96
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True)
     input_type: str = field(default="search_query", kw_only=True)
+    max_batch_size: Optional[int] = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: AmazonBedrockTokenizer(model=self.model), takes_self=True),
@@ -49,7 +52,10 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         return self.session.client("bedrock-runtime")
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
-        payload = {"input_type": self.input_type, "texts": [chunk]}
+        return self.try_embed_chunks([chunk], **kwargs)[0]
+
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        payload = {"input_type": self.input_type, "texts": chunks}
 
         response = self.client.invoke_model(
             body=json.dumps(payload),
@@ -59,4 +65,4 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         )
         response_body = json.loads(response.get("body").read())
 
-        return response_body.get("embeddings")[0]
+        return response_body.get("embeddings")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import TYPE_CHECKING, Literal, Optional, cast
 
 import numpy as np
 from attrs import define, field
@@ -10,25 +10,39 @@ from attrs import define, field
 from griptape.artifacts import ImageArtifact, TextArtifact
 from griptape.chunkers import BaseChunker, TextChunker
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
+from griptape.mixins.rate_limit_mixin import RateLimitMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils.hash import bytes_to_hash, str_to_hash
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griptape.drivers.cache import BaseCacheDriver
     from griptape.tokenizers import BaseTokenizer
 
 VectorOperation = Literal["query", "upsert"]
 
 
 @define
-class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
+class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, RateLimitMixin, ABC):
     """Base Embedding Driver.
 
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        max_batch_size: The maximum number of chunks `try_embed_chunks` embeds in one request.
+            `None` if the driver embeds one chunk per request.
+        max_batch_tokens: An optional maximum number of tokens `try_embed_chunks` embeds in one request.
+        cache_driver: An optional `BaseCacheDriver` that embeddings are cached in, keyed by the driver type, model,
+            vector operation, and a hash of the embedded value.
+        rate_limiter: An optional `RateLimiter` acquired before each request, budgeting tokens counted by `tokenizer`.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    max_batch_size: Optional[int] = field(default=None, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
+    cache_driver: Optional[BaseCacheDriver] = field(default=None, kw_only=True)
     chunker: Optional[BaseChunker] = field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -55,20 +69,73 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     def embed(
         self, value: str | TextArtifact | ImageArtifact, *, vector_operation: VectorOperation | None = None
     ) -> list[float]:
-        for attempt in self.retrying():
-            with attempt:
-                if isinstance(value, str):
-                    if (
-                        self.tokenizer is not None
-                        and self.tokenizer.count_tokens(value) > self.tokenizer.max_input_tokens
-                    ):
-                        return self._embed_long_string(value, vector_operation=vector_operation)
-                    return self.try_embed_chunk(value, vector_operation=vector_operation)
-                if isinstance(value, TextArtifact):
-                    return self.embed(value.to_text(), vector_operation=vector_operation)
-                if isinstance(value, ImageArtifact):
-                    return self.try_embed_artifact(value, vector_operation=vector_operation)
-        raise RuntimeError("Failed to embed string.")
+        if isinstance(value, TextArtifact):
+            value = value.to_text()
+
+        if self.cache_driver is None:
+            return self._embed(value, vector_operation=vector_operation)
+
+        cache_key = self._get_cache_key(value, vector_operation=vector_operation)
+        embedding = self.cache_driver.get(cache_key)
+
+        if embedding is None:
+            embedding = self._embed(value, vector_operation=vector_operation)
+            self.cache_driver.set(cache_key, embedding)
+
+        return embedding
+
+    def embed_many(
+        self, values: Sequence[str | TextArtifact | ImageArtifact], *, vector_operation: VectorOperation | None = None
+    ) -> list[list[float]]:
+        """Embeds multiple values, batching text that fits in a single request through `try_embed_chunks`.
+
+        Text that exceeds the tokenizer's max input tokens and images are embedded individually with `embed`.
+        Values found in `cache_driver` are not embedded again.
+
+        Args:
+            values: The values to embed.
+            vector_operation: The operation the embeddings are used for.
+
+        Returns:
+            The embeddings, in the same order as `values`.
+        """
+        if self.cache_driver is None:
+            return self._embed_many(values, vector_operation=vector_operation)
+
+        embeddings: list[Optional[list[float]]] = [None] * len(values)
+        misses: dict[str, list[int]] = {}
+
+        for i, value in enumerate(values):
+            cache_key = self._get_cache_key(value, vector_operation=vector_operation)
+
+            if cache_key in misses:
+                misses[cache_key].append(i)
+            elif (embedding := self.cache_driver.get(cache_key)) is not None:
+                embeddings[i] = embedding
+            else:
+                misses[cache_key] = [i]
+
+        if misses:
+            miss_embeddings = self._embed_many(
+                [values[indices[0]] for indices in misses.values()], vector_operation=vector_operation
+            )
+
+            for (cache_key, indices), embedding in zip(misses.items(), miss_embeddings):
+                self.cache_driver.set(cache_key, embedding)
+
+                for i in indices:
+                    embeddings[i] = list(embedding)
+
+        return cast("list[list[float]]", embeddings)
+
+    def try_embed_chunks(
+        self, chunks: list[str], *, vector_operation: VectorOperation | None = None
+    ) -> list[list[float]]:
+        """Embeds multiple chunks, in one request if the driver supports it.
+
+        Drivers that support batching override this method and set `max_batch_size`.
+        """
+        return [self.try_embed_chunk(chunk, vector_operation=vector_operation) for chunk in chunks]
 
     def try_embed_artifact(
         self, artifact: TextArtifact | ImageArtifact, *, vector_operation: VectorOperation | None = None
@@ -83,6 +150,109 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         # TODO: Remove for griptape 2.0, subclasses should implement `try_embed_artifact` instead
         ...
 
+    def _embed(
+        self,
+        value: str | ImageArtifact,
+        *,
+        tokens: Optional[int] = None,
+        vector_operation: VectorOperation | None = None,
+    ) -> list[float]:
+        if tokens is None:
+            # Counted once, since some tokenizers count tokens with a request to the provider.
+            tokens = self.tokenizer.count_tokens(value) if isinstance(value, str) and self.tokenizer is not None else 0
+
+        for attempt in self.retrying():
+            with attempt:
+                if isinstance(value, str):
+                    if self.tokenizer is not None and tokens > self.tokenizer.max_input_tokens:
+                        return self._embed_long_string(value, vector_operation=vector_operation)
+                    with self.rate_limited(lambda: tokens):
+                        return self.try_embed_chunk(value, vector_operation=vector_operation)
+                if isinstance(value, ImageArtifact):
+                    with self.rate_limited():
+                        return self.try_embed_artifact(value, vector_operation=vector_operation)
+        raise RuntimeError("Failed to embed string.")
+
+    def _embed_many(
+        self, values: Sequence[str | TextArtifact | ImageArtifact], *, vector_operation: VectorOperation | None = None
+    ) -> list[list[float]]:
+        embeddings: list[Optional[list[float]]] = [None] * len(values)
+        chunks: list[tuple[int, str]] = []
+
+        for i, value in enumerate(values):
+            if isinstance(value, ImageArtifact):
+                embeddings[i] = self._embed(value, vector_operation=vector_operation)
+            else:
+                chunks.append((i, value.to_text() if isinstance(value, TextArtifact) else value))
+
+        # Counted in one call up front, since some tokenizers count tokens with a request to the provider.
+        chunk_tokens = (
+            self.tokenizer.count_tokens_batch([chunk for _, chunk in chunks])
+            if self.tokenizer is not None
+            else [0] * len(chunks)
+        )
+        batch: list[tuple[int, str, int]] = []
+        batch_tokens = 0
+
+        for (i, chunk), tokens in zip(chunks, chunk_tokens):
+            if self.tokenizer is not None and tokens > self.tokenizer.max_input_tokens:
+                embeddings[i] = self._embed_long_string(chunk, vector_operation=vector_operation)
+                continue
+
+            if batch and (
+                (self.max_batch_size is not None and len(batch) >= self.max_batch_size)
+                or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                self._embed_batch(batch, embeddings, tokens=batch_tokens, vector_operation=vector_operation)
+                batch, batch_tokens = [], 0
+
+            batch.append((i, chunk, tokens))
+            batch_tokens += tokens
+
+        if batch:
+            self._embed_batch(batch, embeddings, tokens=batch_tokens, vector_operation=vector_operation)
+
+        return cast("list[list[float]]", embeddings)
+
+    def _get_cache_key(
+        self, value: str | TextArtifact | ImageArtifact, *, vector_operation: VectorOperation | None = None
+    ) -> str:
+        if isinstance(value, ImageArtifact):
+            value_hash = bytes_to_hash(value.value)
+        else:
+            value_hash = str_to_hash(value.to_text() if isinstance(value, TextArtifact) else value)
+
+        return f"{type(self).__name__}:{self.model}:{vector_operation}:{value_hash}"
+
+    def _embed_batch(
+        self,
+        batch: list[tuple[int, str, int]],
+        embeddings: list[Optional[list[float]]],
+        *,
+        tokens: int = 0,
+        vector_operation: VectorOperation | None = None,
+    ) -> None:
+        if self.max_batch_size is None:
+            # The driver sends one request per chunk, so each one is retried and rate limited on its own.
+            for i, chunk, chunk_tokens in batch:
+                embeddings[i] = self._embed(chunk, tokens=chunk_tokens, vector_operation=vector_operation)
+
+            return
+
+        for attempt in self.retrying():
+            with attempt, self.rate_limited(lambda: tokens):
+                batch_embeddings = self.try_embed_chunks(
+                    [chunk for _, chunk, _ in batch], vector_operation=vector_operation
+                )
+
+                if len(batch_embeddings) != len(batch):
+                    raise ValueError(
+                        f"{self.__class__.__name__} returned {len(batch_embeddings)} embeddings for {len(batch)} chunks."
+                    )
+
+                for (i, _, _), embedding in zip(batch, batch_embeddings):
+                    embeddings[i] = embedding
+
     def _embed_long_string(self, string: str, *, vector_operation: VectorOperation | None = None) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
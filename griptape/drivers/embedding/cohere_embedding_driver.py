@@ -23,12 +23,15 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
         client: Custom `cohere.Client`.
         tokenizer: Custom `CohereTokenizer`.
         input_type: Cohere embedding input type.
+        max_batch_size: Maximum number of texts per request. Defaults to Cohere's limit of 96.
     """
 
     DEFAULT_MODEL = "models/embedding-001"
+    DEFAULT_MAX_BATCH_SIZE = 96
 
     api_key: str = field(kw_only=True, metadata={"serializable": False})
     input_type: str = field(kw_only=True, metadata={"serializable": True})
+    max_batch_size: Optional[int] = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
     _client: Optional[Client] = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
     tokenizer: CohereTokenizer = field(
         default=Factory(lambda self: CohereTokenizer(model=self.model, client=self.client), takes_self=True),
@@ -40,8 +43,11 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
         return import_optional_dependency("cohere").Client(self.api_key)
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
-        result = self.client.embed(texts=[chunk], model=self.model, input_type=self.input_type)
+        return self.try_embed_chunks([chunk], **kwargs)[0]
+
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        result = self.client.embed(texts=chunks, model=self.model, input_type=self.input_type)
 
         if isinstance(result.embeddings, list):
-            return result.embeddings[0]
+            return result.embeddings
         raise ValueError("Non-float embeddings are not supported.")
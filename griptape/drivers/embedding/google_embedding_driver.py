@@ -17,14 +17,17 @@ class GoogleEmbeddingDriver(BaseEmbeddingDriver):
         model: Google model name.
         task_type: Embedding model task type (https://ai.google.dev/tutorials/python_quickstart#use_embeddings). Defaults to `retrieval_document`.
         title: Optional title for the content. Only works with `retrieval_document` task type.
+        max_batch_size: Maximum number of texts per request. Defaults to Google's limit of 100.
     """
 
     DEFAULT_MODEL = "models/embedding-001"
+    DEFAULT_MAX_BATCH_SIZE = 100
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     api_key: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
     task_type: str = field(default="retrieval_document", kw_only=True, metadata={"serializable": True})
     title: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    max_batch_size: Optional[int] = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
         genai = import_optional_dependency("google.generativeai")
@@ -34,5 +37,13 @@ class GoogleEmbeddingDriver(BaseEmbeddingDriver):
 
         return result["embedding"]
 
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        genai = import_optional_dependency("google.generativeai")
+        genai.configure(api_key=self.api_key)
+
+        result = genai.embed_content(model=self.model, content=chunks, task_type=self.task_type, title=self.title)
+
+        return result["embedding"]
+
     def _params(self, chunk: str) -> dict:
         return {"input": chunk, "model": self.model}
@@ -25,9 +25,11 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         tokenizer: Optionally provide custom `VoyageAiTokenizer`.
         client: Optionally provide custom VoyageAI `Client`.
         input_type: VoyageAI input type. Defaults to `document`.
+        max_batch_size: Maximum number of texts per request. Defaults to 128.
     """
 
     DEFAULT_MODEL = "voyage-large-2"
+    DEFAULT_MAX_BATCH_SIZE = 128
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     api_key: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
@@ -36,6 +38,7 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
     input_type: str = field(default="document", kw_only=True, metadata={"serializable": True})
+    max_batch_size: Optional[int] = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
     _client: Optional[Client] = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -50,4 +53,7 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         return self.client.multimodal_embed([[pil_image.open(BytesIO(artifact.value))]], model=self.model).embeddings[0]
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
-        return self.client.embed([chunk], model=self.model, input_type=self.input_type).embeddings[0]
+        return self.try_embed_chunks([chunk], **kwargs)[0]
+
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        return self.client.embed(chunks, model=self.model, input_type=self.input_type).embeddings
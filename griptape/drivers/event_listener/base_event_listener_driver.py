@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, Literal, Optional
 
-from attrs import Factory, define, field
+from attrs import define, field
 
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
@@ -15,35 +20,114 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Drivers with a running publisher, so that pending events are flushed when the interpreter exits.
+_active_drivers: weakref.WeakValueDictionary[int, BaseEventListenerDriver] = weakref.WeakValueDictionary()
+
+
+@atexit.register
+def _shutdown_active_drivers() -> None:
+    for driver in list(_active_drivers.values()):
+        driver.shutdown()
+
 
 @define
 class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC):
+    """Base class for Event Listener Drivers.
+
+    Events are handed to a background publisher thread through a bounded queue, so `publish_event` does not wait on
+    the network. The publisher is started on the first event and exits after `WORKER_IDLE_TIMEOUT` seconds without
+    events.
+
+    Attributes:
+        batched: Whether to publish events in batches.
+        batch_size: Maximum number of events in a batch.
+        flush_interval: Maximum number of seconds an event waits for its batch to fill up before being published.
+        max_queue_size: Maximum number of events waiting to be published.
+        backpressure_policy: What to do when the queue is full.
+            "block" waits for room, "drop_oldest" discards the oldest queued event and "drop_newest" discards the
+            event being published.
+        dropped_events: Number of events discarded by the backpressure policy.
+    """
+
+    WORKER_IDLE_TIMEOUT = 5.0
+
     batched: bool = field(default=True, kw_only=True)
     batch_size: int = field(default=10, kw_only=True)
+    flush_interval: float = field(default=1.0, kw_only=True)
+    max_queue_size: int = field(default=1000, kw_only=True)
+    backpressure_policy: Literal["block", "drop_oldest", "drop_newest"] = field(default="block", kw_only=True)
+    dropped_events: int = field(default=0, init=False)
 
-    _batch: list[dict] = field(default=Factory(list), kw_only=True)
+    _batch: list[dict] = field(factory=list, init=False)
+    _queue: deque[dict] = field(factory=deque, init=False)
+    _condition: threading.Condition = field(factory=threading.Condition, init=False)
+    _worker: Optional[threading.Thread] = field(default=None, init=False)
+    _flush_requests: int = field(default=0, init=False)
 
     @property
     def batch(self) -> list[dict]:
-        return self._batch
+        """Events that have been published but not yet sent."""
+        with self._condition:
+            return [*self._batch, *self._queue]
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events that have been published but not yet sent."""
+        with self._condition:
+            return len(self._batch) + len(self._queue)
 
     def publish_event(self, event: BaseEvent | dict) -> None:
         event_payload = event if isinstance(event, dict) else event.to_dict()
 
-        with self.create_futures_executor() as futures_executor:
-            if self.batched:
-                self._batch.append(event_payload)
-                if len(self.batch) >= self.batch_size:
-                    futures_executor.submit(with_contextvars(self._safe_publish_event_payload_batch), self.batch)
-                    self._batch = []
-            else:
-                futures_executor.submit(with_contextvars(self._safe_publish_event_payload), event_payload)
+        with self._condition:
+            while len(self._queue) >= self.max_queue_size:
+                if self.backpressure_policy == "drop_newest":
+                    self.__drop_event()
+
+                    return
+                if self.backpressure_policy == "drop_oldest":
+                    self._queue.popleft()
+                    self.__drop_event()
+                elif self._worker is threading.current_thread():
+                    # Waiting for the publisher from the publisher itself would never return.
+                    self.__drop_event()
+
+                    return
+                else:
+                    self.__start_worker()
+                    self._condition.wait()
+
+            self._queue.append(event_payload)
+            self.__start_worker()
+            self._condition.notify_all()
 
     def flush_events(self) -> None:
-        if self.batch:
-            with self.create_futures_executor() as futures_executor:
-                futures_executor.submit(with_contextvars(self._safe_publish_event_payload_batch), self.batch)
-            self._batch = []
+        """Blocks until every event published so far has been sent."""
+        with self._condition:
+            if self._worker is threading.current_thread():
+                return
+
+            self._flush_requests += 1
+            self._condition.notify_all()
+
+            try:
+                while self._batch or self._queue:
+                    self.__start_worker()
+                    self._condition.wait()
+            finally:
+                self._flush_requests -= 1
+
+    def shutdown(self) -> None:
+        """Flushes pending events and stops the publisher thread."""
+        self.flush_events()
+
+        with self._condition:
+            worker = self._worker
+            self._worker = None
+            self._condition.notify_all()
+
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
 
     @abstractmethod
     def try_publish_event_payload(self, event_payload: dict) -> None: ...
@@ -66,3 +150,71 @@ class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC
                     self.try_publish_event_payload_batch(event_payload_batch)
         except Exception:
             logger.warning("Failed to publish event batch after %s attempts", self.max_attempts, exc_info=True)
+
+    def __drop_event(self) -> None:
+        self.dropped_events += 1
+
+        logger.warning("Event listener queue is full, dropping event")
+
+    def __start_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=with_contextvars(self.__run_worker), daemon=True)
+            self._worker.start()
+            _active_drivers[id(self)] = self
+
+    def __run_worker(self) -> None:
+        while True:
+            with self._condition:
+                if not self.__wait_for_events():
+                    if self._worker is threading.current_thread():
+                        self._worker = None
+                    if self._worker is None:
+                        _active_drivers.pop(id(self), None)
+
+                    return
+
+                count = min(self.batch_size, len(self._queue)) if self.batched else 1
+                self._batch = [self._queue.popleft() for _ in range(count)]
+                # Producers blocked on a full queue can continue.
+                self._condition.notify_all()
+
+            try:
+                if self.batched:
+                    self._safe_publish_event_payload_batch(self._batch)
+                else:
+                    self._safe_publish_event_payload(self._batch[0])
+            finally:
+                with self._condition:
+                    self._batch = []
+                    self._condition.notify_all()
+
+    def __wait_for_events(self) -> bool:
+        """Waits until a batch is ready to be published, returning False if the publisher should exit."""
+        idle_deadline = time.monotonic() + self.WORKER_IDLE_TIMEOUT
+
+        # A publisher that has been replaced or shut down must stop so that events stay in order.
+        while self._worker is threading.current_thread():
+            if self._queue:
+                break
+
+            remaining = idle_deadline - time.monotonic()
+
+            if remaining <= 0:
+                return False
+
+            self._condition.wait(remaining)
+        else:
+            return False
+
+        if self.batched:
+            batch_deadline = time.monotonic() + self.flush_interval
+
+            while len(self._queue) < self.batch_size and not self._flush_requests:
+                remaining = batch_deadline - time.monotonic()
+
+                if remaining <= 0 or self._worker is not threading.current_thread():
+                    break
+
+                self._condition.wait(remaining)
+
+        return True
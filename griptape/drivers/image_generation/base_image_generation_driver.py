@@ -7,6 +7,7 @@ from attrs import define, field
 
 from griptape.events import EventBus, FinishImageGenerationEvent, StartImageGenerationEvent
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
+from griptape.mixins.rate_limit_mixin import RateLimitMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
 
 if TYPE_CHECKING:
@@ -14,7 +15,7 @@ if TYPE_CHECKING:
 
 
 @define
-class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
+class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, RateLimitMixin, ABC):
     model: str = field(kw_only=True, metadata={"serializable": True})
 
     def before_run(self, prompts: list[str], negative_prompts: Optional[list[str]] = None) -> None:
@@ -27,7 +28,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_text_to_image(prompts, negative_prompts)
+                with self.rate_limited():
+                    result = self.try_text_to_image(prompts, negative_prompts)
                 self.after_run()
 
                 return result
@@ -43,7 +45,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_image_variation(prompts, image, negative_prompts)
+                with self.rate_limited():
+                    result = self.try_image_variation(prompts, image, negative_prompts)
                 self.after_run()
 
                 return result
@@ -60,7 +63,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_image_inpainting(prompts, image, mask, negative_prompts)
+                with self.rate_limited():
+                    result = self.try_image_inpainting(prompts, image, mask, negative_prompts)
                 self.after_run()
 
                 return result
@@ -77,7 +81,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_image_outpainting(prompts, image, mask, negative_prompts)
+                with self.rate_limited():
+                    result = self.try_image_outpainting(prompts, image, mask, negative_prompts)
                 self.after_run()
 
                 return result
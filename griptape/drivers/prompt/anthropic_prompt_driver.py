@@ -37,10 +37,11 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from anthropic import Client
-    from anthropic.types import ContentBlock, ContentBlockDeltaEvent, ContentBlockStartEvent
+    from anthropic import AsyncAnthropic, Client
+    from anthropic.types import ContentBlock, ContentBlockDeltaEvent, ContentBlockStartEvent, RawMessageStreamEvent
+    from anthropic.types import Message as AnthropicMessage
 
     from griptape.drivers.prompt.base_prompt_driver import StructuredOutputStrategy
     from griptape.tools.base_tool import BaseTool
@@ -57,6 +58,7 @@ class AnthropicPromptDriver(BasePromptDriver):
         api_key: Anthropic API key.
         model: Anthropic model name.
         client: Custom `Anthropic` client.
+        async_client: Custom `AsyncAnthropic` client, used by `arun` and `astream`.
     """
 
     api_key: Optional[str] = field(kw_only=True, default=None, metadata={"serializable": False})
@@ -74,11 +76,18 @@ class AnthropicPromptDriver(BasePromptDriver):
     )
     max_tokens: int = field(default=1000, kw_only=True, metadata={"serializable": True})
     _client: Optional[Client] = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: Optional[AsyncAnthropic] = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> Client:
         return import_optional_dependency("anthropic").Anthropic(api_key=self.api_key)
 
+    @lazy_property()
+    def async_client(self) -> AsyncAnthropic:
+        return import_optional_dependency("anthropic").AsyncAnthropic(api_key=self.api_key)
+
     @structured_output_strategy.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
     def validate_structured_output_strategy(self, _: Attribute, value: str) -> str:
         if value == "native":
@@ -94,11 +103,7 @@ class AnthropicPromptDriver(BasePromptDriver):
 
         logger.debug(response.model_dump())
 
-        return Message(
-            content=[self.__to_prompt_stack_message_content(content) for content in response.content],
-            role=Message.ASSISTANT_ROLE,
-            usage=Message.Usage(input_tokens=response.usage.input_tokens, output_tokens=response.usage.output_tokens),
-        )
+        return self.__to_message(response)
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
@@ -108,12 +113,29 @@ class AnthropicPromptDriver(BasePromptDriver):
 
         for event in events:
             logger.debug(event)
-            if event.type == "content_block_delta" or event.type == "content_block_start":
-                yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
-            elif event.type == "message_start":
-                yield DeltaMessage(usage=DeltaMessage.Usage(input_tokens=event.message.usage.input_tokens))
-            elif event.type == "message_delta":
-                yield DeltaMessage(usage=DeltaMessage.Usage(output_tokens=event.usage.output_tokens))
+            delta_message = self.__to_delta_message(event)
+            if delta_message is not None:
+                yield delta_message
+
+    async def try_arun(self, prompt_stack: PromptStack) -> Message:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        response = await self.async_client.messages.create(**params)
+
+        logger.debug(response.model_dump())
+
+        return self.__to_message(response)
+
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        params = {**self._base_params(prompt_stack), "stream": True}
+        logger.debug(params)
+        events = await self.async_client.messages.create(**params)
+
+        async for event in events:
+            logger.debug(event)
+            delta_message = self.__to_delta_message(event)
+            if delta_message is not None:
+                yield delta_message
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         messages = self.__to_anthropic_messages([i for i in prompt_stack.messages if not i.is_system()])
@@ -236,6 +258,22 @@ class AnthropicPromptDriver(BasePromptDriver):
             )
         raise ValueError(f"Unsupported message content type: {content.type}")
 
+    def __to_message(self, response: AnthropicMessage) -> Message:
+        return Message(
+            content=[self.__to_prompt_stack_message_content(content) for content in response.content],
+            role=Message.ASSISTANT_ROLE,
+            usage=Message.Usage(input_tokens=response.usage.input_tokens, output_tokens=response.usage.output_tokens),
+        )
+
+    def __to_delta_message(self, event: RawMessageStreamEvent) -> Optional[DeltaMessage]:
+        if event.type == "content_block_delta" or event.type == "content_block_start":
+            return DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
+        if event.type == "message_start":
+            return DeltaMessage(usage=DeltaMessage.Usage(input_tokens=event.message.usage.input_tokens))
+        if event.type == "message_delta":
+            return DeltaMessage(usage=DeltaMessage.Usage(output_tokens=event.usage.output_tokens))
+        return None
+
     def __to_prompt_stack_delta_message_content(
         self,
         event: ContentBlockDeltaEvent | ContentBlockStartEvent,
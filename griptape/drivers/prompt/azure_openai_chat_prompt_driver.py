@@ -23,6 +23,7 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
         client: An `openai.AzureOpenAI` client.
+        async_client: An `openai.AsyncAzureOpenAI` client, used by `arun` and `astream`.
     """
 
     azure_deployment: str = field(
@@ -41,6 +42,9 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
     _client: Optional[openai.AzureOpenAI] = field(
         default=None, kw_only=True, alias="client", metadata={"serializable": False}
     )
+    _async_client: Optional[openai.AsyncAzureOpenAI] = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> openai.AzureOpenAI:
@@ -54,6 +58,18 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
             azure_ad_token_provider=self.azure_ad_token_provider,
         )
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncAzureOpenAI:
+        return openai.AsyncAzureOpenAI(
+            organization=self.organization,
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.azure_endpoint,
+            azure_deployment=self.azure_deployment,
+            azure_ad_token=self.azure_ad_token,
+            azure_ad_token_provider=self.azure_ad_token_provider,
+        )
+
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = super()._base_params(prompt_stack)
         if self.api_version < "2024-02-01" and "seed" in params:
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Literal, Optional
 
@@ -28,19 +31,22 @@ from griptape.events import (
     TextChunkEvent,
 )
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
+from griptape.mixins.rate_limit_mixin import RateLimitMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.rules.json_schema_rule import JsonSchemaRule
+from griptape.utils.hash import str_to_hash
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
+    from griptape.drivers.cache import BaseCacheDriver
     from griptape.tokenizers import BaseTokenizer
 
 StructuredOutputStrategy = Literal["native", "tool", "rule"]
 
 
 @define(kw_only=True)
-class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
+class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, RateLimitMixin, ABC):
     """Base class for the Prompt Drivers.
 
     Attributes:
@@ -53,6 +59,11 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         stream: Whether to stream the completion or not. `CompletionChunkEvent`s will be published to the `Structure` if one is provided.
         use_native_tools: Whether to use LLM's native function calling capabilities. Must be supported by the model.
         extra_params: Extra parameters to pass to the model.
+        cache_driver: An optional `BaseCacheDriver` that responses are cached in, keyed by a hash of the driver
+            parameters and the Prompt Stack. Cached responses are replayed as deltas when streaming.
+        cache_nondeterministic: Whether to cache responses when `temperature` is above 0.
+        rate_limiter: An optional `RateLimiter` acquired before each request. Tokens are estimated from the Prompt
+            Stack with `tokenizer`, plus `max_tokens`.
     """
 
     temperature: float = field(default=0.1, metadata={"serializable": True})
@@ -66,6 +77,8 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         default="rule", kw_only=True, metadata={"serializable": True}
     )
     extra_params: dict = field(factory=dict, kw_only=True, metadata={"serializable": True})
+    cache_driver: Optional[BaseCacheDriver] = field(default=None, kw_only=True)
+    cache_nondeterministic: bool = field(default=False, kw_only=True)
 
     def before_run(self, prompt_stack: PromptStack) -> None:
         self._init_structured_output(prompt_stack)
@@ -92,13 +105,92 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
             with attempt:
                 self.before_run(prompt_stack)
 
-                result = self.__process_stream(prompt_stack) if self.stream else self.__process_run(prompt_stack)
+                cache_key = self._get_cache_key(prompt_stack)
+                result = self.__get_cached_message(cache_key)
+
+                if result is None:
+                    with self.rate_limited(lambda: self.__estimate_tokens(prompt_stack)):
+                        result = (
+                            self.__process_stream(self.try_stream(prompt_stack))
+                            if self.stream
+                            else self.__process_run(prompt_stack)
+                        )
+                    self.__cache_message(cache_key, result)
+                elif self.stream:
+                    result = self.__process_stream(self._replay_message(result))
+
+                self.after_run(result)
+
+                return result
+        raise Exception("prompt driver failed after all retry attempts")
+
+    async def arun(self, prompt_input: PromptStack | BaseArtifact) -> Message:
+        """Asynchronous version of `run`."""
+        if isinstance(prompt_input, BaseArtifact):
+            prompt_stack = PromptStack.from_artifact(prompt_input)
+        else:
+            prompt_stack = prompt_input
+
+        async for attempt in self.aretrying():
+            with attempt:
+                self.before_run(prompt_stack)
+
+                cache_key = self._get_cache_key(prompt_stack)
+                result = self.__get_cached_message(cache_key)
+
+                if result is None:
+                    async with self.arate_limited(lambda: self.__estimate_tokens(prompt_stack)):
+                        result = (
+                            await self.__aprocess_stream(prompt_stack)
+                            if self.stream
+                            else await self.try_arun(prompt_stack)
+                        )
+                    self.__cache_message(cache_key, result)
+                elif self.stream:
+                    result = self.__process_stream(self._replay_message(result))
 
                 self.after_run(result)
 
                 return result
         raise Exception("prompt driver failed after all retry attempts")
 
+    async def astream(self, prompt_input: PromptStack | BaseArtifact) -> AsyncIterator[DeltaMessage]:
+        """Streams the response to `prompt_input`, yielding each `DeltaMessage` as it arrives.
+
+        Chunk events are published as with `run`. The request is not retried, since part of the response may already
+        have been consumed when it fails.
+        """
+        if isinstance(prompt_input, BaseArtifact):
+            prompt_stack = PromptStack.from_artifact(prompt_input)
+        else:
+            prompt_stack = prompt_input
+
+        self.before_run(prompt_stack)
+
+        cache_key = self._get_cache_key(prompt_stack)
+        cached_message = self.__get_cached_message(cache_key)
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        usage = DeltaMessage.Usage()
+
+        if cached_message is None:
+            async with self.arate_limited(lambda: self.__estimate_tokens(prompt_stack)):
+                async for message_delta in self.try_astream(prompt_stack):
+                    usage += self.__add_message_delta(message_delta, delta_contents)
+
+                    yield message_delta
+        else:
+            for message_delta in self._replay_message(cached_message):
+                usage += self.__add_message_delta(message_delta, delta_contents)
+
+                yield message_delta
+
+        result = self.__build_message(list(delta_contents.values()), usage)
+
+        if cached_message is None:
+            self.__cache_message(cache_key, result)
+
+        self.after_run(result)
+
     def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
         """Converts a Prompt Stack to a string for token counting or model prompt_input.
 
@@ -131,6 +223,76 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]: ...
 
+    async def try_arun(self, prompt_stack: PromptStack) -> Message:
+        """Asynchronous version of `try_run`.
+
+        Runs `try_run` in a worker thread. Drivers with an asynchronous client should override this.
+        """
+        return await asyncio.to_thread(self.try_run, prompt_stack)
+
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        """Asynchronous version of `try_stream`.
+
+        Consumes `try_stream` in a worker thread. Drivers with an asynchronous client should override this.
+        """
+        message_deltas = self.try_stream(prompt_stack)
+        sentinel = DeltaMessage()
+
+        while (message_delta := await asyncio.to_thread(next, message_deltas, sentinel)) is not sentinel:
+            yield message_delta
+
+    def _get_cache_key(self, prompt_stack: PromptStack) -> Optional[str]:
+        """Returns the key the response to `prompt_stack` is cached under, or `None` if it should not be cached.
+
+        The key is a hash of the driver's serializable parameters, except `stream`, and of everything in the Prompt Stack
+        that is sent to the model. Artifact ids and names are left out, since they are generated for every run.
+        """
+        if self.cache_driver is None or (self.temperature > 0 and not self.cache_nondeterministic):
+            return None
+
+        driver_params = self.to_dict()
+        driver_params.pop("stream", None)
+        request = {
+            "driver": driver_params,
+            "messages": [self.__to_canonical_dict(message.to_dict()) for message in prompt_stack.messages],
+            "tools": [tool.schema() for tool in prompt_stack.tools],
+            "output_schema": None if prompt_stack.output_schema is None else prompt_stack.to_output_json_schema(),
+        }
+
+        return f"{type(self).__name__}:{self.model}:{str_to_hash(json.dumps(request, sort_keys=True, default=str))}"
+
+    def _replay_message(self, message: Message) -> Iterator[DeltaMessage]:
+        """Converts a complete `Message` back into the `DeltaMessage`s that `try_stream` would have yielded."""
+        for index, content in enumerate(message.content):
+            if isinstance(content, TextMessageContent):
+                yield DeltaMessage(content=TextDeltaMessageContent(content.artifact.to_text(), index=index))
+            elif isinstance(content, ActionCallMessageContent):
+                action = content.artifact.value
+                yield DeltaMessage(
+                    content=ActionCallDeltaMessageContent(
+                        tag=action.tag,
+                        name=action.name,
+                        path=action.path,
+                        partial_input=json.dumps(action.input),
+                        index=index,
+                    )
+                )
+            elif isinstance(content, AudioMessageContent):
+                artifact = content.artifact
+                yield DeltaMessage(
+                    content=AudioDeltaMessageContent(
+                        id=artifact.meta.get("audio_id"),
+                        data=base64.b64encode(artifact.value).decode(),
+                        transcript=artifact.meta.get("transcript"),
+                        expires_at=artifact.meta.get("expires_at"),
+                        index=index,
+                    )
+                )
+
+        yield DeltaMessage(
+            usage=DeltaMessage.Usage(input_tokens=message.usage.input_tokens, output_tokens=message.usage.output_tokens)
+        )
+
     def _init_structured_output(self, prompt_stack: PromptStack) -> None:
         from griptape.tools import StructuredOutputTool
 
@@ -162,39 +324,81 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     def __process_run(self, prompt_stack: PromptStack) -> Message:
         return self.try_run(prompt_stack)
 
-    def __process_stream(self, prompt_stack: PromptStack) -> Message:
+    def __process_stream(self, message_deltas: Iterator[DeltaMessage]) -> Message:
         delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
         usage = DeltaMessage.Usage()
 
         # Aggregate all content deltas from the stream
-        message_deltas = self.try_stream(prompt_stack)
         for message_delta in message_deltas:
-            usage += message_delta.usage
-            content = message_delta.content
-
-            if content is not None:
-                if content.index in delta_contents:
-                    delta_contents[content.index].append(content)
-                else:
-                    delta_contents[content.index] = [content]
-                if isinstance(content, TextDeltaMessageContent):
-                    EventBus.publish_event(TextChunkEvent(token=content.text, index=content.index))
-                elif isinstance(content, AudioDeltaMessageContent) and content.data is not None:
-                    EventBus.publish_event(AudioChunkEvent(data=content.data))
-                elif isinstance(content, ActionCallDeltaMessageContent):
-                    EventBus.publish_event(
-                        ActionChunkEvent(
-                            partial_input=content.partial_input,
-                            tag=content.tag,
-                            name=content.name,
-                            path=content.path,
-                            index=content.index,
-                        ),
-                    )
+            usage += self.__add_message_delta(message_delta, delta_contents)
 
         # Build a complete content from the content deltas
         return self.__build_message(list(delta_contents.values()), usage)
 
+    async def __aprocess_stream(self, prompt_stack: PromptStack) -> Message:
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        usage = DeltaMessage.Usage()
+
+        async for message_delta in self.try_astream(prompt_stack):
+            usage += self.__add_message_delta(message_delta, delta_contents)
+
+        return self.__build_message(list(delta_contents.values()), usage)
+
+    def __estimate_tokens(self, prompt_stack: PromptStack) -> int:
+        return self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack)) + (self.max_tokens or 0)
+
+    def __get_cached_message(self, cache_key: Optional[str]) -> Optional[Message]:
+        if cache_key is None or self.cache_driver is None:
+            return None
+
+        cached_message = self.cache_driver.get(cache_key)
+
+        return None if cached_message is None else Message.from_dict(cached_message)
+
+    def __cache_message(self, cache_key: Optional[str], message: Message) -> None:
+        if cache_key is not None and self.cache_driver is not None:
+            self.cache_driver.set(cache_key, message.to_dict())
+
+    def __to_canonical_dict(self, value: dict | list) -> dict | list:
+        if isinstance(value, list):
+            return [self.__to_canonical_dict(item) if isinstance(item, (dict, list)) else item for item in value]
+
+        is_artifact = str(value.get("type", "")).endswith("Artifact")
+
+        return {
+            key: self.__to_canonical_dict(item) if isinstance(item, (dict, list)) else item
+            for key, item in value.items()
+            if not (is_artifact and key in ("id", "name"))
+        }
+
+    def __add_message_delta(
+        self, message_delta: DeltaMessage, delta_contents: dict[int, list[BaseDeltaMessageContent]]
+    ) -> DeltaMessage.Usage:
+        """Adds the content of `message_delta` to `delta_contents`, publishes its chunk event and returns its usage."""
+        content = message_delta.content
+
+        if content is not None:
+            if content.index in delta_contents:
+                delta_contents[content.index].append(content)
+            else:
+                delta_contents[content.index] = [content]
+            if isinstance(content, TextDeltaMessageContent):
+                EventBus.publish_event(TextChunkEvent(token=content.text, index=content.index))
+            elif isinstance(content, AudioDeltaMessageContent) and content.data is not None:
+                EventBus.publish_event(AudioChunkEvent(data=content.data))
+            elif isinstance(content, ActionCallDeltaMessageContent):
+                EventBus.publish_event(
+                    ActionChunkEvent(
+                        partial_input=content.partial_input,
+                        tag=content.tag,
+                        name=content.name,
+                        path=content.path,
+                        index=content.index,
+                    ),
+                )
+
+        return message_delta.usage
+
     def __build_message(
         self, delta_contents: list[list[BaseDeltaMessageContent]], usage: DeltaMessage.Usage
     ) -> Message:
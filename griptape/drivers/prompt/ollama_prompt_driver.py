@@ -32,9 +32,9 @@ from griptape.utils.decorators import lazy_property
 logger = logging.getLogger(Defaults.logging_config.logger_name)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from ollama import ChatResponse, Client
+    from ollama import AsyncClient, ChatResponse, Client
 
     from griptape.tokenizers.base_tokenizer import BaseTokenizer
     from griptape.tools import BaseTool
@@ -46,6 +46,8 @@ class OllamaPromptDriver(BasePromptDriver):
 
     Attributes:
         model: Model name.
+        client: Custom `ollama.Client`.
+        async_client: Custom `ollama.AsyncClient`, used by `arun` and `astream`.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
@@ -74,11 +76,18 @@ class OllamaPromptDriver(BasePromptDriver):
     )
     use_native_tools: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _client: Optional[Client] = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: Optional[AsyncClient] = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> Client:
         return import_optional_dependency("ollama").Client(host=self.host)
 
+    @lazy_property()
+    def async_client(self) -> AsyncClient:
+        return import_optional_dependency("ollama").AsyncClient(host=self.host)
+
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
         params = self._base_params(prompt_stack)
@@ -108,6 +117,32 @@ class OllamaPromptDriver(BasePromptDriver):
                 tool_index += 1
             yield DeltaMessage(content=message_content)
 
+    async def try_arun(self, prompt_stack: PromptStack) -> Message:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        response = await self.async_client.chat(**params)
+        logger.debug(response.model_dump())
+
+        return Message(
+            content=self.__to_prompt_stack_message_content(response),
+            role=Message.ASSISTANT_ROLE,
+        )
+
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        params = {**self._base_params(prompt_stack), "stream": True}
+        logger.debug(params)
+        stream: AsyncIterator = await self.async_client.chat(**params)
+
+        tool_index = 0
+        async for chunk in stream:
+            logger.debug(chunk)
+            message_content = self.__to_prompt_stack_delta_message_content(chunk)
+            # See `try_stream` for why the Tool call index is tracked here.
+            if isinstance(message_content, ActionCallDeltaMessageContent):
+                message_content.index = tool_index
+                tool_index += 1
+            yield DeltaMessage(content=message_content)
+
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         messages = self._prompt_stack_to_messages(prompt_stack)
 
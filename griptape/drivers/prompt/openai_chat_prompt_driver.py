@@ -34,9 +34,9 @@ from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from openai import Stream
+    from openai import AsyncStream, Stream
     from openai.types.chat import ChatCompletionChunk
     from openai.types.chat.chat_completion import ChatCompletion
     from openai.types.chat.chat_completion_chunk import ChoiceDelta
@@ -58,6 +58,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         api_key: An optional OpenAi API key. If not provided, the `OPENAI_API_KEY` environment variable will be used.
         organization: An optional OpenAI organization. If not provided, the `OPENAI_ORG_ID` environment variable will be used.
         client: An `openai.OpenAI` client.
+        async_client: An `openai.AsyncOpenAI` client, used by `arun` and `astream`.
         model: An OpenAI model name.
         tokenizer: An `OpenAiTokenizer`.
         user: A user id. Can be used to track requests by user.
@@ -111,6 +112,9 @@ class OpenAiChatPromptDriver(BasePromptDriver):
     _client: Optional[openai.OpenAI] = field(
         default=None, kw_only=True, alias="client", metadata={"serializable": False}
     )
+    _async_client: Optional[openai.AsyncOpenAI] = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
@@ -120,6 +124,14 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             organization=self.organization,
         )
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(
+            base_url=self.base_url,
+            api_key=self.api_key,
+            organization=self.organization,
+        )
+
     @property
     def supports_stop_sequences(self) -> bool:
         return not (self.model.startswith("o") or self.model.startswith("gpt-5"))
@@ -153,6 +165,25 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
         return self._to_delta_message_stream(result)
 
+    async def try_arun(self, prompt_stack: PromptStack) -> Message:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        result = await self.async_client.chat.completions.create(**params)
+
+        logger.debug(result.model_dump())
+        return self._to_message(result)
+
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        params = self._base_params(prompt_stack)
+        logger.debug({"stream": True, **params})
+        result: AsyncStream[ChatCompletionChunk] = await self.async_client.chat.completions.create(
+            **params, stream=True
+        )
+
+        async for message in result:
+            for delta_message in self._to_delta_messages(message):
+                yield delta_message
+
     def _to_message(self, result: ChatCompletion) -> Message:
         if len(result.choices) == 1:
             choice_message = result.choices[0].message
@@ -172,21 +203,24 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
     def _to_delta_message_stream(self, result: Stream[ChatCompletionChunk]) -> Iterator[DeltaMessage]:
         for message in result:
-            if message.usage is not None:
-                yield DeltaMessage(
-                    usage=DeltaMessage.Usage(
-                        input_tokens=message.usage.prompt_tokens,
-                        output_tokens=message.usage.completion_tokens,
-                    ),
-                )
-            if message.choices:
-                choice = message.choices[0]
-                delta = choice.delta
+            yield from self._to_delta_messages(message)
+
+    def _to_delta_messages(self, message: ChatCompletionChunk) -> Iterator[DeltaMessage]:
+        if message.usage is not None:
+            yield DeltaMessage(
+                usage=DeltaMessage.Usage(
+                    input_tokens=message.usage.prompt_tokens,
+                    output_tokens=message.usage.completion_tokens,
+                ),
+            )
+        if message.choices:
+            choice = message.choices[0]
+            delta = choice.delta
 
-                content = self.__to_prompt_stack_delta_message_content(delta)
+            content = self.__to_prompt_stack_delta_message_content(delta)
 
-                if content is not None:
-                    yield DeltaMessage(content=content)
+            if content is not None:
+                yield DeltaMessage(content=content)
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = {
@@ -5,11 +5,13 @@ from typing import TYPE_CHECKING
 
 from attrs import define
 
+from griptape.mixins.rate_limit_mixin import RateLimitMixin
+
 if TYPE_CHECKING:
     from griptape.artifacts import TextArtifact
 
 
 @define(kw_only=True)
-class BaseRerankDriver(ABC):
+class BaseRerankDriver(RateLimitMixin, ABC):
     @abstractmethod
     def run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]: ...
@@ -28,12 +28,13 @@ class CohereRerankDriver(BaseRerankDriver):
         artifacts_dict = {str(hash(a.to_text())): a for a in artifacts if a}
 
         if artifacts_dict:
-            response = self.client.rerank(
-                model=self.model,
-                query=query,
-                documents=[a.to_text() for a in artifacts_dict.values()],
-                return_documents=True,
-                top_n=self.top_n,
-            )
+            with self.rate_limited():
+                response = self.client.rerank(
+                    model=self.model,
+                    query=query,
+                    documents=[a.to_text() for a in artifacts_dict.values()],
+                    return_documents=True,
+                    top_n=self.top_n,
+                )
             return [artifacts_dict[str(hash(r.document.text))] for r in response.results if r.document is not None]
         return []
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import operator
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Optional
 
+import numpy as np
 from attrs import Factory, define, field
-from numpy import dot
-from numpy.linalg import norm
 
 from griptape.configs.defaults_config import Defaults
 from griptape.drivers.rerank import BaseRerankDriver
@@ -19,29 +17,75 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class LocalRerankDriver(BaseRerankDriver, FuturesExecutorMixin):
-    calculate_relatedness: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    """A Rerank Driver that ranks artifacts by the relatedness of their embeddings to the query's embedding.
+
+    Attributes:
+        calculate_relatedness: An optional function that calculates the relatedness of two vectors. Defaults to cosine
+            similarity, computed for all artifacts at once.
+        embedding_driver: The Embedding Driver used to embed the query and any artifacts without an embedding.
+        use_artifact_embeddings: Whether to reuse `TextArtifact.embedding`, which artifacts loaded from a Vector Store
+            carry, instead of embedding the artifact again. The embedding must come from the same model as
+            `embedding_driver`; embeddings with a different number of dimensions than the query are ignored.
+    """
+
+    calculate_relatedness: Optional[Callable] = field(default=None)
     embedding_driver: BaseEmbeddingDriver = field(
         kw_only=True, default=Factory(lambda: Defaults.drivers_config.embedding_driver), metadata={"serializable": True}
     )
+    use_artifact_embeddings: bool = field(default=True, metadata={"serializable": True})
 
     def run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+        if not artifacts:
+            return []
+
         query_embedding = self.embedding_driver.embed(query, vector_operation="query")
+        artifact_embeddings = self._get_artifact_embeddings(artifacts, dimensions=len(query_embedding))
 
-        with self.create_futures_executor() as futures_executor:
-            artifact_embeddings = execute_futures_list(
+        if self.calculate_relatedness is None:
+            matrix = np.asarray(artifact_embeddings, dtype=np.float64)
+            vector = np.asarray(query_embedding, dtype=np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                relatednesses = matrix @ vector / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector))
+        else:
+            relatednesses = np.asarray(
                 [
-                    futures_executor.submit(
-                        with_contextvars(self.embedding_driver.embed_text_artifact), a, vector_operation="upsert"
-                    )
-                    for a in artifacts
+                    self.calculate_relatedness(query_embedding, artifact_embedding)
+                    for artifact_embedding in artifact_embeddings
                 ],
+                dtype=np.float64,
             )
 
-        artifacts_and_relatednesses = [
-            (artifact, self.calculate_relatedness(query_embedding, artifact_embedding))
-            for artifact, artifact_embedding in zip(artifacts, artifact_embeddings)
+        # A stable sort keeps artifacts with equal relatedness in their original order.
+        return [artifacts[i] for i in np.argsort(-relatednesses, kind="stable")]
+
+    def _get_artifact_embeddings(self, artifacts: list[TextArtifact], *, dimensions: int) -> list[list[float]]:
+        embeddings = [
+            artifact.embedding
+            if self.use_artifact_embeddings and artifact.embedding and len(artifact.embedding) == dimensions
+            else None
+            for artifact in artifacts
         ]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            missing_embeddings = self._embed_artifacts([artifacts[i] for i in missing])
 
-        artifacts_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+            for i, embedding in zip(missing, missing_embeddings):
+                embeddings[i] = embedding
 
-        return [artifact for artifact, _ in artifacts_and_relatednesses]
+        return embeddings  # pyright: ignore[reportReturnType]
+
+    def _embed_artifacts(self, artifacts: list[TextArtifact]) -> list[list[float]]:
+        """Embeds the artifacts, in batches if the Embedding Driver supports it."""
+        if self.embedding_driver.max_batch_size is not None:
+            return self.embedding_driver.embed_many(artifacts, vector_operation="upsert")
+
+        with self.create_futures_executor() as futures_executor:
+            return execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.embedding_driver.embed), artifact, vector_operation="upsert"
+                    )
+                    for artifact in artifacts
+                ]
+            )
@@ -24,11 +24,12 @@ class NvidiaNimRerankDriver(BaseRerankDriver):
         if not artifacts:
             return []
 
-        response = requests.post(
-            url=f"{self.base_url.rstrip('/')}/v1/ranking",
-            json=self._get_body(query, artifacts),
-            headers=self.headers,
-        )
+        with self.rate_limited():
+            response = requests.post(
+                url=f"{self.base_url.rstrip('/')}/v1/ranking",
+                json=self._get_body(query, artifacts),
+                headers=self.headers,
+            )
 
         response.raise_for_status()
 
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import define
 
+from griptape.utils import import_optional_dependency
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Engine
+
 
 @define
 class BaseSqlDriver(ABC):
@@ -16,8 +23,44 @@ class BaseSqlDriver(ABC):
     @abstractmethod
     def execute_query(self, query: str) -> Optional[list[RowResult]]: ...
 
+    def execute_query_batches(self, query: str, *, batch_size: int = 1000) -> Iterator[list[RowResult]]:
+        """Executes a query and yields its rows in batches of at most `batch_size` rows.
+
+        Drivers that can stream rows from the database override this method so that only one batch is held in memory
+        at a time. By default, all rows are fetched with `execute_query` and then split into batches.
+        """
+        self._validate_batch_size(batch_size)
+        rows = self.execute_query(query) or []
+
+        for i in range(0, len(rows), batch_size):
+            yield rows[i : i + batch_size]
+
     @abstractmethod
     def execute_query_raw(self, query: str) -> Optional[list[dict[str, Any]]]: ...
 
     @abstractmethod
     def get_table_schema(self, table_name: str, schema: Optional[str] = None) -> Optional[str]: ...
+
+    def _execute_engine_query_batches(
+        self, engine: Engine, query: str, *, batch_size: int, commit: bool
+    ) -> Iterator[list[RowResult]]:
+        """Executes a query with a SQLAlchemy engine and streams its rows in batches of at most `batch_size` rows.
+
+        `yield_per` streams rows with a server-side cursor where the database supports one. Statements that don't
+        return rows are committed if `commit` is set.
+        """
+        self._validate_batch_size(batch_size)
+        sqlalchemy = import_optional_dependency("sqlalchemy")
+
+        with engine.connect() as con:
+            results = con.execution_options(yield_per=batch_size).execute(sqlalchemy.text(query))
+
+            if results.returns_rows:
+                for partition in results.partitions(batch_size):
+                    yield [BaseSqlDriver.RowResult(dict(row._mapping)) for row in partition]
+            elif commit:
+                con.commit()
+
+    def _validate_batch_size(self, batch_size: int) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
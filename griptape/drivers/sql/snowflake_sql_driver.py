@@ -9,6 +9,8 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from snowflake.connector import SnowflakeConnection
     from sqlalchemy.engine import Engine
 
@@ -54,6 +56,9 @@ class SnowflakeSqlDriver(BaseSqlDriver):
                 return None
             raise ValueError("No results found")
 
+    def execute_query_batches(self, query: str, *, batch_size: int = 1000) -> Iterator[list[BaseSqlDriver.RowResult]]:
+        return self._execute_engine_query_batches(self.engine, query, batch_size=batch_size, commit=False)
+
     def get_table_schema(self, table_name: str, schema: Optional[str] = None) -> Optional[str]:
         sqlalchemy = import_optional_dependency("sqlalchemy")
 
@@ -10,6 +10,8 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from sqlalchemy.engine import Engine
 
 
@@ -43,6 +45,9 @@ class SqlDriver(BaseSqlDriver):
                 return None
             raise ValueError("No result found")
 
+    def execute_query_batches(self, query: str, *, batch_size: int = 1000) -> Iterator[list[BaseSqlDriver.RowResult]]:
+        return self._execute_engine_query_batches(self.engine, query, batch_size=batch_size, commit=True)
+
     def get_table_schema(self, table_name: str, schema: Optional[str] = None) -> Optional[str]:
         sqlalchemy_exc = import_optional_dependency("sqlalchemy.exc")
 
@@ -1,3 +1,4 @@
 from griptape.drivers.structure_run.local_structure_run_driver import LocalStructureRunDriver
+from griptape.drivers.structure_run.process_pool_structure_run_driver import ProcessPoolStructureRunDriver
 
-__all__ = ["LocalStructureRunDriver"]
+__all__ = ["LocalStructureRunDriver", "ProcessPoolStructureRunDriver"]
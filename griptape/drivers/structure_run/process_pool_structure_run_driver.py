@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import traceback
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from attrs import Factory, define, field
+
+from griptape.artifacts import BaseArtifact
+from griptape.drivers.structure_run import BaseStructureRunDriver
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from griptape.structures import Structure
+
+
+# Drivers with running workers, so that the workers are stopped when the interpreter exits.
+_active_drivers: weakref.WeakValueDictionary[int, ProcessPoolStructureRunDriver] = weakref.WeakValueDictionary()
+
+
+@atexit.register
+def _shutdown_active_drivers() -> None:
+    for driver in list(_active_drivers.values()):
+        driver._terminate()
+
+
+def _run_worker(connection: Connection) -> None:
+    """Runs the Structures sent over `connection`, one at a time, until it receives `None` or the connection is closed."""
+    # Imported up front so that the first run doesn't pay for it.
+    import griptape.structures  # noqa: F401
+    import griptape.tasks  # noqa: F401
+
+    create_structure_cache: dict[bytes, Callable[[], Structure]] = {}
+    connection.send(None)
+
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+
+        if task is None:
+            return
+
+        pickled_create_structure, args, env = task
+
+        try:
+            if pickled_create_structure not in create_structure_cache:
+                create_structure_cache[pickled_create_structure] = pickle.loads(pickled_create_structure)  # noqa: S301
+            create_structure = create_structure_cache[pickled_create_structure]
+
+            old_env = os.environ.copy()
+            try:
+                os.environ.update(env)
+                structure = create_structure().run(*[BaseArtifact.from_json(arg).value for arg in args])
+            finally:
+                os.environ.clear()
+                os.environ.update(old_env)
+
+            connection.send((True, structure.output.to_json()))
+        except Exception as e:
+            try:
+                pickled_error = pickle.dumps(e)
+            except Exception:
+                pickled_error = pickle.dumps(RuntimeError(traceback.format_exc()))
+
+            connection.send((False, pickled_error))
+
+
+@define
+class _Worker:
+    process: BaseProcess = field()
+    connection: Connection = field()
+    ready: bool = field(default=False)
+    runs: int = field(default=0)
+
+
+@define
+class ProcessPoolStructureRunDriver(BaseStructureRunDriver):
+    """Runs Structures in a pool of worker processes, so that CPU-bound Structures can use every core.
+
+    The workers are started on the first run and reused across runs, so they only import griptape and unpickle
+    `create_structure` once. Arguments and outputs are passed to and from the workers as Artifact JSON. Each worker
+    runs one Structure at a time with `env` applied to its own environment, so concurrent runs don't see each other's
+    variables.
+
+    `create_structure` is pickled to send it to the workers, so it must be a module-level function rather than a lambda
+    or a closure. The workers don't share the parent process's `Defaults` or `EventBus`, so `create_structure` should
+    configure anything the Structure needs.
+
+    The workers are not daemonic, so Structures can start processes of their own. They are stopped by `shutdown`, or
+    when the interpreter exits.
+
+    Attributes:
+        create_structure: Function that creates the Structure to run.
+        max_workers: Number of worker processes. Defaults to the number of CPUs.
+        max_runs_per_worker: Number of runs after which a worker is replaced with a new process. None to never replace
+            workers.
+        timeout: Number of seconds to wait for a run before terminating its worker and raising a `TimeoutError`. None to
+            wait indefinitely.
+        start_method: The `multiprocessing` start method used to start the workers.
+    """
+
+    STOP_TIMEOUT = 5.0
+
+    create_structure: Callable[[], Structure] = field(kw_only=True)
+    max_workers: int = field(default=Factory(lambda: os.cpu_count() or 1), kw_only=True)
+    max_runs_per_worker: Optional[int] = field(default=None, kw_only=True)
+    timeout: Optional[float] = field(default=None, kw_only=True)
+    start_method: str = field(default="spawn", kw_only=True)
+    _idle_workers: Optional[queue.Queue[_Worker]] = field(default=None, init=False)
+    _workers: dict[int, _Worker] = field(factory=dict, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+
+    @max_workers.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    def validate_max_workers(self, _: Any, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+    def try_run(self, *args: BaseArtifact) -> BaseArtifact:
+        task = (pickle.dumps(self.create_structure), [arg.to_json() for arg in args], self.env)
+        idle_workers = self._get_idle_workers()
+        worker = idle_workers.get()
+
+        try:
+            succeeded, result = self._run_on_worker(worker, task)
+        except Exception:
+            # The worker is hung or dead.
+            self._stop_worker(worker, terminate=True)
+            worker = self._start_worker()
+
+            raise
+        else:
+            worker.runs += 1
+
+            if self.max_runs_per_worker is not None and worker.runs >= self.max_runs_per_worker:
+                self._stop_worker(worker)
+                worker = self._start_worker()
+        finally:
+            if self._idle_workers is idle_workers:
+                idle_workers.put(worker)
+            else:
+                # The pool was shut down during the run.
+                self._stop_worker(worker)
+
+        if not succeeded:
+            raise pickle.loads(result)  # noqa: S301
+
+        return BaseArtifact.from_json(result)
+
+    def shutdown(self) -> None:
+        """Stops the workers. Workers that are running a Structure are stopped once the run finishes."""
+        with self._lock:
+            idle_workers = self._idle_workers
+            self._idle_workers = None
+            _active_drivers.pop(id(self), None)
+
+        if idle_workers is not None:
+            while not idle_workers.empty():
+                self._stop_worker(idle_workers.get())
+
+    def _terminate(self) -> None:
+        """Stops the idle workers and terminates the ones that are still running a Structure."""
+        self.shutdown()
+
+        with self._lock:
+            workers = list(self._workers.values())
+
+        for worker in workers:
+            self._stop_worker(worker, terminate=True)
+
+    def _get_idle_workers(self) -> queue.Queue[_Worker]:
+        with self._lock:
+            if self._idle_workers is None:
+                _active_drivers[id(self)] = self
+                self._idle_workers = queue.Queue()
+
+                for _ in range(self.max_workers):
+                    self._idle_workers.put(self._start_worker())
+
+            return self._idle_workers
+
+    def _run_on_worker(self, worker: _Worker, task: tuple) -> tuple[bool, Any]:
+        try:
+            if not worker.ready:
+                # Waits for the worker to finish importing, which doesn't count against the timeout.
+                worker.connection.recv()
+                worker.ready = True
+
+            worker.connection.send(task)
+
+            if not worker.connection.poll(self.timeout):
+                raise TimeoutError(f"Structure run timed out after {self.timeout} seconds.")
+
+            return worker.connection.recv()
+        except (EOFError, BrokenPipeError) as e:
+            raise RuntimeError("Structure run worker exited unexpectedly.") from e
+
+    def _start_worker(self) -> _Worker:
+        context = multiprocessing.get_context(self.start_method)
+        parent_connection, child_connection = context.Pipe()
+        # Daemonic processes can't start processes of their own.
+        process = context.Process(target=_run_worker, args=(child_connection,), daemon=False)
+
+        process.start()
+        child_connection.close()
+        worker = _Worker(process, parent_connection)
+
+        with self._lock:
+            self._workers[id(worker)] = worker
+
+        return worker
+
+    def _stop_worker(self, worker: _Worker, *, terminate: bool = False) -> None:
+        with self._lock:
+            self._workers.pop(id(worker), None)
+
+        if terminate:
+            worker.process.terminate()
+        else:
+            # Asks an idle worker to exit. Closing the connection isn't enough, since forked workers inherit it.
+            with contextlib.suppress(OSError):
+                worker.connection.send(None)
+        worker.connection.close()
+
+        # Joining reaps the process, so stopped workers don't linger as zombies.
+        worker.process.join(self.STOP_TIMEOUT)
+
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join()
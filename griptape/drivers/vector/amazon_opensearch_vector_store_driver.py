@@ -10,6 +10,8 @@ from griptape.utils import import_optional_dependency, str_to_hash
 if TYPE_CHECKING:
     from boto3 import Session
 
+    from griptape.drivers.vector import BaseVectorStoreDriver
+
 
 @define
 class AmazonOpenSearchVectorStoreDriver(OpenSearchVectorStoreDriver):
@@ -58,3 +60,12 @@ class AmazonOpenSearchVectorStoreDriver(OpenSearchVectorStoreDriver):
             response = self.client.index(index=self.index_name, id=vector_id, body=doc)
 
         return response["_id"]
+
+    def _to_bulk_action(self, entry: BaseVectorStoreDriver.Entry, **kwargs) -> dict:
+        action = super()._to_bulk_action(entry, **kwargs)
+
+        # OpenSearch Serverless doesn't accept document ids for vector search collections.
+        if self.service == "aoss":
+            del action["_id"]
+
+        return action
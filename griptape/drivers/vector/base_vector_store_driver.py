@@ -30,7 +30,19 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         namespace: Optional[str] = field(default=None, metadata={"serializable": True})
 
         def to_artifact(self) -> BaseArtifact:
-            return BaseArtifact.from_json(self.meta["artifact"])  # pyright: ignore[reportOptionalSubscript]
+            artifact = BaseArtifact.from_json(self.meta["artifact"])  # pyright: ignore[reportOptionalSubscript]
+
+            # Carries the stored vector so that reranking doesn't have to embed the artifact again. Named vectors, which
+            # some drivers return as a dict, aren't carried.
+            if (
+                isinstance(artifact, TextArtifact)
+                and self.vector is not None
+                and not isinstance(self.vector, dict)
+                and len(self.vector) > 0
+            ):
+                artifact.embedding = [float(value) for value in self.vector]
+
+            return artifact
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
 
@@ -108,28 +120,42 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta: Optional[dict] = None,
         **kwargs,
     ):
-        with self.create_futures_executor() as futures_executor:
-            if isinstance(artifacts, list):
-                return utils.execute_futures_list(
+        artifacts_dict = {None: artifacts} if isinstance(artifacts, list) else artifacts
+        namespaced_artifacts = [
+            (namespace, artifact) for namespace, artifact_list in artifacts_dict.items() for artifact in artifact_list
+        ]
+
+        if type(self).upsert is not BaseVectorStoreDriver.upsert:
+            # Drivers that override `upsert` embed and store artifacts their own way, so each artifact goes through it.
+            with self.create_futures_executor() as futures_executor:
+                vector_ids = utils.execute_futures_list(
                     [
-                        futures_executor.submit(with_contextvars(self.upsert), a, namespace=None, meta=meta, **kwargs)
-                        for a in artifacts
-                    ],
+                        futures_executor.submit(
+                            with_contextvars(self.upsert), artifact, namespace=namespace, meta=meta, **kwargs
+                        )
+                        for namespace, artifact in namespaced_artifacts
+                    ]
                 )
-            futures_dict = {}
+        else:
+            vectors = self._embed_collection([artifact for _, artifact in namespaced_artifacts])
+            entries = []
 
-            for namespace, artifact_list in artifacts.items():
-                for a in artifact_list:
-                    if not futures_dict.get(namespace):
-                        futures_dict[namespace] = []
+            for (namespace, artifact), vector in zip(namespaced_artifacts, vectors):
+                vector_id, artifact_meta = self._get_vector_id_and_meta(artifact, meta=meta)
 
-                    futures_dict[namespace].append(
-                        futures_executor.submit(
-                            with_contextvars(self.upsert), a, namespace=namespace, meta=meta, **kwargs
-                        )
-                    )
+                entries.append(self.Entry(id=vector_id, vector=vector, namespace=namespace, meta=artifact_meta))
+
+            vector_ids = self.upsert_vectors(entries, **kwargs)
 
-            return utils.execute_futures_list_dict(futures_dict)
+        if isinstance(artifacts, list):
+            return vector_ids
+
+        vector_ids_dict = {namespace: [] for namespace in artifacts_dict}
+
+        for (namespace, _), vector_id in zip(namespaced_artifacts, vector_ids):
+            vector_ids_dict[namespace].append(vector_id)
+
+        return vector_ids_dict
 
     def upsert(
         self,
@@ -141,14 +167,7 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         **kwargs,
     ) -> str:
         artifact = TextArtifact(value) if isinstance(value, str) else value
-
-        meta = {} if meta is None else meta
-
-        if vector_id is None:
-            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
-            vector_id = self._get_default_vector_id(value)
-
-        meta = {**meta, "artifact": artifact.to_json()}
+        vector_id, meta = self._get_vector_id_and_meta(artifact, meta=meta, vector_id=vector_id)
 
         vector = self.embedding_driver.embed(artifact, vector_operation="upsert")
 
@@ -180,6 +199,34 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         **kwargs,
     ) -> str: ...
 
+    def upsert_vectors(self, entries: list[Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors.
+
+        Drivers whose backend supports bulk writes override this to upsert the entries in as few requests as possible.
+        By default, each entry is upserted concurrently with `upsert_vector`.
+
+        Args:
+            entries: The entries to upsert, identified by their `id` and `namespace`.
+            kwargs: Additional arguments passed on to the backend for every entry.
+
+        Returns:
+            The ids of the upserted vectors, in the same order as `entries`.
+        """
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.upsert_vector),
+                        entry.vector or [],
+                        vector_id=entry.id,
+                        namespace=entry.namespace,
+                        meta=entry.meta,
+                        **kwargs,
+                    )
+                    for entry in entries
+                ]
+            )
+
     @abstractmethod
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[Entry]: ...
 
@@ -218,5 +265,29 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             ) from e
         return self.query_vector(vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
 
+    def _embed_collection(self, artifacts: list[TextArtifact | ImageArtifact]) -> list[list[float]]:
+        """Embeds the artifacts of a collection, in batches if the Embedding Driver supports it."""
+        if self.embedding_driver.max_batch_size is not None:
+            return self.embedding_driver.embed_many(artifacts, vector_operation="upsert")
+
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.embedding_driver.embed), artifact, vector_operation="upsert"
+                    )
+                    for artifact in artifacts
+                ]
+            )
+
+    def _get_vector_id_and_meta(
+        self, artifact: TextArtifact | ImageArtifact, *, meta: Optional[dict] = None, vector_id: Optional[str] = None
+    ) -> tuple[str, dict]:
+        if vector_id is None:
+            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+            vector_id = self._get_default_vector_id(value)
+
+        return vector_id, {**({} if meta is None else meta), "artifact": artifact.to_json()}
+
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import heapq
 import json
 import operator
 import os
 import threading
-from typing import Callable, NoReturn, Optional, TextIO
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Literal, NoReturn, Optional, TextIO, cast
 
+import numpy as np
 from attrs import Factory, define, field
 from numpy import dot
 from numpy.linalg import norm
@@ -13,13 +15,98 @@ from numpy.linalg import norm
 from griptape import utils
 from griptape.drivers.vector import BaseVectorStoreDriver
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class _VersionedDict(dict):
+    """A dict that counts its modifications, so that indexes built from it can tell when they are stale."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other: Any) -> Self:
+        self.update(other)
+
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args) -> Any:
+        self.version += 1
+
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[Any, Any]:
+        self.version += 1
+
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self.version += 1
+
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
+def _to_versioned_dict(value: dict) -> _VersionedDict:
+    return value if isinstance(value, _VersionedDict) else _VersionedDict(value)
+
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
-    entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
+    """A vector store driver that keeps entries in memory, optionally persisting them to a file.
+
+    Attributes:
+        entries: Entries keyed by their namespaced vector id. Vectors of entries loaded from a "log" file are read-only
+            numpy views into the memory-mapped sidecar until `load_entry`, `load_entries` or a query returns them.
+            Assigned dicts are wrapped in a dict that counts modifications, so the matrix index is rebuilt after
+            `entries` is changed directly.
+        persist_file: An optional path to a file to persist entries to.
+        persist_format: The format of `persist_file`. "json" rewrites a single JSON document on every upsert.
+            "log" appends each upsert as a JSON line and stores vectors as float32 in a binary sidecar file next
+            to `persist_file`. The log is compacted in the background once it holds more overwritten records than
+            live ones. An existing "json" file opened with "log" is rewritten as a log.
+        calculate_relatedness: A function that calculates the relatedness of two vectors.
+        use_matrix_index: Whether to query through a float32 matrix of all entry vectors instead of calling
+            `calculate_relatedness` for each entry. Scores are always cosine similarity when enabled.
+        thread_lock: Lock guarding entries and the matrix index.
+    """
+
+    LOG_COMPACTION_MIN_DEAD_RECORDS = 1000
+
+    entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict, converter=_to_versioned_dict)
     persist_file: Optional[str] = field(default=None)
+    persist_format: Literal["json", "log"] = field(default="json")
     calculate_relatedness: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    use_matrix_index: bool = field(default=False)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _index_matrix: Optional[np.ndarray] = field(default=None, init=False)
+    _index_norms: Optional[np.ndarray] = field(default=None, init=False)
+    _index_keys: list[str] = field(factory=list, init=False)
+    _index_rows: dict[str, int] = field(factory=dict, init=False)
+    _index_namespace_rows: dict[Optional[str], list[int]] = field(factory=dict, init=False)
+    _index_entries: Optional[dict[str, BaseVectorStoreDriver.Entry]] = field(default=None, init=False)
+    _index_version: int = field(default=0, init=False)
+    _index_shared: bool = field(default=False, init=False)
+    _log_vectors_file: Optional[str] = field(default=None, init=False)
+    _log_vectors_size: int = field(default=0, init=False)
+    _log_dead_records: int = field(default=0, init=False)
+    _log_compaction_keys: Optional[set[str]] = field(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         if self.persist_file is not None:
@@ -28,6 +115,11 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
 
+            if self.persist_format == "log":
+                self.__open_log()
+
+                return
+
             if not os.path.isfile(self.persist_file):
                 with open(self.persist_file, "w") as file:
                     self.__save_entries_to_file(file)
@@ -55,27 +147,66 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         vector_id = vector_id or utils.str_to_hash(str(vector))
 
+        return self.upsert_vectors([self.Entry(id=vector_id, vector=vector, meta=meta, namespace=namespace)])[0]
+
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors, persisting them to `persist_file` in a single write."""
         with self.thread_lock:
-            self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
-                id=vector_id,
-                vector=vector,
-                meta=meta,
-                namespace=namespace,
-            )
+            keyed_entries = []
+            index_current = self.__is_index_current()
 
-        if self.persist_file is not None:
+            for upserted_entry in entries:
+                key = self.__namespaced_vector_id(upserted_entry.id, namespace=upserted_entry.namespace)
+                entry = self.Entry(
+                    id=upserted_entry.id,
+                    vector=upserted_entry.vector,
+                    meta=upserted_entry.meta,
+                    namespace=upserted_entry.namespace,
+                )
+
+                if key in self.entries:
+                    self._log_dead_records += 1
+                self.entries[key] = entry
+
+                if index_current:
+                    self.__index_entry(key, entry)
+
+                keyed_entries.append((key, entry))
+
+            if index_current and self._index_entries is not None:
+                self._index_version = cast("_VersionedDict", self.entries).version
+
+            if self.persist_file is not None and self.persist_format == "log":
+                self.__append_to_log(keyed_entries)
+
+        if self.persist_file is not None and self.persist_format == "log":
+            if self._log_compaction_keys is None and self._log_dead_records > max(
+                len(self.entries), self.LOG_COMPACTION_MIN_DEAD_RECORDS
+            ):
+                threading.Thread(target=self.compact, daemon=True).start()
+        elif self.persist_file is not None:
             # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
+            #  every time new vectors are inserted
             with open(self.persist_file, "w") as file:
                 self.__save_entries_to_file(file)
 
-        return vector_id
+        return [entry.id for entry in entries]
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+        entry = self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+
+        if entry is not None:
+            self.__entry_vector(entry)
+
+        return entry
 
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        entries = [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+
+        for entry in entries:
+            self.__entry_vector(entry)
+
+        return entries
 
     def query_vector(
         self,
@@ -86,39 +217,410 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         include_vectors: bool = False,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
-        else:
-            entries = self.entries
+        if self.use_matrix_index:
+            return self.query_vectors(
+                [vector], count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )[0]
 
-        entries_and_relatednesses = [
-            (entry, self.calculate_relatedness(vector, entry.vector)) for entry in list(entries.values())
-        ]
+        entries = [entry for entry in list(self.entries.values()) if namespace is None or entry.namespace == namespace]
+        entries_and_relatednesses = [(entry, self.calculate_relatedness(vector, entry.vector)) for entry in entries]
 
-        entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+        if count is None:
+            entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+        else:
+            entries_and_relatednesses = heapq.nlargest(count, entries_and_relatednesses, key=operator.itemgetter(1))
 
-        result = [
+        return [
             BaseVectorStoreDriver.Entry(
-                id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta, namespace=er[0].namespace
+                id=entry.id,
+                vector=self.__entry_vector(entry) if include_vectors else [],
+                score=relatedness,
+                meta=entry.meta,
+                namespace=entry.namespace,
             )
-            for er in entries_and_relatednesses
-        ][:count]
-
-        if include_vectors:
-            return result
-        return [
-            BaseVectorStoreDriver.Entry(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-            for r in result
+            for entry, relatedness in entries_and_relatednesses
         ]
 
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Query multiple vectors at once.
+
+        With `use_matrix_index` enabled all vectors are scored in a single matrix product.
+
+        Args:
+            vectors: The vectors to query.
+            count: The maximum number of entries to return per vector.
+            namespace: An optional namespace to restrict the query to.
+            include_vectors: Whether to include entry vectors in the results.
+            kwargs: Additional keyword arguments.
+
+        Returns:
+            A list of query results, in the same order as `vectors`.
+        """
+        if not self.use_matrix_index:
+            return [
+                self.query_vector(vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+                for vector in vectors
+            ]
+
+        with self.thread_lock:
+            if not self.__is_index_current():
+                self.__build_index()
+
+            if self._index_matrix is None:
+                return [[] for _ in vectors]
+
+            # Rows are scored after the lock is released. The matrix and norms are views rather than copies, so
+            # `_index_shared` makes the next overwrite of a row copy them first. Appended rows are past the snapshot and
+            # a rebuild replaces the arrays, so the snapshot stays consistent.
+            index_keys = self._index_keys
+
+            if namespace is None:
+                rows = None
+                matrix = self._index_matrix[: len(index_keys)]
+                norms = self._index_norms[: len(index_keys)]  # pyright: ignore[reportOptionalSubscript]
+                self._index_shared = True
+            else:
+                rows = np.asarray(self._index_namespace_rows.get(namespace, []), dtype=np.intp)
+                matrix = self._index_matrix[rows]
+                norms = self._index_norms[rows]  # pyright: ignore[reportOptionalSubscript]
+
+        if not len(matrix):
+            return [[] for _ in vectors]
+
+        queries = np.asarray(vectors, dtype=np.float32)
+        denominators = np.outer(np.linalg.norm(queries, axis=1), norms)
+        scores = np.divide(queries @ matrix.T, denominators, out=np.zeros_like(denominators), where=denominators != 0)
+
+        results = []
+        for query_scores in scores:
+            if count is None or count >= len(query_scores):
+                top_rows = np.argsort(-query_scores, kind="stable")
+            else:
+                top_rows = np.argpartition(-query_scores, count - 1)[:count]
+                top_rows = top_rows[np.argsort(-query_scores[top_rows], kind="stable")]
+
+            result = []
+            for row in top_rows:
+                entry = self.entries.get(index_keys[row if rows is None else rows[row]])
+                if entry is not None:
+                    result.append(
+                        BaseVectorStoreDriver.Entry(
+                            id=entry.id,
+                            vector=self.__entry_vector(entry) if include_vectors else [],
+                            score=float(query_scores[row]),
+                            meta=entry.meta,
+                            namespace=entry.namespace,
+                        )
+                    )
+            results.append(result)
+
+        return results
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
 
+    def compact(self) -> None:
+        """Rewrite the log and vectors sidecar of `persist_file` so that they only hold the current entries.
+
+        Upserts are not blocked while the new files are written. The new files are fsynced before the new log
+        replaces the old one atomically, so reopening after a crash at any point yields either the old or the
+        compacted store.
+        """
+        if self.persist_file is None or self.persist_format != "log":
+            return
+
+        with self.thread_lock:
+            if self._log_compaction_keys is not None:
+                return
+            self._log_compaction_keys = set()
+            entries = list(self.entries.items())
+            old_vectors_file = self._log_vectors_file
+
+        try:
+            vectors_file = self.__next_log_vectors_file()
+            vectors_path = self.__log_path(vectors_file)
+            log_file = f"{self.persist_file}.compact"
+            offsets = {}
+
+            with open(log_file, "w") as log, open(vectors_path, "wb") as vectors:
+                log.write(json.dumps({"vectors_file": vectors_file}) + "\n")
+                vectors_size = 0
+                for key, entry in entries:
+                    offsets[key] = vectors_size
+                    vectors_size = self.__write_log_record(log, vectors, vectors_size, key, entry)
+
+            with self.thread_lock:
+                with open(log_file, "a") as log, open(vectors_path, "ab") as vectors:
+                    # Entries upserted while the snapshot was written.
+                    for key in self._log_compaction_keys:
+                        offsets[key] = vectors_size
+                        vectors_size = self.__write_log_record(log, vectors, vectors_size, key, self.entries[key])
+
+                    os.fsync(log.fileno())
+                    os.fsync(vectors.fileno())
+
+                os.replace(log_file, self.persist_file)
+                self.__fsync_directory()
+
+                self._log_vectors_file = vectors_file
+                self._log_vectors_size = vectors_size
+                self._log_dead_records = 0
+
+                # Entries still viewing the old sidecar are re-pointed at the new one, so that the old one is no
+                # longer mapped once it's removed.
+                new_vectors = (
+                    np.memmap(vectors_path, dtype=np.float32, mode="r", shape=(vectors_size,)).view(np.ndarray)
+                    if vectors_size
+                    else np.empty(0, dtype=np.float32)
+                )
+                for key, offset in offsets.items():
+                    entry = self.entries[key]
+                    if isinstance(entry.vector, np.ndarray):
+                        entry.vector = new_vectors[offset : offset + len(entry.vector)]
+        finally:
+            with self.thread_lock:
+                self._log_compaction_keys = None
+
+        if old_vectors_file is not None and old_vectors_file != self._log_vectors_file:
+            os.remove(self.__log_path(old_vectors_file))
+
     def __save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
             serialized_data = {k: v.to_dict() for k, v in self.entries.items()}
 
             json.dump(serialized_data, json_file)
 
+    def __open_log(self) -> None:
+        persist_file = self.persist_file
+
+        if persist_file is None:
+            return
+
+        if not os.path.isfile(persist_file) or os.path.getsize(persist_file) == 0:
+            self._log_vectors_file = self.__next_log_vectors_file()
+            open(self.__log_path(self._log_vectors_file), "wb").close()
+
+            with open(persist_file, "w") as log:
+                log.write(json.dumps({"vectors_file": self._log_vectors_file}) + "\n")
+
+            return
+
+        with open(persist_file, "rb") as log:
+            header = log.readline()
+
+        vectors_file = self.__read_log_header(header)
+
+        if vectors_file is None:
+            self.__migrate_json_to_log(header)
+        else:
+            self.__load_log(persist_file, vectors_file, len(header))
+
+    def __load_log(self, persist_file: str, vectors_file: str, header_size: int) -> None:
+        with open(persist_file, "rb") as log:
+            log.seek(header_size)
+            vectors_path = self.__log_path(vectors_file)
+            vectors_size = os.path.getsize(vectors_path) // 4 if os.path.isfile(vectors_path) else 0
+            vectors = np.empty(0, dtype=np.float32)
+            if vectors_size:
+                vectors = np.memmap(vectors_path, dtype=np.float32, mode="r", shape=(vectors_size,)).view(np.ndarray)
+            valid_size = header_size
+            entries = {}
+            dead_records = 0
+
+            for line in log:
+                # A record is only complete once its trailing newline is written, anything after the last complete
+                # record was cut short by a crash and is discarded.
+                try:
+                    record = json.loads(line.decode()) if line.endswith(b"\n") else None
+                except ValueError:
+                    record = None
+                if record is None or record["offset"] + record["length"] > vectors_size:
+                    break
+
+                key = record["key"]
+                if key in entries:
+                    dead_records += 1
+                # Only the record is read here, the vector stays a view into the sidecar until it's returned.
+                entries[key] = self.Entry(
+                    id=record["id"],
+                    vector=vectors[record["offset"] : record["offset"] + record["length"]],
+                    meta=record["meta"],
+                    namespace=record["namespace"],
+                )
+                valid_size += len(line)
+
+        if valid_size < os.path.getsize(persist_file):
+            with open(persist_file, "r+b") as log:
+                log.truncate(valid_size)
+
+        if os.path.isfile(vectors_path) and vectors_size * 4 < os.path.getsize(vectors_path):
+            # Drop a partially written float so that appended vectors stay aligned.
+            with open(vectors_path, "r+b") as file:
+                file.truncate(vectors_size * 4)
+
+        self.entries = entries
+        self._log_vectors_file = vectors_file
+        self._log_vectors_size = vectors_size
+        self._log_dead_records = dead_records
+
+    def __read_log_header(self, header: bytes) -> Optional[str]:
+        """Returns the vectors sidecar named by a log header, or None if the file is a JSON format document."""
+        try:
+            data = json.loads(header.decode())
+        except ValueError:
+            data = None
+
+        vectors_file = data.get("vectors_file") if isinstance(data, dict) else None
+
+        return vectors_file if isinstance(vectors_file, str) else None
+
+    def __migrate_json_to_log(self, document: bytes) -> None:
+        """Rewrites a `persist_format="json"` document as a log, so existing stores can switch to the log format."""
+        try:
+            self.entries = {
+                k: BaseVectorStoreDriver.Entry.from_dict(v) for k, v in json.loads(document.decode()).items()
+            }
+        except Exception as e:
+            raise ValueError(
+                f'{self.persist_file} is neither a "log" nor a "json" format persist file and can\'t be opened with '
+                'persist_format="log".'
+            ) from e
+
+        # Compaction writes the current entries to a new log and atomically replaces the JSON document with it.
+        self.compact()
+
+    def __entry_vector(self, entry: BaseVectorStoreDriver.Entry) -> Optional[list[float]]:
+        if isinstance(entry.vector, np.ndarray):
+            entry.vector = entry.vector.tolist()
+
+        return entry.vector
+
+    def __append_to_log(self, keyed_entries: list[tuple[str, BaseVectorStoreDriver.Entry]]) -> None:
+        if self.persist_file is None or self._log_vectors_file is None:
+            return
+
+        with open(self.persist_file, "a") as log, open(self.__log_path(self._log_vectors_file), "ab") as vectors:
+            for key, entry in keyed_entries:
+                self._log_vectors_size = self.__write_log_record(log, vectors, self._log_vectors_size, key, entry)
+
+        if self._log_compaction_keys is not None:
+            self._log_compaction_keys.update(key for key, _ in keyed_entries)
+
+    def __write_log_record(
+        self, log: TextIO, vectors: BinaryIO, vectors_size: int, key: str, entry: BaseVectorStoreDriver.Entry
+    ) -> int:
+        vector = np.asarray(entry.vector, dtype=np.float32)
+
+        # The vector is flushed before its record so that a complete record always points at a complete vector.
+        vectors.write(vector.tobytes())
+        vectors.flush()
+        log.write(
+            json.dumps(
+                {
+                    "key": key,
+                    "id": entry.id,
+                    "namespace": entry.namespace,
+                    "meta": entry.meta,
+                    "offset": vectors_size,
+                    "length": len(vector),
+                }
+            )
+            + "\n"
+        )
+        log.flush()
+
+        return vectors_size + len(vector)
+
+    def __next_log_vectors_file(self) -> str:
+        generation = 0 if self._log_vectors_file is None else int(self._log_vectors_file.split(".")[-2]) + 1
+
+        return f"{os.path.basename(str(self.persist_file))}.{generation}.vectors"
+
+    def __fsync_directory(self) -> None:
+        # Directories can't be opened for fsync on Windows, where os.replace is durable on its own.
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+
+        directory = os.open(os.path.dirname(os.path.abspath(str(self.persist_file))), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+    def __log_path(self, file_name: str) -> str:
+        return os.path.join(os.path.dirname(str(self.persist_file)), file_name)
+
+    def __is_index_current(self) -> bool:
+        # `entries` is public, so it's compared by identity and version rather than trusted to only change here.
+        return (
+            self._index_entries is self.entries and self._index_version == cast("_VersionedDict", self.entries).version
+        )
+
+    def __build_index(self) -> None:
+        self._index_entries = self.entries
+        self._index_version = cast("_VersionedDict", self.entries).version
+        self._index_shared = False
+        self._index_matrix = None
+        self._index_norms = None
+        self._index_keys = []
+        self._index_rows = {}
+        self._index_namespace_rows = {}
+
+        if self.entries:
+            self._index_matrix = np.asarray([entry.vector for entry in self.entries.values()], dtype=np.float32)
+            self._index_norms = np.linalg.norm(self._index_matrix, axis=1)
+
+            for row, (key, entry) in enumerate(self.entries.items()):
+                self._index_keys.append(key)
+                self._index_rows[key] = row
+                self._index_namespace_rows.setdefault(entry.namespace, []).append(row)
+
+    def __index_entry(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        if self._index_matrix is None or self._index_norms is None:
+            # Built from no entries, rebuild on the next query.
+            self._index_entries = None
+
+            return
+
+        vector = np.asarray(entry.vector, dtype=np.float32)
+
+        if vector.shape != self._index_matrix.shape[1:]:
+            # Rebuild on the next query, which raises if the vectors can't form a matrix.
+            self._index_entries = None
+            self._index_matrix = None
+            self._index_norms = None
+
+            return
+
+        row = self._index_rows.get(key)
+
+        if row is None:
+            row = len(self._index_keys)
+
+            if row == len(self._index_matrix):
+                # Grow geometrically so that repeated upserts are amortized O(1).
+                self._index_matrix = np.concatenate([self._index_matrix, np.empty_like(self._index_matrix)])
+                self._index_norms = np.concatenate([self._index_norms, np.empty_like(self._index_norms)])
+
+            self._index_keys.append(key)
+            self._index_rows[key] = row
+            self._index_namespace_rows.setdefault(entry.namespace, []).append(row)
+        elif self._index_shared:
+            # A query may be scoring a view of this row, copy on write so that it never sees a half-updated row.
+            self._index_matrix = self._index_matrix.copy()
+            self._index_norms = self._index_norms.copy()
+            self._index_shared = False
+
+        self._index_matrix[row] = vector
+        self._index_norms[row] = np.linalg.norm(vector)
+
     def __namespaced_vector_id(self, vector_id: str, *, namespace: Optional[str]) -> str:
         return vector_id if namespace is None else f"{namespace}-{vector_id}"
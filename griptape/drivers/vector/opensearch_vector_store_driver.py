@@ -68,6 +68,21 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
 
         return response["_id"]
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors in OpenSearch with the bulk API.
+
+        Returns:
+            The ids of the indexed documents, in the same order as `entries`.
+        """
+        helpers = import_optional_dependency("opensearchpy.helpers")
+
+        return [
+            item["index"]["_id"]
+            for _, item in helpers.streaming_bulk(
+                self.client, (self._to_bulk_action(entry, **kwargs) for entry in entries)
+            )
+        ]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -163,5 +178,12 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             for hit in response["hits"]["hits"]
         ]
 
+    def _to_bulk_action(self, entry: BaseVectorStoreDriver.Entry, **kwargs) -> dict:
+        return {
+            "_index": self.index_name,
+            "_id": entry.id,
+            "_source": {"vector": entry.vector, "namespace": entry.namespace, "metadata": entry.meta, **kwargs},
+        }
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -24,11 +24,13 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         create_engine_params: Additional configuration params passed when creating the database connection.
         engine: An optional sqlalchemy Postgres engine to use.
         table_name: Optionally specify the name of the table to used to store vectors.
+        upsert_batch_size: The maximum number of rows `upsert_vectors` inserts in one statement.
     """
 
     connection_string: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
     create_engine_params: dict = field(factory=dict, kw_only=True, metadata={"serializable": True})
     table_name: str = field(kw_only=True, metadata={"serializable": True})
+    upsert_batch_size: int = field(default=1000, kw_only=True, metadata={"serializable": True})
     _model: Any = field(default=Factory(lambda self: self.default_vector_model(), takes_self=True))
     _engine: Optional[sqlalchemy.Engine] = field(
         default=None, kw_only=True, alias="engine", metadata={"serializable": False}
@@ -94,6 +96,33 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
             return str(obj.id)
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors with multi-row `INSERT ... ON CONFLICT` statements in one transaction."""
+        sqlalchemy_dialects_postgresql = import_optional_dependency("sqlalchemy.dialects.postgresql")
+
+        # Postgres rejects a statement that updates the same row twice, so only the last entry for each id is kept.
+        rows = list(
+            {
+                entry.id: {"id": entry.id, "vector": entry.vector, "namespace": entry.namespace, "meta": entry.meta}
+                | kwargs
+                for entry in entries
+            }.values()
+        )
+
+        with self.engine.begin() as conn:
+            for i in range(0, len(rows), self.upsert_batch_size):
+                statement = sqlalchemy_dialects_postgresql.insert(self._model).values(
+                    rows[i : i + self.upsert_batch_size]
+                )
+                statement = statement.on_conflict_do_update(
+                    index_elements=[self._model.id],
+                    set_={column: statement.excluded[column] for column in rows[0] if column != "id"},
+                )
+
+                conn.execute(statement)
+
+        return [entry.id for entry in entries]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
@@ -39,6 +39,7 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         collection_name: The name of the Qdrant collection.
         vector_name: An optional name for the vectors.
         content_payload_key: The key for the content payload in the metadata. Defaults: 'data'.
+        upsert_batch_size: The maximum number of points `upsert_vectors` sends in one request. Defaults: 500.
     """
 
     location: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
@@ -61,6 +62,7 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
     collection_name: str = field(kw_only=True, metadata={"serializable": True})
     vector_name: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
     content_payload_key: str = field(default=CONTENT_PAYLOAD_KEY, kw_only=True, metadata={"serializable": True})
+    upsert_batch_size: int = field(default=500, kw_only=True, metadata={"serializable": True})
     _client: Optional[QdrantClient] = field(
         default=None, kw_only=True, alias="client", metadata={"serializable": False}
     )
@@ -157,11 +159,7 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         if vector_id is None:
             vector_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, str(vector)))
 
-        if meta is None:
-            meta = {}
-
-        if content:
-            meta[self.content_payload_key] = content
+        meta = self._get_payload(meta, content=content)
 
         points = import_optional_dependency("qdrant_client.http.models").Batch(
             ids=[vector_id],
@@ -172,6 +170,32 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         self.client.upsert(collection_name=self.collection_name, points=points)
         return vector_id
 
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], *, content: Optional[str] = None, **kwargs
+    ) -> list[str]:
+        """Upsert multiple vectors into the Qdrant collection, up to `upsert_batch_size` points per request.
+
+        Parameters:
+            entries (list[BaseVectorStoreDriver.Entry]): The entries to be upserted.
+            content (Optional[str]): The text content to be included in the payload of every entry.
+
+        Returns:
+            list[str]: The IDs of the upserted vectors.
+        """
+        models = import_optional_dependency("qdrant_client.http.models")
+
+        for i in range(0, len(entries), self.upsert_batch_size):
+            batch = entries[i : i + self.upsert_batch_size]
+            points = models.Batch(
+                ids=[entry.id for entry in batch],
+                vectors=[entry.vector or [] for entry in batch],
+                payloads=[self._get_payload(entry.meta, content=content) for entry in batch],
+            )
+
+            self.client.upsert(collection_name=self.collection_name, points=points)
+
+        return [entry.id for entry in entries]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a vector entry from the Qdrant collection based on its ID.
 
@@ -219,3 +243,11 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
             for entry in results
             if entry.payload is not None
         ]
+
+    def _get_payload(self, meta: Optional[dict], *, content: Optional[str] = None) -> dict:
+        payload = {} if meta is None else dict(meta)
+
+        if content:
+            payload[self.content_payload_key] = content
+
+        return payload
@@ -63,22 +63,23 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Metadata associated with the vector can also be provided.
         """
         vector_id = vector_id or str_to_hash(str(vector))
-        key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(self._generate_key(vector_id, namespace), mapping=self._to_mapping(vector, namespace, meta))
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors in Redis, sending all of their `HSET` commands in one pipeline."""
+        with self.client.pipeline(transaction=False) as pipeline:
+            for entry in entries:
+                pipeline.hset(
+                    self._generate_key(entry.id, entry.namespace),
+                    mapping=self._to_mapping(entry.vector or [], entry.namespace, entry.meta),
+                )
 
-        self.client.hset(key, mapping=mapping)
+            pipeline.execute()
 
-        return vector_id
+        return [entry.id for entry in entries]
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -158,6 +159,19 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
             )
         return query_results
 
+    def _to_mapping(self, vector: list[float], namespace: Optional[str], meta: Optional[dict]) -> dict:
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+        mapping["vec_string"] = json.dumps(vector).encode("utf-8")
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _generate_key(self, vector_id: str, namespace: Optional[str] = None) -> str:
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
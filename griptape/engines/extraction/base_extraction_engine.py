@@ -1,21 +1,41 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from concurrent import futures
+from typing import TYPE_CHECKING, Optional, cast
 
 from attrs import Attribute, Factory, define, field
 
-from griptape.artifacts import ListArtifact, TextArtifact
+from griptape.artifacts import BaseArtifact, ListArtifact, TextArtifact
 from griptape.chunkers import BaseChunker, TextChunker
+from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
+from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from griptape.drivers.prompt import BasePromptDriver
     from griptape.rules import Ruleset
 
 
 @define
-class BaseExtractionEngine(ABC):
+class BaseExtractionEngine(FuturesExecutorMixin, ABC):
+    """Base class for Extraction Engines.
+
+    Text that doesn't fit in a single prompt is chunked once and the chunks are extracted concurrently on the executor
+    returned by `create_futures_executor`. Pass an executor with a bounded number of workers to limit how many
+    requests are made to the Prompt Driver at a time.
+
+    Attributes:
+        max_token_multiplier: Fraction of the Prompt Driver's input tokens a chunk can use.
+        chunk_joiner: String used to join the input artifacts before chunking.
+        prompt_driver: Prompt Driver used to extract data.
+        chunker: Chunker used to split text that doesn't fit in a single prompt.
+        deduplicate: Whether to drop extracted artifacts that are identical to one extracted earlier.
+    """
+
     max_token_multiplier: float = field(default=0.5, kw_only=True)
     chunk_joiner: str = field(default="\n\n", kw_only=True)
     prompt_driver: BasePromptDriver = field(
@@ -28,6 +48,7 @@ class BaseExtractionEngine(ABC):
         ),
         kw_only=True,
     )
+    deduplicate: bool = field(default=False, kw_only=True)
 
     @max_token_multiplier.validator  # pyright: ignore[reportAttributeAccessIssue]
     def validate_max_token_multiplier(self, _: Attribute, max_token_multiplier: int) -> None:
@@ -64,3 +85,91 @@ class BaseExtractionEngine(ABC):
         rulesets: Optional[list[Ruleset]] = None,
         **kwargs,
     ) -> ListArtifact: ...
+
+    def extract_artifacts_stream(
+        self,
+        artifacts: ListArtifact[TextArtifact],
+        *,
+        rulesets: Optional[list[Ruleset]] = None,
+        **kwargs,
+    ) -> Iterator[BaseArtifact]:
+        """Yields extracted artifacts as soon as the chunk they were extracted from completes.
+
+        Chunks are extracted concurrently, so artifacts are yielded in the order their chunks complete rather than the
+        order they appear in the text. Use `extract_artifacts` when the order matters.
+        """
+        yield from self._extract(artifacts, rulesets=rulesets, ordered=False)
+
+    @abstractmethod
+    def _generate_system_prompt(self, rulesets: Optional[list[Ruleset]]) -> str: ...
+
+    @abstractmethod
+    def _generate_user_prompt(self, text: str) -> str: ...
+
+    @abstractmethod
+    def _parse_extraction(self, text: str) -> list[BaseArtifact]: ...
+
+    def _extract(
+        self,
+        artifacts: ListArtifact[TextArtifact],
+        *,
+        rulesets: Optional[list[Ruleset]] = None,
+        ordered: bool = True,
+    ) -> Iterator[BaseArtifact]:
+        """Extracts `artifacts`, yielding the results chunk by chunk.
+
+        Args:
+            artifacts: Artifacts to extract data from.
+            rulesets: Rulesets to include in the system prompt.
+            ordered: Whether to yield chunk results in text order, or as soon as each chunk completes.
+        """
+        system_prompt = self._generate_system_prompt(rulesets)
+        texts = self._chunk_text(
+            self.chunk_joiner.join([a.value for a in cast("list[TextArtifact]", artifacts.value)]), system_prompt
+        )
+        seen = set()
+
+        with self.create_futures_executor() as executor:
+            extraction_futures = [
+                executor.submit(with_contextvars(self._extract_chunk), system_prompt, text) for text in texts
+            ]
+
+            try:
+                for future in extraction_futures if ordered else futures.as_completed(extraction_futures):
+                    for artifact in future.result():
+                        if self.deduplicate:
+                            key = artifact.to_text()
+
+                            if key in seen:
+                                continue
+                            seen.add(key)
+
+                        yield artifact
+            finally:
+                # Don't start chunks nobody is waiting for when the caller stops early or a chunk fails.
+                for future in extraction_futures:
+                    future.cancel()
+
+    def _chunk_text(self, text: str, system_prompt: str) -> list[str]:
+        """Returns `text` if it fits in a single prompt, or the chunks to extract separately if it doesn't."""
+        user_prompt = self._generate_user_prompt(text)
+
+        if (
+            self.prompt_driver.tokenizer.count_input_tokens_left(system_prompt + user_prompt)
+            >= self.min_response_tokens
+        ):
+            return [text]
+
+        return [chunk.value for chunk in self.chunker.chunk(text)]
+
+    def _extract_chunk(self, system_prompt: str, text: str) -> list[BaseArtifact]:
+        return self._parse_extraction(
+            self.prompt_driver.run(
+                PromptStack(
+                    messages=[
+                        Message(system_prompt, role=Message.SYSTEM_ROLE),
+                        Message(self._generate_user_prompt(text), role=Message.USER_ROLE),
+                    ]
+                )
+            ).value
+        )
@@ -6,12 +6,13 @@ from typing import TYPE_CHECKING, Callable, Optional, cast
 
 from attrs import Factory, define, field
 
-from griptape.artifacts import ListArtifact, TextArtifact
-from griptape.common import Message, PromptStack
+from griptape.artifacts import BaseArtifact, ListArtifact, TextArtifact
 from griptape.engines import BaseExtractionEngine
 from griptape.utils import J2
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from griptape.rules import Ruleset
 
 
@@ -35,14 +36,20 @@ class CsvExtractionEngine(BaseExtractionEngine):
         **kwargs,
     ) -> ListArtifact[TextArtifact]:
         return ListArtifact(
-            self._extract_rec(
-                cast("list[TextArtifact]", artifacts.value),
-                [TextArtifact(self.format_header(self.column_names))],
-                rulesets=rulesets,
-            ),
+            [self.__header_row(), *self._extract(artifacts, rulesets=rulesets)],
             item_separator="\n",
         )
 
+    def extract_artifacts_stream(
+        self,
+        artifacts: ListArtifact[TextArtifact],
+        *,
+        rulesets: Optional[list[Ruleset]] = None,
+        **kwargs,
+    ) -> Iterator[TextArtifact]:
+        yield self.__header_row()
+        yield from cast("Iterator[TextArtifact]", super().extract_artifacts_stream(artifacts, rulesets=rulesets))
+
     def text_to_csv_rows(self, text: str) -> list[TextArtifact]:
         rows = []
 
@@ -52,56 +59,17 @@ class CsvExtractionEngine(BaseExtractionEngine):
 
         return rows
 
-    def _extract_rec(
-        self,
-        artifacts: list[TextArtifact],
-        rows: list[TextArtifact],
-        *,
-        rulesets: Optional[list[Ruleset]] = None,
-    ) -> list[TextArtifact]:
-        artifacts_text = self.chunk_joiner.join([a.value for a in artifacts])
-        system_prompt = self.generate_system_template.render(
+    def _generate_system_prompt(self, rulesets: Optional[list[Ruleset]]) -> str:
+        return self.generate_system_template.render(
             column_names=self.column_names,
             rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
         )
-        user_prompt = self.generate_user_template.render(
-            text=artifacts_text,
-        )
 
-        if (
-            self.prompt_driver.tokenizer.count_input_tokens_left(system_prompt + user_prompt)
-            >= self.min_response_tokens
-        ):
-            rows.extend(
-                self.text_to_csv_rows(
-                    self.prompt_driver.run(
-                        PromptStack(
-                            messages=[
-                                Message(system_prompt, role=Message.SYSTEM_ROLE),
-                                Message(user_prompt, role=Message.USER_ROLE),
-                            ]
-                        )
-                    ).value,
-                ),
-            )
-
-            return rows
-        chunks = self.chunker.chunk(artifacts_text)
-        partial_text = self.generate_user_template.render(
-            text=chunks[0].value,
-        )
+    def _generate_user_prompt(self, text: str) -> str:
+        return self.generate_user_template.render(text=text)
 
-        rows.extend(
-            self.text_to_csv_rows(
-                self.prompt_driver.run(
-                    PromptStack(
-                        messages=[
-                            Message(system_prompt, role=Message.SYSTEM_ROLE),
-                            Message(partial_text, role=Message.USER_ROLE),
-                        ]
-                    )
-                ).value,
-            ),
-        )
+    def _parse_extraction(self, text: str) -> list[BaseArtifact]:
+        return [*self.text_to_csv_rows(text)]
 
-        return self._extract_rec(chunks[1:], rows, rulesets=rulesets)
+    def __header_row(self) -> TextArtifact:
+        return TextArtifact(self.format_header(self.column_names))
@@ -6,9 +6,7 @@ from typing import TYPE_CHECKING, Optional, cast
 
 from attrs import Factory, define, field
 
-from griptape.artifacts import JsonArtifact, ListArtifact, TextArtifact
-from griptape.common import PromptStack
-from griptape.common.prompt_stack.messages.message import Message
+from griptape.artifacts import BaseArtifact, JsonArtifact, ListArtifact, TextArtifact
 from griptape.engines import BaseExtractionEngine
 from griptape.utils import J2
 
@@ -32,7 +30,7 @@ class JsonExtractionEngine(BaseExtractionEngine):
         **kwargs,
     ) -> ListArtifact[JsonArtifact]:
         return ListArtifact(
-            self._extract_rec(cast("list[TextArtifact]", artifacts.value), [], rulesets=rulesets),
+            cast("list[JsonArtifact]", list(self._extract(artifacts, rulesets=rulesets))),
             item_separator="\n",
         )
 
@@ -43,56 +41,14 @@ class JsonExtractionEngine(BaseExtractionEngine):
             return [JsonArtifact(e) for e in json.loads(json_matches[-1])]
         return []
 
-    def _extract_rec(
-        self,
-        artifacts: list[TextArtifact],
-        extractions: list[JsonArtifact],
-        *,
-        rulesets: Optional[list[Ruleset]] = None,
-    ) -> list[JsonArtifact]:
-        artifacts_text = self.chunk_joiner.join([a.value for a in artifacts])
-        system_prompt = self.generate_system_template.render(
+    def _generate_system_prompt(self, rulesets: Optional[list[Ruleset]]) -> str:
+        return self.generate_system_template.render(
             json_template_schema=json.dumps(self.template_schema),
             rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
         )
-        user_prompt = self.generate_user_template.render(
-            text=artifacts_text,
-        )
 
-        if (
-            self.prompt_driver.tokenizer.count_input_tokens_left(user_prompt + system_prompt)
-            >= self.min_response_tokens
-        ):
-            extractions.extend(
-                self.json_to_text_artifacts(
-                    self.prompt_driver.run(
-                        PromptStack(
-                            messages=[
-                                Message(system_prompt, role=Message.SYSTEM_ROLE),
-                                Message(user_prompt, role=Message.USER_ROLE),
-                            ]
-                        )
-                    ).value
-                ),
-            )
-
-            return extractions
-        chunks = self.chunker.chunk(artifacts_text)
-        partial_text = self.generate_user_template.render(
-            text=chunks[0].value,
-        )
-
-        extractions.extend(
-            self.json_to_text_artifacts(
-                self.prompt_driver.run(
-                    PromptStack(
-                        messages=[
-                            Message(system_prompt, role=Message.SYSTEM_ROLE),
-                            Message(partial_text, role=Message.USER_ROLE),
-                        ]
-                    )
-                ).value,
-            ),
-        )
+    def _generate_user_prompt(self, text: str) -> str:
+        return self.generate_user_template.render(text=text)
 
-        return self._extract_rec(chunks[1:], extractions, rulesets=rulesets)
+    def _parse_extraction(self, text: str) -> list[BaseArtifact]:
+        return [*self.json_to_text_artifacts(text)]
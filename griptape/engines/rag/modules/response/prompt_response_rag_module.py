@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
@@ -8,7 +9,7 @@ from griptape.artifacts.text_artifact import TextArtifact
 from griptape.configs import Defaults
 from griptape.engines.rag.modules import BaseResponseRagModule
 from griptape.mixins.rule_mixin import RuleMixin
-from griptape.utils import J2
+from griptape.utils import J2, find_max_fitting
 
 if TYPE_CHECKING:
     from griptape.artifacts import BaseArtifact
@@ -27,24 +28,24 @@ class PromptResponseRagModule(BaseResponseRagModule, RuleMixin):
 
     def run(self, context: RagContext) -> BaseArtifact:
         query = context.query
-        tokenizer = self.prompt_driver.tokenizer
-        included_chunks = []
-        system_prompt = self.generate_system_template(context, included_chunks)
+        text_chunks = context.text_chunks
+        system_prompts: dict[int, str] = {}
 
-        for artifact in context.text_chunks:
-            included_chunks.append(artifact)
+        def fits_in_prompt(num_chunks: int) -> bool:
+            system_prompts[num_chunks] = self.generate_system_template(context, text_chunks[:num_chunks])
 
-            system_prompt = self.generate_system_template(context, included_chunks)
-            message_token_count = self.prompt_driver.tokenizer.count_tokens(
-                self.prompt_driver.prompt_stack_to_string(self.generate_prompt_stack(system_prompt, query)),
-            )
+            return self.__count_prompt_tokens(system_prompts[num_chunks], query) < self.__get_token_budget()
 
-            if message_token_count + self.answer_token_offset >= tokenizer.max_input_tokens:
-                included_chunks.pop()
-
-                system_prompt = self.generate_system_template(context, included_chunks)
-
-                break
+        # Every probe renders and counts the full prompt, so the packed chunks are exact.
+        # Per-chunk token counts only seed the search.
+        num_chunks = find_max_fitting(
+            fits_in_prompt,
+            len(text_chunks),
+            estimate=self.__estimate_chunks_to_fit_in_prompt(context) if text_chunks else 0,
+        )
+        system_prompt = system_prompts.get(num_chunks) or self.generate_system_template(
+            context, text_chunks[:num_chunks]
+        )
 
         output = self.prompt_driver.run(self.generate_prompt_stack(system_prompt, query)).to_artifact()
 
@@ -62,3 +63,24 @@ class PromptResponseRagModule(BaseResponseRagModule, RuleMixin):
             params["metadata"] = J2("engines/rag/modules/response/metadata/system.j2").render(metadata=self.metadata)
 
         return J2("engines/rag/modules/response/prompt/system.j2").render(**params)
+
+    def __get_token_budget(self) -> int:
+        return self.prompt_driver.tokenizer.max_input_tokens - self.answer_token_offset
+
+    def __count_prompt_tokens(self, system_prompt: str, query: str) -> int:
+        return self.prompt_driver.tokenizer.count_tokens(
+            self.prompt_driver.prompt_stack_to_string(self.generate_prompt_stack(system_prompt, query)),
+        )
+
+    def __estimate_chunks_to_fit_in_prompt(self, context: RagContext) -> int:
+        tokens_left = self.__get_token_budget() - self.__count_prompt_tokens(
+            self.generate_system_template(context, []), context.query
+        )
+        chunk_token_counts = self.prompt_driver.tokenizer.count_tokens_batch(
+            [chunk.to_text() for chunk in context.text_chunks]
+        )
+
+        return sum(
+            1
+            for _ in itertools.takewhile(lambda tokens: tokens < tokens_left, itertools.accumulate(chunk_token_counts))
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, cast
+import logging
+from typing import TYPE_CHECKING, Literal, Optional, cast
 
 from attrs import Attribute, Factory, define, field
 
@@ -9,15 +10,28 @@ from griptape.chunkers import BaseChunker, TextChunker
 from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
 from griptape.engines import BaseSummaryEngine
-from griptape.utils import J2
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
+from griptape.utils import J2, execute_futures_list, with_contextvars
 
 if TYPE_CHECKING:
     from griptape.drivers.prompt import BasePromptDriver
     from griptape.rules import Ruleset
 
+logger = logging.getLogger(__name__)
+
 
 @define
-class PromptSummaryEngine(BaseSummaryEngine):
+class PromptSummaryEngine(BaseSummaryEngine, FuturesExecutorMixin):
+    """Summarizes text with a Prompt Driver.
+
+    Attributes:
+        strategy: How to summarize text that does not fit into a single prompt.
+            "refine" summarizes chunks one after another, passing the summary so far along with each chunk.
+            "map_reduce" summarizes all chunks concurrently using `create_futures_executor`, then summarizes the
+            partial summaries until they fit into a single prompt.
+    """
+
+    strategy: Literal["refine", "map_reduce"] = field(default="refine", kw_only=True)
     chunk_joiner: str = field(default="\n\n", kw_only=True)
     max_token_multiplier: float = field(default=0.5, kw_only=True)
     generate_system_template: J2 = field(default=Factory(lambda: J2("engines/summary/system.j2")), kw_only=True)
@@ -52,8 +66,57 @@ class PromptSummaryEngine(BaseSummaryEngine):
         )
 
     def summarize_artifacts(self, artifacts: ListArtifact, *, rulesets: Optional[list[Ruleset]] = None) -> TextArtifact:
+        if self.strategy == "map_reduce":
+            return self.summarize_artifacts_map_reduce(cast("list[TextArtifact]", artifacts.value), rulesets=rulesets)
         return self.summarize_artifacts_rec(cast("list[TextArtifact]", artifacts.value), None, rulesets=rulesets)
 
+    def summarize_artifacts_map_reduce(
+        self,
+        artifacts: list[TextArtifact],
+        rulesets: Optional[list[Ruleset]] = None,
+    ) -> TextArtifact:
+        if not artifacts:
+            raise ValueError("No artifacts to summarize")
+
+        system_prompt = self.generate_system_template.render(
+            rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
+        )
+        texts = [a.to_text() for a in artifacts]
+        is_reducing = False
+
+        while True:
+            artifacts_text = self.chunk_joiner.join(texts)
+            user_prompt = self.generate_user_template.render(text=artifacts_text)
+
+            if (
+                self.prompt_driver.tokenizer.count_input_tokens_left(user_prompt + system_prompt)
+                >= self.min_response_tokens
+            ):
+                return self._summarize(system_prompt, user_prompt)
+
+            chunks = self.chunker.chunk(artifacts_text)
+
+            if is_reducing and len(chunks) >= len(texts):
+                # The partial summaries are not getting any shorter, so reducing them again would never finish.
+                logger.warning("PromptSummaryEngine: partial summaries did not shrink, refining them instead")
+
+                return self.summarize_artifacts_rec([TextArtifact(text) for text in texts], rulesets=rulesets)
+
+            with self.create_futures_executor() as futures_executor:
+                summaries = execute_futures_list(
+                    [
+                        futures_executor.submit(
+                            with_contextvars(self._summarize),
+                            system_prompt,
+                            self.generate_user_template.render(text=chunk.value),
+                        )
+                        for chunk in chunks
+                    ]
+                )
+
+            texts = [summary.value for summary in summaries]
+            is_reducing = True
+
     def summarize_artifacts_rec(
         self,
         artifacts: list[TextArtifact],
@@ -78,18 +141,7 @@ class PromptSummaryEngine(BaseSummaryEngine):
             self.prompt_driver.tokenizer.count_input_tokens_left(user_prompt + system_prompt)
             >= self.min_response_tokens
         ):
-            result = self.prompt_driver.run(
-                PromptStack(
-                    messages=[
-                        Message(system_prompt, role=Message.SYSTEM_ROLE),
-                        Message(user_prompt, role=Message.USER_ROLE),
-                    ],
-                ),
-            ).to_artifact()
-
-            if isinstance(result, TextArtifact):
-                return result
-            raise ValueError("Prompt driver did not return a TextArtifact")
+            return self._summarize(system_prompt, user_prompt)
         chunks = self.chunker.chunk(artifacts_text)
 
         partial_text = self.generate_user_template.render(text=chunks[0].value)
@@ -106,3 +158,17 @@ class PromptSummaryEngine(BaseSummaryEngine):
             ).value,
             rulesets=rulesets,
         )
+
+    def _summarize(self, system_prompt: str, user_prompt: str) -> TextArtifact:
+        result = self.prompt_driver.run(
+            PromptStack(
+                messages=[
+                    Message(system_prompt, role=Message.SYSTEM_ROLE),
+                    Message(user_prompt, role=Message.USER_ROLE),
+                ],
+            ),
+        ).to_artifact()
+
+        if isinstance(result, TextArtifact):
+            return result
+        raise ValueError("Prompt driver did not return a TextArtifact")
@@ -25,6 +25,7 @@ from .finish_text_to_speech_event import FinishTextToSpeechEvent
 from .base_audio_transcription_event import BaseAudioTranscriptionEvent
 from .start_audio_transcription_event import StartAudioTranscriptionEvent
 from .finish_audio_transcription_event import FinishAudioTranscriptionEvent
+from .store_artifacts_progress_event import StoreArtifactsProgressEvent
 from .event_bus import EventBus
 
 __all__ = [
@@ -55,5 +56,6 @@ __all__ = [
     "StartStructureRunEvent",
     "StartTaskEvent",
     "StartTextToSpeechEvent",
+    "StoreArtifactsProgressEvent",
     "TextChunkEvent",
 ]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from attrs import define, field
+
+from griptape.events.base_event import BaseEvent
+
+
+@define
+class StoreArtifactsProgressEvent(BaseEvent):
+    """Published by an Artifact Storage after each batch of artifacts it stores.
+
+    Attributes:
+        namespace: The namespace the artifacts are stored in.
+        stored_count: The number of artifacts stored so far.
+        total_count: The total number of artifacts being stored.
+    """
+
+    namespace: str = field(kw_only=True, metadata={"serializable": True})
+    stored_count: int = field(kw_only=True, metadata={"serializable": True})
+    total_count: int = field(kw_only=True, metadata={"serializable": True})
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from attrs import define, field
 
@@ -8,13 +8,39 @@ from griptape.artifacts import ListArtifact, TextArtifact
 from griptape.drivers.sql import BaseSqlDriver
 from griptape.loaders import BaseLoader
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 @define
 class SqlLoader(BaseLoader[str, list[BaseSqlDriver.RowResult], ListArtifact[TextArtifact]]):
+    """Loads the rows of a SQL query as Text Artifacts.
+
+    Attributes:
+        sql_driver: The SQL Driver used to execute queries.
+        format_row: A function that formats a row as text.
+        batch_size: The maximum number of rows in each `ListArtifact` yielded by `load_batches`.
+    """
+
     sql_driver: BaseSqlDriver = field(kw_only=True)
     format_row: Callable[[dict], str] = field(
         default=lambda value: "\n".join(f"{key}: {val}" for key, val in value.items()), kw_only=True
     )
+    batch_size: int = field(default=1000, kw_only=True)
+
+    @batch_size.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    def validate_batch_size(self, _: Any, batch_size: int) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+    def load_batches(self, source: str) -> Iterator[ListArtifact[TextArtifact]]:
+        """Loads the rows of a query in batches of at most `batch_size` rows.
+
+        Rows are streamed from the database when the SQL Driver supports it, so only one batch is held in memory at a
+        time.
+        """
+        for rows in self.sql_driver.execute_query_batches(source, batch_size=self.batch_size):
+            yield self.parse(rows)
 
     def fetch(self, source: str) -> list[BaseSqlDriver.RowResult]:
         return self.sql_driver.execute_query(source) or []
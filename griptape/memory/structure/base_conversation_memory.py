@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -8,7 +9,7 @@ from attrs import Factory, define, field
 from griptape.common import PromptStack
 from griptape.configs import Defaults
 from griptape.mixins.serializable_mixin import SerializableMixin
-from griptape.utils import dict_merge
+from griptape.utils import dict_merge, find_max_fitting
 
 if TYPE_CHECKING:
     from griptape.drivers.memory.conversation import BaseConversationMemoryDriver
@@ -26,6 +27,7 @@ class BaseConversationMemory(SerializableMixin, ABC):
     autoload: bool = field(default=True, kw_only=True)
     autoprune: bool = field(default=True, kw_only=True)
     max_runs: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    _run_token_counts: dict[tuple[str, str], int] = field(factory=dict, init=False)
 
     def __attrs_post_init__(self) -> None:
         if self.autoload:
@@ -77,30 +79,7 @@ class BaseConversationMemory(SerializableMixin, ABC):
         num_runs_to_fit_in_prompt = len(self.runs)
 
         if self.autoprune:
-            should_prune = True
-            temp_stack = PromptStack()
-
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.messages = prompt_stack.messages.copy()
-
-                # Add n runs from Conversation Memory.
-                # Where we insert into the Prompt Stack doesn't matter here
-                # since we only care about the total token count.
-                memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
-                temp_stack.messages.extend(memory_inputs)
-
-                # Convert the Prompt Stack into tokens left.
-                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
-                    prompt_driver.prompt_stack_to_string(temp_stack),
-                )
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
-                else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+            num_runs_to_fit_in_prompt = self._count_runs_to_fit_in_prompt(prompt_driver, prompt_stack)
 
         if num_runs_to_fit_in_prompt:
             memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
@@ -110,3 +89,60 @@ class BaseConversationMemory(SerializableMixin, ABC):
                 prompt_stack.messages[index:index] = memory_inputs
 
         return prompt_stack
+
+    def _count_runs_to_fit_in_prompt(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> int:
+        """Finds the largest number of most recent runs that fit into the Prompt Stack without exceeding the token limit.
+
+        Every probe counts the tokens of the full Prompt Stack, so the result is exact. Cached per-run token counts
+        only seed the search.
+        """
+        return find_max_fitting(
+            lambda num_runs: self.__fits_in_prompt(prompt_driver, prompt_stack, num_runs),
+            len(self.runs),
+            estimate=self.__estimate_runs_to_fit_in_prompt(prompt_driver, prompt_stack) if self.runs else 0,
+        )
+
+    def __fits_in_prompt(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack, num_runs: int) -> bool:
+        # Where we insert into the Prompt Stack doesn't matter here
+        # since we only care about the total token count.
+        temp_stack = PromptStack(messages=[*prompt_stack.messages, *self.to_prompt_stack(num_runs).messages])
+
+        return prompt_driver.tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(temp_stack)) > 0
+
+    def __estimate_runs_to_fit_in_prompt(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> int:
+        tokenizer = prompt_driver.tokenizer
+        tokens_left = tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(prompt_stack))
+        # Each run was counted as a Prompt Stack of its own, which includes the Prompt Stack's fixed overhead once.
+        overhead = tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(PromptStack()))
+        run_token_counts = [token_count - overhead for token_count in self.__get_run_token_counts(prompt_driver)]
+
+        # Prefix sums from the most recent run backwards.
+        suffix_token_counts = itertools.accumulate(reversed(run_token_counts))
+
+        return sum(1 for _ in itertools.takewhile(lambda tokens: tokens < tokens_left, suffix_token_counts))
+
+    def __get_run_token_counts(self, prompt_driver: BasePromptDriver) -> list[int]:
+        tokenizer = prompt_driver.tokenizer
+        tokenizer_key = f"{type(prompt_driver).__name__}:{type(tokenizer).__name__}:{tokenizer.model}"
+        keys = [(run.id, tokenizer_key) for run in self.runs]
+        missing = [(key, run) for key, run in zip(keys, self.runs) if key not in self._run_token_counts]
+
+        if missing:
+            run_strings = []
+
+            for _, run in missing:
+                run_stack = PromptStack()
+                run_stack.add_user_message(run.input)
+                run_stack.add_assistant_message(run.output)
+                run_strings.append(prompt_driver.prompt_stack_to_string(run_stack))
+
+            if len(self._run_token_counts) + len(missing) > 2 * len(self.runs):
+                # Drop counts of runs that have been pruned from memory.
+                self._run_token_counts = {
+                    key: self._run_token_counts[key] for key in keys if key in self._run_token_counts
+                }
+
+            for (key, _), token_count in zip(missing, tokenizer.count_tokens_batch(run_strings)):
+                self._run_token_counts[key] = token_count
+
+        return [self._run_token_counts[key] for key in keys]
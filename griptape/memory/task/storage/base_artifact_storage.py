@@ -14,6 +14,14 @@ class BaseArtifactStorage(ABC):
     @abstractmethod
     def store_artifact(self, namespace: str, artifact: BaseArtifact) -> None: ...
 
+    def store_artifacts(self, namespace: str, artifacts: list[BaseArtifact]) -> None:
+        """Stores multiple artifacts in a namespace.
+
+        Storages that can store artifacts in bulk override this method.
+        """
+        for artifact in artifacts:
+            self.store_artifact(namespace, artifact)
+
     @abstractmethod
     def load_artifacts(self, namespace: str) -> ListArtifact: ...
 
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from attrs import Factory, define, field
 
 from griptape.artifacts import BaseArtifact, ListArtifact, TextArtifact
 from griptape.configs import Defaults
+from griptape.events import EventBus, StoreArtifactsProgressEvent
 from griptape.memory.task.storage import BaseArtifactStorage
 
 if TYPE_CHECKING:
@@ -14,9 +15,23 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class TextArtifactStorage(BaseArtifactStorage):
+    """An Artifact Storage that stores Text Artifacts in a Vector Store.
+
+    Attributes:
+        vector_store_driver: The Vector Store Driver used to store the artifacts.
+        batch_size: The maximum number of artifacts `store_artifacts` embeds and upserts at a time. Bounds the number of
+            embedding requests in flight and the number of vectors held in memory.
+    """
+
     vector_store_driver: BaseVectorStoreDriver = field(
         default=Factory(lambda: Defaults.drivers_config.vector_store_driver)
     )
+    batch_size: int = field(default=100)
+
+    @batch_size.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    def validate_batch_size(self, _: Any, batch_size: int) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
 
     def can_store(self, artifact: BaseArtifact) -> bool:
         return isinstance(artifact, TextArtifact)
@@ -27,5 +42,23 @@ class TextArtifactStorage(BaseArtifactStorage):
         else:
             raise ValueError("Artifact must be of instance TextArtifact")
 
+    def store_artifacts(self, namespace: str, artifacts: list[BaseArtifact]) -> None:
+        text_artifacts = [artifact for artifact in artifacts if isinstance(artifact, TextArtifact)]
+
+        if len(text_artifacts) != len(artifacts):
+            raise ValueError("Artifacts must be of instance TextArtifact")
+
+        for i in range(0, len(text_artifacts), self.batch_size):
+            batch = text_artifacts[i : i + self.batch_size]
+
+            # Drivers that override `upsert` still get one `upsert` call per artifact.
+            self.vector_store_driver.upsert_collection({namespace: batch})
+
+            EventBus.publish_event(
+                StoreArtifactsProgressEvent(
+                    namespace=namespace, stored_count=i + len(batch), total_count=len(text_artifacts)
+                )
+            )
+
     def load_artifacts(self, namespace: str) -> ListArtifact:
         return self.vector_store_driver.load_artifacts(namespace=namespace)
@@ -104,8 +104,7 @@ class TaskMemory(ActivityMixin, SerializableMixin):
             return ErrorArtifact("error storing tool output in memory")
         if storage:
             if isinstance(artifact, ListArtifact):
-                for a in artifact.value:
-                    storage.store_artifact(namespace, a)
+                storage.store_artifacts(namespace, artifact.value)
 
                 self.namespace_storage[namespace] = storage
 
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from abc import ABC
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Callable, Optional
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from griptape.utils.rate_limiter import RateLimiter
+
+
+@define(slots=False)
+class RateLimitMixin(ABC):
+    rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
+
+    @contextmanager
+    def rate_limited(self, estimate_tokens: Optional[Callable[[], int]] = None) -> Iterator[None]:
+        """Holds `rate_limiter`, if there is one, for the duration of one request.
+
+        Args:
+            estimate_tokens: Optional function that estimates the request's tokens. Only called if the limiter
+                budgets tokens.
+        """
+        if self.rate_limiter is None:
+            yield
+        else:
+            with self.rate_limiter.acquire(self.__estimate_tokens(estimate_tokens)):
+                yield
+
+    @asynccontextmanager
+    async def arate_limited(self, estimate_tokens: Optional[Callable[[], int]] = None) -> AsyncIterator[None]:
+        """Asynchronous version of `rate_limited`."""
+        if self.rate_limiter is None:
+            yield
+        else:
+            async with self.rate_limiter.aacquire(self.__estimate_tokens(estimate_tokens)):
+                yield
+
+    def __estimate_tokens(self, estimate_tokens: Optional[Callable[[], int]]) -> int:
+        if estimate_tokens is None or self.rate_limiter is None or self.rate_limiter.tokens_per_minute is None:
+            return 0
+
+        return estimate_tokens()
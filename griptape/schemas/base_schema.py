@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import threading
 from abc import ABC
 from collections.abc import Sequence
 from enum import Enum
-from typing import Any, Literal, Optional, TypeVar, Union, _SpecialForm, get_args, get_origin
+from typing import Any, ClassVar, Literal, Optional, TypeVar, Union, _SpecialForm, get_args, get_origin
 
 import attrs
 from marshmallow import INCLUDE, Schema, fields
@@ -26,6 +27,11 @@ class BaseSchema(Schema):
         BaseModel: PydanticModel,
     }
 
+    # Generated schema classes keyed by (schema class, attrs class, types_overrides, serializable_overrides).
+    # Reentrant since generating a schema recursively generates the schemas of its nested fields.
+    _schema_cache: ClassVar[dict[tuple, type]] = {}
+    _schema_cache_lock: ClassVar[threading.RLock] = threading.RLock()
+
     @classmethod
     def from_attrs_cls(
         cls,
@@ -36,26 +42,80 @@ class BaseSchema(Schema):
     ) -> type:
         """Generate a Schema from an attrs class.
 
+        Generated Schemas are cached, subsequent calls with the same arguments return the same Schema class.
+        Use `BaseSchema.clear_schema_cache` to force regeneration.
+
         Args:
             attrs_cls: An attrs class.
             types_overrides: A dictionary of types to override when resolving types.
             serializable_overrides: A dictionary of field names to whether they are serializable.
         """
+        try:
+            cache_key = (
+                cls,
+                attrs_cls,
+                frozenset((types_overrides or {}).items()),
+                frozenset((serializable_overrides or {}).items()),
+            )
+            hash(cache_key)
+        except TypeError:
+            # Unhashable overrides can't be cached, fall back to generating a fresh Schema.
+            return cls._build_schema_cls(
+                attrs_cls, types_overrides=types_overrides, serializable_overrides=serializable_overrides
+            )
+
+        schema_cls = cls._schema_cache.get(cache_key)
+        if schema_cls is None:
+            with cls._schema_cache_lock:
+                schema_cls = cls._schema_cache.get(cache_key)
+                if schema_cls is None:
+                    schema_cls = cls._build_schema_cls(
+                        attrs_cls, types_overrides=types_overrides, serializable_overrides=serializable_overrides
+                    )
+                    cls._schema_cache[cache_key] = schema_cls
+
+        return schema_cls
+
+    @classmethod
+    def clear_schema_cache(cls, attrs_cls: Optional[type] = None) -> None:
+        """Clear cached Schemas generated by `from_attrs_cls`.
+
+        Args:
+            attrs_cls: An optional attrs class to clear the Schemas of. Clears all Schemas if not provided.
+        """
+        with cls._schema_cache_lock:
+            if attrs_cls is None:
+                cls._schema_cache.clear()
+            else:
+                for key in [key for key in cls._schema_cache if key[1] is attrs_cls]:
+                    del cls._schema_cache[key]
+
+    @classmethod
+    def _build_schema_cls(
+        cls,
+        attrs_cls: type,
+        *,
+        types_overrides: Optional[dict[str, type]] = None,
+        serializable_overrides: Optional[dict[str, bool]] = None,
+    ) -> type:
         from marshmallow import post_load
 
         if serializable_overrides is None:
             serializable_overrides = {}
 
+        deserialization_keys = {
+            field.name: field.metadata["deserialization_key"]
+            for field in attrs.fields(attrs_cls)
+            if field.metadata.get("deserialization_key")
+        }
+
         class SubSchema(cls):
             @post_load
             def make_obj(self, data: Any, **kwargs) -> Any:
                 # Map the serialized keys to their correct deserialization keys
-                fields = attrs.fields_dict(attrs_cls)
                 for key in list(data):
-                    if key in fields:
-                        field = fields[key]
-                        if field.metadata.get("deserialization_key"):
-                            data[field.metadata["deserialization_key"]] = data.pop(key)
+                    if key in deserialization_keys:
+                        data[deserialization_keys[key]] = data.pop(key)
 
                 return attrs_cls(**data)
 
@@ -241,6 +301,7 @@ class BaseSchema(Schema):
         )
         from griptape.drivers.assistant import BaseAssistantDriver
         from griptape.drivers.audio_transcription import BaseAudioTranscriptionDriver
+        from griptape.drivers.cache import BaseCacheDriver
         from griptape.drivers.embedding import BaseEmbeddingDriver
         from griptape.drivers.file_manager import BaseFileManagerDriver
         from griptape.drivers.image_generation import BaseImageGenerationDriver, BaseMultiModelImageGenerationDriver
@@ -268,7 +329,7 @@ class BaseSchema(Schema):
         from griptape.tasks import BaseTask
         from griptape.tokenizers import BaseTokenizer
         from griptape.tools import BaseTool
-        from griptape.utils import import_optional_dependency, is_dependency_installed
+        from griptape.utils import RateLimiter, import_optional_dependency, is_dependency_installed
 
         if types_override is None:
             types_override = {}
@@ -294,6 +355,8 @@ class BaseSchema(Schema):
                 "BaseObservabilityDriver": BaseObservabilityDriver,
                 "BaseAssistantDriver": BaseAssistantDriver,
                 "BaseStructureRunDriver": BaseStructureRunDriver,
+                "BaseCacheDriver": BaseCacheDriver,
+                "RateLimiter": RateLimiter,
                 "BaseArtifact": BaseArtifact,
                 "BaseMetaEntry": BaseMetaEntry,
                 "PromptStack": PromptStack,
@@ -339,6 +402,12 @@ class BaseSchema(Schema):
                 "Anthropic": import_optional_dependency("anthropic").Anthropic
                 if is_dependency_installed("anthropic")
                 else Any,
+                "AsyncAnthropic": import_optional_dependency("anthropic").AsyncAnthropic
+                if is_dependency_installed("anthropic")
+                else Any,
+                "AsyncClient": import_optional_dependency("ollama").AsyncClient
+                if is_dependency_installed("ollama")
+                else Any,
                 "BedrockRuntimeClient": import_optional_dependency("mypy_boto3_bedrock_runtime").BedrockRuntimeClient
                 if is_dependency_installed("mypy_boto3_bedrock_runtime")
                 else Any,
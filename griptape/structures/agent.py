@@ -72,6 +72,7 @@ class Agent(Structure):
 
     def add_task(self, task: BaseTask) -> BaseTask:
         self._tasks.clear()
+        self._clear_task_index()
 
         task.preprocess(self)
 
@@ -90,6 +91,11 @@ class Agent(Structure):
 
         return self
 
+    async def try_arun(self, *args) -> Agent:
+        await self.task.arun()
+
+        return self
+
     def _init_task(self) -> None:
         if self.stream is None:
             with validators.disabled():
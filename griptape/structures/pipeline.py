@@ -25,6 +25,7 @@ class Pipeline(Structure):
             task.parent_ids.append(self.output_task.id)
 
         self._tasks.append(task)
+        self._index_task(task)
 
         return task
 
@@ -45,6 +46,7 @@ class Pipeline(Structure):
 
         parent_index = self.tasks.index(parent_task)
         self._tasks.insert(parent_index + 1, task)
+        self._index_task(task)
 
         return task
 
@@ -54,6 +56,16 @@ class Pipeline(Structure):
 
         return self
 
+    async def try_arun(self, *args) -> Pipeline:
+        task = self.input_task
+
+        while task is not None:
+            if isinstance(await task.arun(), ErrorArtifact) and self.fail_fast:
+                break
+            task = next(iter(task.children), None)
+
+        return self
+
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from queue import Queue
@@ -21,7 +22,7 @@ from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.utils.contextvars_utils import with_contextvars
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
     from griptape.artifacts import BaseArtifact
     from griptape.memory.structure import BaseConversationMemory
@@ -50,6 +51,9 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
     fail_fast: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _execution_args: tuple = ()
     _event_queue: Queue[BaseEvent] = field(default=Factory(lambda: Queue()), init=False)
+    _task_index: dict[str, BaseTask] = field(factory=dict, init=False)
+    _task_index_tasks: Optional[list] = field(default=None, init=False)
+    _task_index_size: int = field(default=0, init=False)
 
     def __attrs_post_init__(self) -> None:
         tasks = self._tasks.copy()
@@ -92,7 +96,7 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
     @property
     def task_outputs(self) -> dict[str, Optional[BaseArtifact]]:
-        return {task.id: task.output for task in self.tasks}
+        return {task_id: task.output for task_id, task in self._get_task_index().items()}
 
     @property
     def finished_tasks(self) -> list[BaseTask]:
@@ -110,10 +114,7 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
         raise ValueError(f"Task with id {task_id} doesn't exist.")
 
     def try_find_task(self, task_id: str) -> Optional[BaseTask]:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._get_task_index().get(task_id)
 
     def add_tasks(self, *tasks: BaseTask | list[BaseTask]) -> list[BaseTask]:
         added_tasks = []
@@ -127,6 +128,28 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
     def context(self, task: BaseTask) -> dict[str, Any]:
         return {"args": self.execution_args, "structure": self}
 
+    def _get_task_index(self) -> dict[str, BaseTask]:
+        # `_tasks` can be reassigned or mutated directly, so rebuild the index whenever the list or its size changes.
+        if self._task_index_tasks is not self._tasks or self._task_index_size != len(self._tasks):
+            self._task_index = {}
+
+            for task in self.tasks:
+                self._task_index.setdefault(task.id, task)
+
+            self._task_index_tasks = self._tasks
+            self._task_index_size = len(self._tasks)
+
+        return self._task_index
+
+    def _index_task(self, task: BaseTask) -> None:
+        """Adds a Task that was just inserted into `_tasks` to the index without rebuilding it."""
+        if self._task_index_tasks is self._tasks and self._task_index_size == len(self._tasks) - 1:
+            self._task_index.setdefault(task.id, task)
+            self._task_index_size += 1
+
+    def _clear_task_index(self) -> None:
+        self._task_index_tasks = None
+
     def resolve_relationships(self) -> None:
         task_by_id = {}
         for task in self.tasks:
@@ -225,5 +248,54 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
                     yield event
             t.join()
 
+    async def arun(self, *args) -> Structure:
+        """Asynchronous version of `run`."""
+        self.before_run(args)
+
+        result = await self.try_arun(*args)
+
+        self.after_run()
+
+        return result
+
+    async def arun_stream(self, *args, event_types: Optional[list[type[BaseEvent]]] = None) -> AsyncIterator[BaseEvent]:
+        """Asynchronous version of `run_stream`.
+
+        The Structure runs as a task on the current event loop instead of in a separate thread.
+        """
+        if event_types is None:
+            event_types = [BaseEvent]
+        elif FinishStructureRunEvent not in event_types:
+            event_types = [*event_types, FinishStructureRunEvent]
+
+        loop = asyncio.get_running_loop()
+        event_queue: asyncio.Queue[Optional[BaseEvent]] = asyncio.Queue()
+
+        def on_event(event: BaseEvent) -> None:
+            # Tasks that run in worker threads publish their events from those threads.
+            loop.call_soon_threadsafe(event_queue.put_nowait, event)
+
+        # The run copies the current context, so the listener only receives this run's events.
+        with EventListener(on_event, event_types=event_types):
+            run_task = asyncio.ensure_future(self.arun(*args))
+        run_task.add_done_callback(lambda _: event_queue.put_nowait(None))
+
+        try:
+            while (event := await event_queue.get()) is not None:
+                if isinstance(event, FinishStructureRunEvent) and event.structure_id == self.id:
+                    break
+                yield event
+
+            await run_task
+        finally:
+            run_task.cancel()
+
     @abstractmethod
     def try_run(self, *args) -> Structure: ...
+
+    async def try_arun(self, *args) -> Structure:
+        """Asynchronous version of `try_run`.
+
+        Runs `try_run` in a worker thread. Structures that can await their Tasks should override this.
+        """
+        return await asyncio.to_thread(self.try_run, *args)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 from concurrent import futures
 from graphlib import TopologicalSorter
 from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import define
+from attrs import define, field
 
 from griptape.artifacts import ErrorArtifact
 from griptape.common import observable
@@ -13,12 +16,16 @@ from griptape.structures import Structure
 from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from griptape.artifacts import BaseArtifact
     from griptape.tasks import BaseTask
 
 
 @define
 class Workflow(Structure, FuturesExecutorMixin):
+    max_concurrency: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+
     @property
     def input_task(self) -> Optional[BaseTask]:
         return self.order_tasks()[0] if self.tasks else None
@@ -46,6 +53,7 @@ class Workflow(Structure, FuturesExecutorMixin):
         task.preprocess(self)
 
         self._tasks.append(task)
+        self._index_task(task)
 
         return task
 
@@ -96,31 +104,82 @@ class Workflow(Structure, FuturesExecutorMixin):
 
         # Insert the new task once, just after the last parent task
         self._tasks.insert(last_parent_index + 1, task)
+        self._index_task(task)
 
         return task
 
     @observable
     def try_run(self, *args) -> Workflow:
-        exit_loop = False
+        tasks_by_id = self._get_task_index()
+        sorter = TopologicalSorter(self.to_graph())
+        sorter.prepare()
+
+        # Heap of (-priority, insertion order, task id) so that ties run in topological order.
+        ready_tasks: list[tuple[int, int, str]] = []
+        running_tasks: dict[futures.Future, BaseTask] = {}
+        counter = itertools.count()
 
         with self.create_futures_executor() as futures_executor:
-            while not self.is_finished() and not exit_loop:
-                futures_list = {}
-                ordered_tasks = self.order_tasks()
+            while True:
+                self.__queue_ready_tasks(sorter, tasks_by_id, ready_tasks, counter)
+
+                while ready_tasks and (self.max_concurrency is None or len(running_tasks) < self.max_concurrency):
+                    task = tasks_by_id[heapq.heappop(ready_tasks)[2]]
+                    running_tasks[futures_executor.submit(with_contextvars(task.run))] = task
+
+                if not running_tasks:
+                    break
+
+                done_futures, _ = futures.wait(running_tasks, return_when=futures.FIRST_COMPLETED)
+
+                for future in done_futures:
+                    task = running_tasks.pop(future)
+
+                    if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                        return self
+
+                    sorter.done(task.id)
+
+            return self
+
+    async def try_arun(self, *args) -> Workflow:
+        tasks_by_id = self._get_task_index()
+        sorter = TopologicalSorter(self.to_graph())
+        sorter.prepare()
 
-                for task in ordered_tasks:
-                    if task.can_run():
-                        future = futures_executor.submit(with_contextvars(task.run))
-                        futures_list[future] = task
+        ready_tasks: list[tuple[int, int, str]] = []
+        running_tasks: dict[asyncio.Future, BaseTask] = {}
+        counter = itertools.count()
+
+        try:
+            while True:
+                self.__queue_ready_tasks(sorter, tasks_by_id, ready_tasks, counter)
+
+                while ready_tasks and (self.max_concurrency is None or len(running_tasks) < self.max_concurrency):
+                    task = tasks_by_id[heapq.heappop(ready_tasks)[2]]
+                    running_tasks[asyncio.ensure_future(task.arun())] = task
+
+                if not running_tasks:
+                    break
+
+                done_futures, _ = await asyncio.wait(running_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done_futures:
+                    task = running_tasks.pop(future)
 
-                # Wait for all tasks to complete
-                for future in futures.as_completed(futures_list):
                     if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
-                        exit_loop = True
+                        # Tasks that are already running finish, as they do in `try_run`.
+                        if running_tasks:
+                            await asyncio.wait(running_tasks)
+
+                        return self
 
-                        break
+                    sorter.done(task.id)
 
             return self
+        finally:
+            for future in running_tasks:
+                future.cancel()
 
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
@@ -138,20 +197,38 @@ class Workflow(Structure, FuturesExecutorMixin):
         return context
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
-
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
+        tasks = self.tasks
+        graph: dict[str, set[str]] = {task.id: set() for task in tasks}
 
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
     def order_tasks(self) -> list[BaseTask]:
         return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
 
+    def __queue_ready_tasks(
+        self,
+        sorter: TopologicalSorter,
+        tasks_by_id: dict[str, BaseTask],
+        ready_tasks: list[tuple[int, int, str]],
+        counter: Iterator[int],
+    ) -> None:
+        ready_task_ids = sorter.get_ready()
+
+        while ready_task_ids:
+            for task_id in ready_task_ids:
+                if tasks_by_id[task_id].can_run():
+                    heapq.heappush(ready_tasks, (-tasks_by_id[task_id].priority, next(counter), task_id))
+                else:
+                    # Skipped tasks are done without running, which may make their children ready.
+                    sorter.done(task_id)
+
+            ready_task_ids = sorter.get_ready()
+
     def __link_task_to_children(self, task: BaseTask, child_tasks: list[BaseTask]) -> None:
         for child_task in child_tasks:
             # Link the new task to the child task
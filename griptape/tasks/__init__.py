@@ -1,26 +1,61 @@
-from .base_task import BaseTask
-from .base_subtask import BaseSubtask
-from .base_text_input_task import BaseTextInputTask
-from .actions_subtask import ActionsSubtask
-from .output_schema_validation_subtask import OutputSchemaValidationSubtask
-from .prompt_task import PromptTask
-from .toolkit_task import ToolkitTask
-from .text_summary_task import TextSummaryTask
-from .tool_task import ToolTask
-from .rag_task import RagTask
-from .extraction_task import ExtractionTask
-from .base_image_generation_task import BaseImageGenerationTask
-from .code_execution_task import CodeExecutionTask
-from .prompt_image_generation_task import PromptImageGenerationTask
-from .inpainting_image_generation_task import InpaintingImageGenerationTask
-from .outpainting_image_generation_task import OutpaintingImageGenerationTask
-from .variation_image_generation_task import VariationImageGenerationTask
-from .base_audio_generation_task import BaseAudioGenerationTask
-from .text_to_speech_task import TextToSpeechTask
-from .structure_run_task import StructureRunTask
-from .audio_transcription_task import AudioTranscriptionTask
-from .assistant_task import AssistantTask
-from .branch_task import BranchTask
+from typing import TYPE_CHECKING
+
+from griptape.utils.import_utils import lazy_imports
+
+if TYPE_CHECKING:
+    from .base_task import BaseTask
+    from .base_subtask import BaseSubtask
+    from .base_text_input_task import BaseTextInputTask
+    from .actions_subtask import ActionsSubtask
+    from .output_schema_validation_subtask import OutputSchemaValidationSubtask
+    from .prompt_task import PromptTask
+    from .toolkit_task import ToolkitTask
+    from .text_summary_task import TextSummaryTask
+    from .tool_task import ToolTask
+    from .rag_task import RagTask
+    from .extraction_task import ExtractionTask
+    from .base_image_generation_task import BaseImageGenerationTask
+    from .code_execution_task import CodeExecutionTask
+    from .prompt_image_generation_task import PromptImageGenerationTask
+    from .inpainting_image_generation_task import InpaintingImageGenerationTask
+    from .outpainting_image_generation_task import OutpaintingImageGenerationTask
+    from .variation_image_generation_task import VariationImageGenerationTask
+    from .base_audio_generation_task import BaseAudioGenerationTask
+    from .text_to_speech_task import TextToSpeechTask
+    from .structure_run_task import StructureRunTask
+    from .audio_transcription_task import AudioTranscriptionTask
+    from .assistant_task import AssistantTask
+    from .branch_task import BranchTask
+
+
+_LAZY_IMPORTS = {
+    "BaseTask": ".base_task",
+    "BaseSubtask": ".base_subtask",
+    "BaseTextInputTask": ".base_text_input_task",
+    "ActionsSubtask": ".actions_subtask",
+    "OutputSchemaValidationSubtask": ".output_schema_validation_subtask",
+    "PromptTask": ".prompt_task",
+    "ToolkitTask": ".toolkit_task",
+    "TextSummaryTask": ".text_summary_task",
+    "ToolTask": ".tool_task",
+    "RagTask": ".rag_task",
+    "ExtractionTask": ".extraction_task",
+    "BaseImageGenerationTask": ".base_image_generation_task",
+    "CodeExecutionTask": ".code_execution_task",
+    "PromptImageGenerationTask": ".prompt_image_generation_task",
+    "InpaintingImageGenerationTask": ".inpainting_image_generation_task",
+    "OutpaintingImageGenerationTask": ".outpainting_image_generation_task",
+    "VariationImageGenerationTask": ".variation_image_generation_task",
+    "BaseAudioGenerationTask": ".base_audio_generation_task",
+    "TextToSpeechTask": ".text_to_speech_task",
+    "StructureRunTask": ".structure_run_task",
+    "AudioTranscriptionTask": ".audio_transcription_task",
+    "AssistantTask": ".assistant_task",
+    "BranchTask": ".branch_task",
+}
+
+__getattr__, __dir__ = lazy_imports(globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "ActionsSubtask",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from abc import ABC, abstractmethod
@@ -39,6 +40,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
     parent_ids: list[str] = field(factory=list, kw_only=True, metadata={"serializable": True})
     child_ids: list[str] = field(factory=list, kw_only=True, metadata={"serializable": True})
     max_meta_memory_entries: Optional[int] = field(default=20, kw_only=True, metadata={"serializable": True})
+    priority: int = field(default=0, kw_only=True, metadata={"serializable": True})
     structure: Optional[Structure] = field(default=None, kw_only=True)
 
     output: Optional[T] = field(default=None, init=False)
@@ -115,7 +117,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
         if self.id not in parent.child_ids:
             parent.child_ids.append(self.id)
 
-        if self.structure is not None and parent not in self.structure.tasks:
+        if self.structure is not None and self.structure.try_find_task(parent.id) is None:
             self.structure.add_task(parent)
 
         return self
@@ -131,7 +133,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
         if self.id not in child.parent_ids:
             child.parent_ids.append(self.id)
 
-        if self.structure is not None and child not in self.structure.tasks:
+        if self.structure is not None and self.structure.try_find_task(child.id) is None:
             self.structure.add_task(child)
 
         return self
@@ -186,6 +188,27 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
 
         return self.output
 
+    async def arun(self, *args) -> T:
+        """Asynchronous version of `run`."""
+        try:
+            self._execution_args = args
+
+            self.state = BaseTask.State.RUNNING
+
+            self.before_run()
+
+            self.output = await self.try_arun()
+
+            self.after_run()
+        except Exception as e:
+            logger.exception("%s %s\n%s", self.__class__.__name__, self.id, e)
+
+            self.output = cast("T", ErrorArtifact(str(e), exception=e))
+        finally:
+            self.state = BaseTask.State.FINISHED
+
+        return self.output
+
     def after_run(self) -> None:
         super().after_run()
         if self.structure is not None:
@@ -224,6 +247,13 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
     @abstractmethod
     def try_run(self) -> T: ...
 
+    async def try_arun(self) -> T:
+        """Asynchronous version of `try_run`.
+
+        Runs `try_run` in a worker thread. Tasks that can await their work should override this.
+        """
+        return await asyncio.to_thread(self.try_run)
+
     @property
     def full_context(self) -> dict[str, Any]:
         # Need to deep copy so that the serialized context doesn't contain non-serializable data
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import TYPE_CHECKING, Callable, Optional, Union
@@ -212,12 +213,25 @@ class PromptTask(
         output = self.prompt_driver.run(self.prompt_stack).to_artifact(
             meta={"is_react_prompt": not self.prompt_driver.use_native_tools}
         )
-        for subtask_runner in self.subtask_runners:
-            output = subtask_runner(output)
 
-        if isinstance(output, (ListArtifact, TextArtifact, AudioArtifact, JsonArtifact, ModelArtifact, ErrorArtifact)):
-            return output
-        raise ValueError(f"Unsupported output type: {type(output)}")
+        return self.__run_subtask_runners(output)
+
+    async def try_arun(
+        self,
+    ) -> ListArtifact | TextArtifact | AudioArtifact | GenericArtifact | JsonArtifact | ErrorArtifact:
+        self.subtasks.clear()
+        if self.response_stop_sequence not in self.prompt_driver.tokenizer.stop_sequences:
+            self.prompt_driver.tokenizer.stop_sequences.extend([self.response_stop_sequence])
+
+        output = (await self.prompt_driver.arun(self.prompt_stack)).to_artifact(
+            meta={"is_react_prompt": not self.prompt_driver.use_native_tools}
+        )
+
+        if self.tools or self.output_schema is not None:
+            # Subtasks run Tools and prompt the driver again synchronously, so they can't run on the event loop.
+            return await asyncio.to_thread(self.__run_subtask_runners, output)
+
+        return self.__run_subtask_runners(output)
 
     def preprocess(self, structure: Structure) -> BaseTask:
         super().preprocess(structure)
@@ -342,6 +356,16 @@ class PromptTask(
 
         return subtask.output
 
+    def __run_subtask_runners(
+        self, output: BaseArtifact
+    ) -> ListArtifact | TextArtifact | AudioArtifact | GenericArtifact | JsonArtifact | ErrorArtifact:
+        for subtask_runner in self.subtask_runners:
+            output = subtask_runner(output)
+
+        if isinstance(output, (ListArtifact, TextArtifact, AudioArtifact, JsonArtifact, ModelArtifact, ErrorArtifact)):
+            return output
+        raise ValueError(f"Unsupported output type: {type(output)}")
+
     def _process_task_input(
         self,
         task_input: str | tuple | list | BaseArtifact | Callable[[BaseTask], BaseArtifact],
@@ -60,6 +60,19 @@ class BaseTokenizer(ABC, SerializableMixin):
     @abstractmethod
     def count_tokens(self, text: str) -> int: ...
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of each text.
+
+        Tokenizers whose backend can encode many texts at once override this method.
+
+        Args:
+            texts: The texts to count tokens for.
+
+        Returns:
+            The token count of each text, in the same order as `texts`.
+        """
+        return [self.count_tokens(text) for text in texts]
+
     def _default_max_input_tokens(self) -> int:
         tokens = next(
             (
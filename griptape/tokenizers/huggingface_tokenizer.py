@@ -29,3 +29,6 @@ class HuggingFaceTokenizer(BaseTokenizer):
 
     def count_tokens(self, text: str) -> int:
         return len(self.tokenizer.encode(text))  # pyright: ignore[reportArgumentType]
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        return [len(input_ids) for input_ids in self.tokenizer(texts)["input_ids"]]  # pyright: ignore[reportArgumentType]
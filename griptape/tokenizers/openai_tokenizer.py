@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Optional
 
 import tiktoken
@@ -18,6 +19,7 @@ class OpenAiTokenizer(BaseTokenizer):
     DEFAULT_MAX_TOKENS = 2049
     DEFAULT_MAX_OUTPUT_TOKENS = 4096
     TOKEN_OFFSET = 8
+    BATCH_NUM_THREADS = 8
 
     # https://platform.openai.com/docs/models/gpt-4-and-gpt-4-turbo
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {
@@ -56,13 +58,35 @@ class OpenAiTokenizer(BaseTokenizer):
         default=Factory(lambda self: self._default_max_output_tokens(), takes_self=True),
         alias="max_output_tokens",
     )
+    _encodings: dict[str, tiktoken.Encoding] = field(factory=dict, init=False)
 
     @property
     def encoding(self) -> tiktoken.Encoding:
-        try:
-            return tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            return tiktoken.get_encoding(self.DEFAULT_ENCODING)
+        return self._get_encoding(self.model)
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        allowed_special = set(self.stop_sequences)
+        num_threads = min(self.BATCH_NUM_THREADS, os.cpu_count() or 1, len(texts))
+
+        # tiktoken releases the GIL while encoding, so the thread pool only pays off with more than one thread.
+        if num_threads <= 1:
+            return [len(self.encoding.encode(text, allowed_special=allowed_special)) for text in texts]
+
+        return [
+            len(tokens)
+            for tokens in self.encoding.encode_batch(texts, num_threads=num_threads, allowed_special=allowed_special)
+        ]
+
+    def _get_encoding(self, model: str) -> tiktoken.Encoding:
+        if model not in self._encodings:
+            try:
+                self._encodings[model] = tiktoken.encoding_for_model(model)
+            except KeyError:
+                logging.warning("Model %s not found. Using %s encoding.", model, self.DEFAULT_ENCODING)
+
+                self._encodings[model] = tiktoken.get_encoding(self.DEFAULT_ENCODING)
+
+        return self._encodings[model]
 
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
@@ -88,13 +112,7 @@ class OpenAiTokenizer(BaseTokenizer):
         """
         if isinstance(text, list):
             model = model or self.model
-
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
-                logging.warning("model not found. Using cl100k_base encoding.")
-
-                encoding = tiktoken.get_encoding("cl100k_base")
+            encoding = self._get_encoding(model)
 
             if model in {
                 "gpt-3.5-turbo-0613",
@@ -33,3 +33,6 @@ class VoyageAiTokenizer(BaseTokenizer):
 
     def count_tokens(self, text: str) -> int:
         return self.client.count_tokens([text], model=self.model)
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        return [len(encoding) for encoding in self.client.tokenize(texts, model=self.model)]
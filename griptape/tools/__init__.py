@@ -1,30 +1,69 @@
-from .base_tool import BaseTool
-from .base_image_generation_tool import BaseImageGenerationTool
-from .calculator.tool import CalculatorTool
-from .web_search.tool import WebSearchTool
-from .web_scraper.tool import WebScraperTool
-from .sql.tool import SqlTool
-from .email.tool import EmailTool
-from .rest_api.tool import RestApiTool
-from .file_manager.tool import FileManagerTool
-from .vector_store.tool import VectorStoreTool
-from .date_time.tool import DateTimeTool
-from .computer.tool import ComputerTool
-from .prompt_image_generation.tool import PromptImageGenerationTool
-from .variation_image_generation.tool import VariationImageGenerationTool
-from .inpainting_image_generation.tool import InpaintingImageGenerationTool
-from .outpainting_image_generation.tool import OutpaintingImageGenerationTool
-from .griptape_cloud_tool.tool import GriptapeCloudToolTool
-from .structure_run.tool import StructureRunTool
-from .image_query.tool import ImageQueryTool
-from .rag.tool import RagTool
-from .text_to_speech.tool import TextToSpeechTool
-from .audio_transcription.tool import AudioTranscriptionTool
-from .extraction.tool import ExtractionTool
-from .prompt_summary.tool import PromptSummaryTool
-from .query.tool import QueryTool
-from .structured_output.tool import StructuredOutputTool
-from .mcp.tool import MCPTool
+from typing import TYPE_CHECKING
+
+from griptape.utils.import_utils import lazy_imports
+
+if TYPE_CHECKING:
+    from .base_tool import BaseTool
+    from .base_image_generation_tool import BaseImageGenerationTool
+    from .calculator.tool import CalculatorTool
+    from .web_search.tool import WebSearchTool
+    from .web_scraper.tool import WebScraperTool
+    from .sql.tool import SqlTool
+    from .email.tool import EmailTool
+    from .rest_api.tool import RestApiTool
+    from .file_manager.tool import FileManagerTool
+    from .vector_store.tool import VectorStoreTool
+    from .date_time.tool import DateTimeTool
+    from .computer.tool import ComputerTool
+    from .prompt_image_generation.tool import PromptImageGenerationTool
+    from .variation_image_generation.tool import VariationImageGenerationTool
+    from .inpainting_image_generation.tool import InpaintingImageGenerationTool
+    from .outpainting_image_generation.tool import OutpaintingImageGenerationTool
+    from .griptape_cloud_tool.tool import GriptapeCloudToolTool
+    from .structure_run.tool import StructureRunTool
+    from .image_query.tool import ImageQueryTool
+    from .rag.tool import RagTool
+    from .text_to_speech.tool import TextToSpeechTool
+    from .audio_transcription.tool import AudioTranscriptionTool
+    from .extraction.tool import ExtractionTool
+    from .prompt_summary.tool import PromptSummaryTool
+    from .query.tool import QueryTool
+    from .structured_output.tool import StructuredOutputTool
+    from .mcp.tool import MCPTool
+
+
+_LAZY_IMPORTS = {
+    "BaseTool": ".base_tool",
+    "BaseImageGenerationTool": ".base_image_generation_tool",
+    "CalculatorTool": ".calculator.tool",
+    "WebSearchTool": ".web_search.tool",
+    "WebScraperTool": ".web_scraper.tool",
+    "SqlTool": ".sql.tool",
+    "EmailTool": ".email.tool",
+    "RestApiTool": ".rest_api.tool",
+    "FileManagerTool": ".file_manager.tool",
+    "VectorStoreTool": ".vector_store.tool",
+    "DateTimeTool": ".date_time.tool",
+    "ComputerTool": ".computer.tool",
+    "PromptImageGenerationTool": ".prompt_image_generation.tool",
+    "VariationImageGenerationTool": ".variation_image_generation.tool",
+    "InpaintingImageGenerationTool": ".inpainting_image_generation.tool",
+    "OutpaintingImageGenerationTool": ".outpainting_image_generation.tool",
+    "GriptapeCloudToolTool": ".griptape_cloud_tool.tool",
+    "StructureRunTool": ".structure_run.tool",
+    "ImageQueryTool": ".image_query.tool",
+    "RagTool": ".rag.tool",
+    "TextToSpeechTool": ".text_to_speech.tool",
+    "AudioTranscriptionTool": ".audio_transcription.tool",
+    "ExtractionTool": ".extraction.tool",
+    "PromptSummaryTool": ".prompt_summary.tool",
+    "QueryTool": ".query.tool",
+    "StructuredOutputTool": ".structured_output.tool",
+    "MCPTool": ".mcp.tool",
+}
+
+__getattr__, __dir__ = lazy_imports(globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "AudioTranscriptionTool",
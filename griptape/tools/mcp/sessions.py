@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
 import os
+import sys
+import threading
+from concurrent import futures
 from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Protocol, TypedDict, TypeVar, Union
+
+from attrs import define, field
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
     from pathlib import Path
 
     import httpx
-    from mcp import ClientSession  # type: ignore[reportAttributeAccessIssue]
+    from mcp import ClientSession, types  # type: ignore[reportAttributeAccessIssue]
+
+T = TypeVar("T")
 
 EncodingErrorHandler = Literal["strict", "ignore", "replace"]
 
@@ -341,3 +351,206 @@ async def create_session(  # noqa: C901
         raise ValueError(
             f"Unsupported transport: {transport}. Must be one of: 'stdio', 'sse', 'websocket', 'streamable_http'"
         )
+
+
+@define
+class PersistentSession:
+    """A long-lived session to an MCP server that reconnects after the connection is lost.
+
+    The session is opened on first use and initialized once. Concurrent requests share it, MCP matches each
+    response to its request. A request that fails because the connection was lost is retried once on a new session
+    if it failed while connecting or is idempotent. Other requests raise and the next request reconnects.
+    Must only be used from the event loop of the `McpSessionPool` that created it.
+
+    Attributes:
+        connection: Connection config to use to connect to the server.
+    """
+
+    connection: Connection = field()
+    _session: Optional[ClientSession] = field(default=None, init=False)
+    _closed: Optional[asyncio.Event] = field(default=None, init=False)
+    _task: Optional[asyncio.Task] = field(default=None, init=False)
+    _lock: Optional[asyncio.Lock] = field(default=None, init=False)
+
+    async def list_tools(self) -> types.ListToolsResult:
+        return await self._request(lambda session: session.list_tools(), idempotent=True)
+
+    async def call_tool(self, name: str, arguments: dict) -> types.CallToolResult:
+        # The server may have run the tool before the connection was lost, so a sent call is never retried.
+        return await self._request(lambda session: session.call_tool(name, arguments), idempotent=False)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._disconnect(self._session)
+
+    async def _request(self, request: Callable[[ClientSession], Awaitable[T]], *, idempotent: bool) -> T:
+        try:
+            session = await self._get_session()
+        except Exception as e:
+            if not self._is_connection_error(e):
+                raise
+            session = await self._get_session()
+
+        try:
+            return await self._send(session, request)
+        except Exception as e:
+            if not idempotent or not self._is_connection_error(e):
+                raise
+
+        return await self._send(await self._get_session(), request)
+
+    async def _send(self, session: ClientSession, request: Callable[[ClientSession], Awaitable[T]]) -> T:
+        try:
+            return await request(session)
+        except Exception as e:
+            # The next request reconnects.
+            if self._is_connection_error(e):
+                await self._disconnect(session)
+            raise
+
+    async def _get_session(self) -> ClientSession:
+        # Created here rather than in __init__ so that it belongs to the pool's event loop.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._session is None:
+                ready = asyncio.get_running_loop().create_future()
+                self._closed = asyncio.Event()
+                self._task = asyncio.create_task(self._hold_session(ready, self._closed))
+                self._session = await ready
+
+            return self._session
+
+    async def _hold_session(self, ready: asyncio.Future[ClientSession], closed: asyncio.Event) -> None:
+        """Holds the session open until `closed` is set.
+
+        The transports use anyio cancel scopes, so the session must be entered and exited by the same task.
+        """
+        session = None
+
+        try:
+            async with create_session(self.connection) as session:
+                await session.initialize()
+                ready.set_result(session)
+                await closed.wait()
+        except Exception as e:
+            # Errors after the session is ready come from tearing down a lost connection and are not actionable.
+            if not ready.done():
+                ready.set_exception(e)
+        finally:
+            if not ready.done():
+                ready.cancel()
+            # If the connection was lost while idle, the next request reconnects.
+            if session is not None and self._session is session:
+                self._session = None
+
+    async def _disconnect(self, session: ClientSession) -> None:
+        lock = self._lock
+
+        if lock is None:
+            return
+
+        async with lock:
+            # Another request may have already replaced the session.
+            if self._session is not session:
+                return
+
+            self._session = None
+
+            if self._closed is not None:
+                self._closed.set()
+            if self._task is not None:
+                await asyncio.wait({self._task})
+
+    def _is_connection_error(self, e: BaseException) -> bool:
+        import anyio
+
+        if sys.version_info >= (3, 11):
+            base_exception_group = BaseExceptionGroup  # noqa: F821
+        else:
+            import exceptiongroup
+
+            base_exception_group = exceptiongroup.BaseExceptionGroup
+
+        # Transport failures can arrive wrapped in the exception group of an anyio task group.
+        if isinstance(e, base_exception_group):
+            return any(self._is_connection_error(exc) for exc in e.exceptions)
+
+        if isinstance(e, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream, OSError)):
+            return True
+
+        from mcp.shared.exceptions import McpError  # pyright: ignore[reportMissingImports]
+        from mcp.types import CONNECTION_CLOSED  # pyright: ignore[reportMissingImports]
+
+        return isinstance(e, McpError) and e.error.code == CONNECTION_CLOSED
+
+
+@define
+class McpSessionPool:
+    """Keeps one Persistent Session per MCP server connection on an event loop running on a background thread.
+
+    Synchronous code submits coroutines to the loop with `run`, so Tools don't start an event loop, and reconnect to
+    the server, for every call. The loop is started on first use and stopped by `close`, which runs when the
+    interpreter exits.
+    """
+
+    CLOSE_TIMEOUT = 5.0
+
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, init=False)
+    _sessions: dict[str, PersistentSession] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._run_loop, args=(self._loop,), name="griptape-mcp", daemon=True).start()
+
+            return self._loop
+
+    def get_session(self, connection: Connection) -> PersistentSession:
+        """Returns the Persistent Session for `connection`, creating it on first use."""
+        key = json.dumps(connection, sort_keys=True, default=repr)
+
+        with self._lock:
+            if key not in self._sessions:
+                self._sessions[key] = PersistentSession(connection)
+
+            return self._sessions[key]
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs `coroutine` on the pool's event loop and waits for its result.
+
+        Safe to call from any thread other than the pool's, including threads with a running event loop.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self) -> None:
+        """Closes every session in the pool and stops its event loop."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            loop = self._loop
+            self._sessions.clear()
+            self._loop = None
+
+        if loop is not None:
+            futures.wait(
+                [asyncio.run_coroutine_threadsafe(self._close_sessions(sessions), loop)], timeout=self.CLOSE_TIMEOUT
+            )
+            loop.call_soon_threadsafe(loop.stop)
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _close_sessions(self, sessions: list[PersistentSession]) -> None:
+        await asyncio.gather(*(session.close() for session in sessions), return_exceptions=True)
+
+
+session_pool = McpSessionPool()
+
+atexit.register(session_pool.close)
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import asyncio
-import threading
 from types import MethodType
 from typing import TYPE_CHECKING, Any
 
@@ -21,13 +19,12 @@ from griptape.artifacts import (
 from griptape.tools import BaseTool
 from griptape.utils.decorators import activity
 
-from .sessions import Connection, create_session
+from .sessions import Connection, PersistentSession, session_pool
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from contextlib import _AsyncGeneratorContextManager
 
-    from mcp import ClientSession, types  # pyright: ignore[reportAttributeAccessIssue]
+    from mcp import types  # pyright: ignore[reportAttributeAccessIssue]
 
 
 ANY_TYPE = Or(str, int, float, bool, list, dict)
@@ -125,6 +122,9 @@ def _exc_iter(exc) -> Any:  # noqa: ANN001
 class MCPTool(BaseTool):
     """MCP activities through a tool.
 
+    Activities are called over a Persistent Session that is shared by every MCP Tool with the same connection and
+    stays open between calls.
+
     Attributes:
         connection: The MCP server connection info.
     """
@@ -133,27 +133,17 @@ class MCPTool(BaseTool):
 
     def __attrs_post_init__(self) -> None:
         super().__attrs_post_init__()
-        try:
-            asyncio.get_running_loop()
-            # Event loop is running, use a separate thread with its own loop
-            thread = threading.Thread(target=lambda: asyncio.run(self._init_activities()))
-            thread.start()
-            thread.join()  # Block until initialization completes
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run directly
-            asyncio.run(self._init_activities())
+        session_pool.run(self._init_activities())
 
     async def _init_activities(self) -> None:
-        async with self._get_session() as session:
-            await session.initialize()
-            tools_response = await session.list_tools()
+        tools_response = await self._get_session().list_tools()
 
         for tool in tools_response.tools:
             activity_handler = self._create_activity_handler(tool)
             setattr(self, tool.name, MethodType(activity_handler, self))
 
-    def _get_session(self) -> _AsyncGeneratorContextManager[ClientSession, None]:
-        return create_session(self.connection)
+    def _get_session(self) -> PersistentSession:
+        return session_pool.get_session(self.connection)
 
     def to_activity_json_schema(self, activity: Callable, schema_id: str) -> dict:
         """Override to post-process JSON schema and add items to bare arrays.
@@ -179,17 +169,7 @@ class MCPTool(BaseTool):
             }
         )
         def activity_handler(self: MCPTool, values: dict) -> Any:
-            try:
-                asyncio.get_running_loop()
-                # We're in an async context, need to handle this differently
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, self._run_activity(tool.name, values))
-                    return future.result()
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                return asyncio.run(self._run_activity(tool.name, values))
+            return session_pool.run(self._run_activity(tool.name, values))
 
         return activity_handler
 
@@ -198,9 +178,7 @@ class MCPTool(BaseTool):
         from exceptiongroup import BaseExceptionGroup
 
         try:
-            async with self._get_session() as session:
-                await session.initialize()
-                tool_result = await session.call_tool(activity_name, params)
+            tool_result = await self._get_session().call_tool(activity_name, params)
             return self._convert_call_tool_result_to_artifact(tool_result)
         except BaseExceptionGroup as e:
             exception_message = "".join(f"\n{str(exc)}" for exc in _exc_iter(e))
@@ -24,6 +24,8 @@ from .reference_utils import references_from_artifacts
 from .file_utils import get_mime_type
 from .contextvars_utils import with_contextvars
 from .json_schema_utils import build_strict_schema, resolve_refs
+from .search_utils import find_max_fitting
+from .rate_limiter import RateLimiter
 from .griptape_cloud import GriptapeCloudStructure
 
 
@@ -39,6 +41,7 @@ __all__ = [
     "GriptapeCloudStructure",
     "ManifestValidator",
     "PythonRunner",
+    "RateLimiter",
     "Stream",
     "StructureVisualizer",
     "TokenCounter",
@@ -49,6 +52,7 @@ __all__ = [
     "execute_futures_dict",
     "execute_futures_list",
     "execute_futures_list_dict",
+    "find_max_fitting",
     "get_mime_type",
     "import_optional_dependency",
     "is_dependency_installed",
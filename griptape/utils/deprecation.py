@@ -30,6 +30,9 @@ class DeprecationModuleWrapper(ModuleType):
             )
         return getattr(self._real_module, name)
 
+    def __dir__(self) -> list[str]:
+        return dir(self._real_module)
+
 
 def deprecation_warn(message: str, stacklevel: int = 2) -> None:
     warnings.simplefilter("always", DeprecationWarning)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from importlib import import_module
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from types import ModuleType
@@ -56,3 +56,36 @@ def is_dependency_installed(name: str) -> bool:
         return False
 
     return True
+
+
+def lazy_imports(
+    module_globals: dict[str, Any], imports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create a module `__getattr__` and `__dir__` that import a package's public names on first access.
+
+    Each name is imported once and then cached in `module_globals`, so later lookups don't go through `__getattr__`.
+
+    Args:
+        module_globals: The package's `globals()`.
+        imports: Mapping of each public name to the module, relative to the package, that defines it.
+
+    Returns:
+        The package's `__getattr__` and `__dir__` functions.
+    """
+    package = module_globals["__name__"]
+
+    def module_getattr(name: str) -> Any:
+        module_name = imports.get(name)
+
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module_name, package), name)
+        module_globals[name] = value
+
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted({*module_globals, *imports})
+
+    return module_getattr, module_dir
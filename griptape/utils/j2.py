@@ -1,29 +1,97 @@
 from __future__ import annotations
 
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from attrs import Factory, define, field
 from jinja2 import Environment, FileSystemLoader
 
 from .paths import abs_path
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+_environments: dict[str, Environment] = {}
+_environments_lock = threading.Lock()
+
 
 @define(frozen=True)
 class J2:
+    """Renders Jinja templates.
+
+    J2 instances that don't provide their own `environment` share one Jinja Environment per `templates_dir`, so
+    templates are read and compiled once per process rather than once per render.
+
+    Attributes:
+        template_name: Name of the template to render, relative to `templates_dir`.
+        templates_dir: Directory templates are loaded from.
+        environment: Jinja Environment used to load and compile templates.
+    """
+
+    TEMPLATE_CACHE_SIZE = 512
+
     template_name: Optional[str] = field(default=None)
     templates_dir: str = field(default=abs_path("templates"), kw_only=True)
     environment: Environment = field(
-        default=Factory(
-            lambda self: Environment(loader=FileSystemLoader(self.templates_dir), trim_blocks=True, lstrip_blocks=True),
-            takes_self=True,
-        ),
+        default=Factory(lambda self: J2.get_environment(self.templates_dir), takes_self=True),
         kw_only=True,
     )
 
+    @staticmethod
+    def get_environment(templates_dir: str) -> Environment:
+        """Returns the shared Jinja Environment for `templates_dir`, creating it on first use."""
+        environment = _environments.get(templates_dir)
+
+        if environment is None:
+            with _environments_lock:
+                environment = _environments.get(templates_dir)
+
+                if environment is None:
+                    environment = Environment(
+                        loader=FileSystemLoader(templates_dir),
+                        trim_blocks=True,
+                        lstrip_blocks=True,
+                        cache_size=J2.TEMPLATE_CACHE_SIZE,
+                    )
+                    _environments[templates_dir] = environment
+
+        return environment
+
+    @staticmethod
+    def precompile(templates_dir: str = abs_path("templates")) -> int:
+        """Compiles every template in `templates_dir` into the shared Environment's cache.
+
+        Call this at startup to move the template compilation cost out of the first Structure run.
+
+        Args:
+            templates_dir: Directory to precompile. Defaults to the templates bundled with Griptape.
+
+        Returns:
+            The number of templates compiled.
+        """
+        environment = J2.get_environment(templates_dir)
+        template_names = environment.list_templates(extensions=["j2"])
+
+        for template_name in template_names:
+            environment.get_template(template_name)
+
+        return len(template_names)
+
     def render(self, **kwargs) -> str:
         if self.template_name is None:
             raise ValueError("template_name is required.")
         return self.environment.get_template(self.template_name).render(kwargs).rstrip()
 
     def render_from_string(self, value: str, **kwargs) -> str:
-        return self.environment.from_string(value).render(kwargs)
+        if self.environment is _environments.get(self.templates_dir):
+            template = _compile_shared_template(self.templates_dir, value)
+        else:
+            template = self.environment.from_string(value)
+
+        return template.render(kwargs)
+
+
+@lru_cache(maxsize=J2.TEMPLATE_CACHE_SIZE)
+def _compile_shared_template(templates_dir: str, value: str) -> Template:
+    return J2.get_environment(templates_dir).from_string(value)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Optional
+
+from attrs import Factory, define, field
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+_shared_rate_limiters: dict[str, RateLimiter] = {}
+_shared_rate_limiters_lock = threading.Lock()
+
+
+@define
+class _SlotWaiter:
+    """A request waiting for a concurrency slot.
+
+    Threads wait on the Rate Limiter's condition. Coroutines await `future`, which is resolved on `loop`.
+    """
+
+    loop: Optional[asyncio.AbstractEventLoop] = field(default=None)
+    future: Optional[asyncio.Future] = field(default=None)
+    granted: bool = field(default=False)
+
+
+@define(kw_only=True)
+class RateLimiter:
+    """Limits the rate and concurrency of requests sent to a model provider.
+
+    Requests and tokens are budgeted with token buckets that refill continuously and hold up to one minute of budget.
+    Each call reserves its share of the budget as soon as it arrives and then waits until that share has refilled, so
+    calls are served in the order they arrive no matter which thread makes them.
+
+    Attributes:
+        requests_per_minute: Optional maximum number of requests per minute.
+        tokens_per_minute: Optional maximum number of estimated tokens per minute.
+        max_concurrency: Optional maximum number of requests in flight at once.
+        requests: The number of requests that acquired the limiter.
+        throttled_requests: The number of requests that had to wait.
+        total_wait_time: The number of seconds requests spent waiting.
+    """
+
+    requests_per_minute: Optional[float] = field(default=None)
+    tokens_per_minute: Optional[float] = field(default=None)
+    max_concurrency: Optional[int] = field(default=None)
+    requests: int = field(default=0, init=False)
+    throttled_requests: int = field(default=0, init=False)
+    total_wait_time: float = field(default=0.0, init=False)
+    _available_requests: float = field(
+        default=Factory(lambda self: self.requests_per_minute or 0.0, takes_self=True), init=False
+    )
+    _available_tokens: float = field(
+        default=Factory(lambda self: self.tokens_per_minute or 0.0, takes_self=True), init=False
+    )
+    _updated_at: float = field(factory=time.monotonic, init=False)
+    _in_flight: int = field(default=0, init=False)
+    _slot_waiters: deque[_SlotWaiter] = field(factory=deque, init=False)
+    _condition: threading.Condition = field(factory=threading.Condition, init=False)
+
+    @staticmethod
+    def get_shared(
+        scope: str,
+        *,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> RateLimiter:
+        """Returns the process-wide Rate Limiter for `scope`, creating it with the given limits on first use.
+
+        Use one scope per quota, for example the provider and model, so that every Driver sharing a quota shares its
+        limiter.
+        """
+        with _shared_rate_limiters_lock:
+            rate_limiter = _shared_rate_limiters.get(scope)
+
+            if rate_limiter is None:
+                rate_limiter = RateLimiter(
+                    requests_per_minute=requests_per_minute,
+                    tokens_per_minute=tokens_per_minute,
+                    max_concurrency=max_concurrency,
+                )
+                _shared_rate_limiters[scope] = rate_limiter
+
+            return rate_limiter
+
+    @property
+    def average_wait_time(self) -> float:
+        with self._condition:
+            return self.total_wait_time / self.requests if self.requests else 0.0
+
+    @contextmanager
+    def acquire(self, tokens: int = 0) -> Iterator[None]:
+        """Waits until a request using `tokens` fits in the budget and holds a concurrency slot until exiting."""
+        started_at = time.monotonic()
+        wait = self.__reserve(tokens)
+
+        time.sleep(wait)
+        throttled = self.__acquire_slot() or wait > 0
+        self.__record_wait(time.monotonic() - started_at, throttled=throttled)
+
+        try:
+            yield
+        finally:
+            self.__release_slot()
+
+    @asynccontextmanager
+    async def aacquire(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Asynchronous version of `acquire`."""
+        started_at = time.monotonic()
+        wait = self.__reserve(tokens)
+
+        await asyncio.sleep(wait)
+        throttled = await self.__aacquire_slot() or wait > 0
+        self.__record_wait(time.monotonic() - started_at, throttled=throttled)
+
+        try:
+            yield
+        finally:
+            self.__release_slot()
+
+    def reset_stats(self) -> None:
+        with self._condition:
+            self.requests = 0
+            self.throttled_requests = 0
+            self.total_wait_time = 0.0
+
+    def __reserve(self, tokens: int) -> float:
+        """Takes a request and `tokens` out of the budget and returns how long to wait until they have refilled."""
+        with self._condition:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._updated_at = now
+            wait = 0.0
+
+            if self.requests_per_minute is not None:
+                rate = self.requests_per_minute / 60
+                self._available_requests = min(self.requests_per_minute, self._available_requests + elapsed * rate) - 1
+                wait = max(wait, -self._available_requests / rate)
+
+            if self.tokens_per_minute is not None:
+                rate = self.tokens_per_minute / 60
+                self._available_tokens = min(self.tokens_per_minute, self._available_tokens + elapsed * rate) - tokens
+                wait = max(wait, -self._available_tokens / rate)
+
+            return wait
+
+    def __acquire_slot(self) -> bool:
+        """Takes a concurrency slot, returning whether it had to wait for one."""
+        with self._condition:
+            if self.__try_take_slot():
+                return False
+
+            waiter = _SlotWaiter()
+            self._slot_waiters.append(waiter)
+
+            while not waiter.granted:
+                self._condition.wait()
+
+            return True
+
+    async def __aacquire_slot(self) -> bool:
+        """Asynchronous version of `__acquire_slot` that waits on the event loop instead of blocking a thread."""
+        with self._condition:
+            if self.__try_take_slot():
+                return False
+
+            loop = asyncio.get_running_loop()
+            waiter = _SlotWaiter(loop=loop, future=loop.create_future())
+            self._slot_waiters.append(waiter)
+
+        try:
+            await waiter.future  # pyright: ignore[reportGeneralTypeIssues]
+        except asyncio.CancelledError:
+            with self._condition:
+                if not waiter.granted:
+                    self._slot_waiters.remove(waiter)
+                # A granted slot whose future was cancelled is released by `__resolve_waiter` instead.
+                elif not waiter.future.cancelled():  # pyright: ignore[reportOptionalMemberAccess]
+                    self.__release_slot()
+            raise
+
+        return True
+
+    def __try_take_slot(self) -> bool:
+        """Takes a free slot if no one is waiting for one. Must be called while holding the condition."""
+        if self.max_concurrency is None or (not self._slot_waiters and self._in_flight < self.max_concurrency):
+            self._in_flight += 1
+
+            return True
+        return False
+
+    def __release_slot(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+
+            # Slots are handed to waiters in the order they were requested.
+            while self._slot_waiters and (self.max_concurrency is None or self._in_flight < self.max_concurrency):
+                waiter = self._slot_waiters.popleft()
+                self._in_flight += 1
+                waiter.granted = True
+
+                if waiter.loop is not None:
+                    try:
+                        waiter.loop.call_soon_threadsafe(self.__resolve_waiter, waiter)
+                    except RuntimeError:
+                        # The waiter's event loop is closed, so no one is left to use the slot.
+                        self._in_flight -= 1
+
+            self._condition.notify_all()
+
+    def __resolve_waiter(self, waiter: _SlotWaiter) -> None:
+        future = waiter.future
+
+        if future is not None and future.cancelled():
+            self.__release_slot()
+        elif future is not None:
+            future.set_result(None)
+
+    def __record_wait(self, wait: float, *, throttled: bool) -> None:
+        with self._condition:
+            self.requests += 1
+
+            if throttled:
+                self.throttled_requests += 1
+                self.total_wait_time += wait
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Callable
+
+
+def find_max_fitting(fits: Callable[[int], bool], upper: int, *, estimate: int) -> int:
+    """Finds the largest `n` in `[0, upper]` for which `fits(n)` is true.
+
+    `fits` must be monotonic: true up to some `n` and false after it. `fits(0)` is assumed to be true and is never
+    called. The search probes `estimate` first and gallops away from it until the boundary is bracketed, then
+    bisects, so an accurate estimate settles it in two probes.
+
+    Args:
+        fits: Predicate to search.
+        upper: Largest value to consider.
+        estimate: Best guess of the result.
+
+    Returns:
+        The largest `n` for which `fits(n)` is true.
+    """
+    # fits(low) is known to be true and fits(high) is known (or assumed) to be false.
+    low, high = 0, upper + 1
+    guess = estimate
+    step = 1
+    fit_found = miss_found = False
+
+    while high - low > 1:
+        mid = (low + high) // 2 if fit_found and miss_found else min(max(guess, low + 1), high - 1)
+
+        if fits(mid):
+            low, guess, fit_found = mid, mid + step, True
+        else:
+            high, guess, miss_found = mid, mid - step, True
+        step *= 2
+
+    return low
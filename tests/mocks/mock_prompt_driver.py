@@ -25,7 +25,7 @@ from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.common.contents.test_audio_message_content import AudioDeltaMessageContent, AudioMessageContent
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
     from griptape.tokenizers import BaseTokenizer
 
@@ -142,3 +142,10 @@ class MockPromptDriver(BasePromptDriver):
                         expires_at=int(time.time()),
                     )
                 )
+
+    async def try_arun(self, prompt_stack: PromptStack) -> Message:
+        return self.try_run(prompt_stack)
+
+    async def try_astream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        for message_delta in self.try_stream(prompt_stack):
+            yield message_delta
@@ -1,8 +1,11 @@
+import random
+
 import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
 from griptape.chunkers.chunk_separator import ChunkSeparator
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -150,3 +153,56 @@ class TestTextChunker:
         assert len(chunker.chunk("foo bar baz ")) == 2
 
         assert len(chunker.chunk("foo  bar baz")) == 2
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_midpoint_index_matches_exhaustive_search(self, mocker, seed):
+        def count_tokens(text: str) -> int:
+            # Odd runs of trailing whitespace cost extra tokens that even runs don't, so prefix token counts dip.
+            trailing_whitespace = len(text) - len(text.rstrip())
+
+            return len(text.split()) + (3 if trailing_whitespace % 2 else 0)
+
+        def find_midpoint_index(self, separator, subchunks, half_token_count):
+            token_counts = [
+                self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
+                for index in range(len(subchunks))
+            ]
+
+            return min(range(len(subchunks)), key=lambda index: abs(token_counts[index] - half_token_count))
+
+        rng = random.Random(seed)
+        text = "".join(f"foo-{index}" + " " * rng.randint(1, 4) for index in range(500))
+        mocker.patch.object(MockTokenizer, "count_tokens", side_effect=count_tokens, autospec=False)
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=MAX_TOKENS)
+
+        chunks = [chunk.value for chunk in chunker.chunk(text)]
+        mocker.patch.object(TextChunker, "_BaseChunker__find_midpoint_index", find_midpoint_index)
+
+        assert chunks == [chunk.value for chunk in chunker.chunk(text)]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_midpoint_index_matches_exhaustive_search_with_separator_runs(self, mocker, seed):
+        def count_tokens(text: str) -> int:
+            # A trailing run of whitespace costs a token per character, but merges into the word that follows it, so
+            # prefix token counts dip by the length of the run.
+            return len(text.split()) + len(text) - len(text.rstrip())
+
+        def find_midpoint_index(self, separator, subchunks, half_token_count):
+            token_counts = [
+                self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
+                for index in range(len(subchunks))
+            ]
+
+            return min(range(len(subchunks)), key=lambda index: abs(token_counts[index] - half_token_count))
+
+        rng = random.Random(seed)
+        text = " ".join(
+            f"foo-{index}" + (" " * rng.randint(20, 60) if rng.random() < 0.05 else "") for index in range(300)
+        )
+        mocker.patch.object(MockTokenizer, "count_tokens", side_effect=count_tokens, autospec=False)
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=MAX_TOKENS)
+
+        chunks = [chunk.value for chunk in chunker.chunk(text)]
+        mocker.patch.object(TextChunker, "_BaseChunker__find_midpoint_index", find_midpoint_index)
+
+        assert chunks == [chunk.value for chunk in chunker.chunk(text)]
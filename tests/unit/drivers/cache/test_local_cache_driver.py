@@ -0,0 +1,123 @@
+import pytest
+
+from griptape.drivers.cache.local import LocalCacheDriver
+
+
+class TestLocalCacheDriver:
+    @pytest.fixture()
+    def driver(self):
+        return LocalCacheDriver()
+
+    @pytest.fixture()
+    def persist_file(self, tmp_path):
+        return str(tmp_path / "cache.db")
+
+    def test_get_set(self, driver):
+        assert driver.get("foo") is None
+
+        driver.set("foo", [0.0, 1.0])
+
+        assert driver.get("foo") == [0.0, 1.0]
+        assert driver.hits == 1
+        assert driver.misses == 1
+        assert driver.hit_rate == 0.5
+
+    def test_get_set_copies_values(self, driver):
+        value = {"foo": [0.0, 1.0]}
+
+        driver.set("foo", value)
+        value["foo"].append(2.0)
+        driver.get("foo")["foo"].append(3.0)
+
+        assert driver.get("foo") == {"foo": [0.0, 1.0]}
+
+    def test_reset_stats(self, driver):
+        driver.get("foo")
+        driver.reset_stats()
+
+        assert driver.hits == 0
+        assert driver.misses == 0
+        assert driver.hit_rate == 0.0
+
+    def test_max_size(self):
+        driver = LocalCacheDriver(max_size=2)
+
+        driver.set("foo", 1)
+        driver.set("bar", 2)
+        driver.get("foo")
+        driver.set("baz", 3)
+
+        assert driver.get("bar") is None
+        assert driver.get("foo") == 1
+        assert driver.get("baz") == 3
+
+    def test_ttl(self, mocker):
+        time = mocker.patch("griptape.drivers.cache.base_cache_driver.time.time", return_value=100.0)
+        driver = LocalCacheDriver(ttl=10)
+
+        driver.set("foo", 1)
+
+        time.return_value = 109.0
+        assert driver.get("foo") == 1
+
+        time.return_value = 110.0
+        assert driver.get("foo") is None
+
+    def test_delete(self, driver):
+        driver.set("foo", 1)
+        driver.delete("foo")
+
+        assert driver.get("foo") is None
+
+    def test_clear(self, persist_file):
+        driver = LocalCacheDriver(persist_file=persist_file)
+
+        driver.set("foo", 1)
+        driver.clear()
+
+        assert driver.get("foo") is None
+        assert LocalCacheDriver(persist_file=persist_file).get("foo") is None
+
+    def test_persist_file(self, persist_file):
+        LocalCacheDriver(persist_file=persist_file).set("foo", {"bar": [0.0, 1.0]})
+
+        assert LocalCacheDriver(persist_file=persist_file).get("foo") == {"bar": [0.0, 1.0]}
+
+    def test_persist_file_serves_values_evicted_from_memory(self, persist_file):
+        driver = LocalCacheDriver(max_size=1, persist_file=persist_file)
+
+        driver.set("foo", 1)
+        driver.set("bar", 2)
+
+        assert driver.get("foo") == 1
+        assert driver.get("bar") == 2
+
+    def test_persist_file_ttl(self, mocker, persist_file):
+        time = mocker.patch("griptape.drivers.cache.base_cache_driver.time.time", return_value=100.0)
+        LocalCacheDriver(ttl=10, persist_file=persist_file).set("foo", 1)
+
+        time.return_value = 110.0
+
+        assert LocalCacheDriver(persist_file=persist_file).get("foo") is None
+
+    def test_max_persist_size(self, persist_file):
+        driver = LocalCacheDriver(max_size=None, persist_file=persist_file, max_persist_size=2)
+
+        driver.set("foo", 1)
+        driver.set("bar", 2)
+        driver.set("baz", 3)
+
+        driver = LocalCacheDriver(persist_file=persist_file)
+
+        assert driver.get("foo") is None
+        assert driver.get("bar") == 2
+        assert driver.get("baz") == 3
+
+    def test_to_dict(self, driver):
+        assert driver.to_dict() == {
+            "type": "LocalCacheDriver",
+            "ttl": None,
+            "max_size": 10_000,
+            "persist_file": None,
+            "max_persist_size": None,
+        }
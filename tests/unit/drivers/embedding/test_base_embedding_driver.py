@@ -4,7 +4,11 @@ import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.artifacts.image_artifact import ImageArtifact
+from griptape.drivers.cache.local import LocalCacheDriver
+from griptape.utils import RateLimiter
+from griptape.utils.hash import str_to_hash
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestBaseEmbeddingDriver:
@@ -51,3 +55,139 @@ class TestBaseEmbeddingDriver:
             driver.embed("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_many(self):
+        driver = MockEmbeddingDriver(max_batch_size=2, mock_output=lambda chunk: [float(len(chunk))])
+
+        embeddings = driver.embed_many(
+            ["a", TextArtifact("bb"), ImageArtifact(b"foobar", format="png", width=1, height=1), "ccc"]
+        )
+
+        assert embeddings == [[1.0], [2.0], [6.0], [3.0]]
+
+    @pytest.mark.parametrize(
+        ("max_batch_size", "max_batch_tokens", "expected_batches"),
+        [
+            (3, None, [["foo", "bar", "baz"]]),
+            (2, None, [["foo", "bar"], ["baz"]]),
+            (3, 4, [["foo"], ["bar"], ["baz"]]),
+            (3, 6, [["foo", "bar"], ["baz"]]),
+        ],
+    )
+    def test_embed_many_batches(self, mocker, max_batch_size, max_batch_tokens, expected_batches):
+        driver = MockEmbeddingDriver(max_batch_size=max_batch_size, max_batch_tokens=max_batch_tokens)
+        spy = mocker.spy(driver, "try_embed_chunks")
+
+        assert driver.embed_many(["foo", "bar", "baz"]) == [[0, 1], [0, 1], [0, 1]]
+        assert [call.args[0] for call in spy.call_args_list] == expected_batches
+
+    def test_embed_many_long_string(self, mocker):
+        driver = MockEmbeddingDriver(max_batch_size=2)
+        spy = mocker.spy(driver, "try_embed_chunks")
+
+        assert driver.embed_many(["foo", "foobar" * 5000]) == [[0, 1], [0, 1]]
+        assert [call.args[0] for call in spy.call_args_list] == [["foo"]]
+
+    def test_embed_many_counts_tokens_in_batch(self):
+        driver = MockEmbeddingDriver(max_batch_size=2)
+
+        with (
+            patch.object(MockTokenizer, "count_tokens_batch", return_value=[3, 3, 3]) as count_tokens_batch,
+            patch.object(MockTokenizer, "count_tokens") as count_tokens,
+        ):
+            driver.embed_many(["foo", "bar", "baz"])
+
+        count_tokens_batch.assert_called_once_with(["foo", "bar", "baz"])
+        count_tokens.assert_not_called()
+
+    def test_embed_counts_tokens_once(self):
+        driver = MockEmbeddingDriver(rate_limiter=RateLimiter(tokens_per_minute=1000))
+
+        with patch.object(MockTokenizer, "count_tokens", return_value=3) as count_tokens:
+            driver.embed("foo")
+            driver.embed_many(["foo", "bar"])
+
+        assert count_tokens.call_count == 3
+
+    def test_embed_many_missing_embeddings(self):
+        driver = MockEmbeddingDriver(max_batch_size=2)
+
+        with patch.object(MockEmbeddingDriver, "try_embed_chunks", return_value=[[1.0]]), pytest.raises(
+            ValueError, match="returned 1 embeddings for 2 chunks"
+        ):
+            driver.embed_many(["foo", "bar"])
+
+    def test_embed_many_without_batching(self, mocker):
+        driver = MockEmbeddingDriver(
+            max_attempts=2, min_retry_delay=0, max_retry_delay=0, rate_limiter=RateLimiter(requests_per_minute=60)
+        )
+        try_embed_chunks = mocker.spy(driver, "try_embed_chunks")
+
+        with patch.object(
+            MockEmbeddingDriver, "try_embed_chunk", side_effect=[[1.0], Exception("nope"), [2.0], [3.0]]
+        ) as try_embed_chunk:
+            assert driver.embed_many(["foo", "bar", "baz"]) == [[1.0], [2.0], [3.0]]
+
+        assert [call.args[0] for call in try_embed_chunk.call_args_list] == ["foo", "bar", "bar", "baz"]
+        try_embed_chunks.assert_not_called()
+        assert driver.rate_limiter.requests == 4
+
+    def test_embed_many_retries(self):
+        driver = MockEmbeddingDriver(max_batch_size=2, max_attempts=2, min_retry_delay=0, max_retry_delay=0)
+
+        with patch.object(
+            MockEmbeddingDriver, "try_embed_chunks", side_effect=[Exception("nope"), [[1.0], [2.0]]]
+        ) as try_embed_chunks:
+            assert driver.embed_many(["foo", "bar"]) == [[1.0], [2.0]]
+
+        assert try_embed_chunks.call_count == 2
+
+    def test_embed_many_rate_limiter(self, mocker):
+        driver = MockEmbeddingDriver(max_batch_size=2, rate_limiter=RateLimiter(tokens_per_minute=1000))
+        acquire = mocker.spy(RateLimiter, "acquire")
+
+        driver.embed_many(["foo", "bar", "baz"])
+        driver.embed("foo")
+
+        assert [call.args[1] for call in acquire.call_args_list] == [6, 3, 3]
+        assert driver.rate_limiter.requests == 3
+
+    def test_embed_cache(self, mocker):
+        driver = MockEmbeddingDriver(cache_driver=LocalCacheDriver())
+        spy = mocker.spy(driver, "try_embed_chunk")
+
+        assert driver.embed("foo", vector_operation="query") == [0, 1]
+        assert driver.embed(TextArtifact("foo"), vector_operation="query") == [0, 1]
+        assert driver.embed("foo", vector_operation="upsert") == [0, 1]
+
+        assert spy.call_count == 2
+        assert driver.cache_driver.hits == 1
+        assert driver.cache_driver.misses == 2
+
+    def test_embed_cache_key(self):
+        driver = MockEmbeddingDriver(cache_driver=LocalCacheDriver())
+
+        assert driver._get_cache_key("foo", vector_operation="query") == (
+            f"MockEmbeddingDriver:foo:query:{str_to_hash('foo')}"
+        )
+        assert driver._get_cache_key(TextArtifact("foo")) == f"MockEmbeddingDriver:foo:None:{str_to_hash('foo')}"
+
+    def test_embed_many_cache(self, mocker):
+        driver = MockEmbeddingDriver(max_batch_size=10, cache_driver=LocalCacheDriver())
+        spy = mocker.spy(driver, "try_embed_chunks")
+        driver.embed("foo")
+
+        assert driver.embed_many(["foo", "bar", "bar", TextArtifact("baz")]) == [[0, 1]] * 4
+        assert [call.args[0] for call in spy.call_args_list] == [["bar", "baz"]]
+        assert driver.embed_many(["bar", "baz"]) == [[0, 1]] * 2
+        assert spy.call_count == 1
+
+    def test_embed_many_cache_returns_copies(self):
+        driver = MockEmbeddingDriver(max_batch_size=10, cache_driver=LocalCacheDriver())
+
+        embeddings = driver.embed_many(["foo", "foo"])
+        embeddings[0].append(2)
+        driver.embed("foo").append(3)
+
+        assert embeddings[1] == [0, 1]
+        assert driver.embed_many(["foo", "foo"]) == [[0, 1]] * 2
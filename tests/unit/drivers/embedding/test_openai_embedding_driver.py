@@ -49,3 +49,10 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
         assert mock_openai.call_args.kwargs["input"] == "foo bar" if model.endswith("001") else "foo\nbar"
+
+    def test_try_embed_chunks(self, mock_openai):
+        embeddings = [Mock(embedding=[0, 1, 0]), Mock(embedding=[1, 0, 0])]
+        mock_openai.return_value.data = embeddings
+
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
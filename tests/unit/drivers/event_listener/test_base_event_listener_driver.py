@@ -1,57 +1,138 @@
-from unittest.mock import ANY, MagicMock
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
 
 from tests.mocks.mock_event import MockEvent
 from tests.mocks.mock_event_listener_driver import MockEventListenerDriver
 
 
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
 class TestBaseEventListenerDriver:
     def test_publish_event_no_batched(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=False, create_futures_executor=lambda: executor)
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=False, on_event_payload_publish=mock_fn)
         mock_event_payload = MockEvent().to_dict()
 
         driver.publish_event(mock_event_payload)
+        driver.flush_events()
 
-        executor.submit.assert_called_once_with(ANY, mock_event_payload)
+        mock_fn.assert_called_once_with(mock_event_payload)
 
     def test_publish_event_yes_batched(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=True, create_futures_executor=lambda: executor)
-        mock_event_payload = MockEvent().to_dict()
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=True, flush_interval=60, on_event_payload_batch_publish=mock_fn)
+        mock_event_payloads = [MockEvent().to_dict() for _ in range(10)]
 
-        # Publish 9 events to fill the batch
-        mock_event_payloads = [mock_event_payload for _ in range(9)]
+        # A full batch is published without waiting for the flush interval
         for mock_event_payload in mock_event_payloads:
             driver.publish_event(mock_event_payload)
+        wait_for(lambda: mock_fn.call_count == 1)
 
-        assert len(driver._batch) == 9
-        executor.submit.assert_not_called()
+        mock_fn.assert_called_once_with(mock_event_payloads)
+        assert driver.batch == []
+
+    def test_publish_event_flush_interval(self):
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=True, flush_interval=0.01, on_event_payload_batch_publish=mock_fn)
+        mock_event_payload = MockEvent().to_dict()
 
-        # Publish the 10th event to trigger the batch publish
         driver.publish_event(mock_event_payload)
+        wait_for(lambda: mock_fn.call_count == 1)
 
-        assert len(driver._batch) == 0
-        executor.submit.assert_called_once_with(ANY, [*mock_event_payloads, mock_event_payload])
+        mock_fn.assert_called_once_with([mock_event_payload])
 
     def test_flush_events(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=True, create_futures_executor=lambda: executor)
-        driver.try_publish_event_payload_batch = MagicMock(side_effect=driver.try_publish_event_payload)
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=True, flush_interval=60, on_event_payload_batch_publish=mock_fn)
 
         driver.flush_events()
-        driver.try_publish_event_payload_batch.assert_not_called()
+        mock_fn.assert_not_called()
         assert driver.batch == []
         mock_event_payloads = [MockEvent().to_dict() for _ in range(3)]
         for mock_event_payload in mock_event_payloads:
             driver.publish_event(mock_event_payload)
         assert len(driver.batch) == 3
+        assert driver.queue_depth == 3
 
         driver.flush_events()
-        executor.submit.assert_called_once_with(ANY, mock_event_payloads)
+        mock_fn.assert_called_once_with(mock_event_payloads)
         assert len(driver.batch) == 0
+        assert driver.queue_depth == 0
+
+    @pytest.mark.parametrize(
+        ("backpressure_policy", "expected_indexes"),
+        [("drop_newest", [0, 1]), ("drop_oldest", [2, 3])],
+    )
+    def test_publish_event_backpressure_drop(self, backpressure_policy, expected_indexes):
+        published = []
+        release = threading.Event()
+
+        def on_event_payload_publish(event_payload: dict) -> None:
+            release.wait()
+            published.append(event_payload)
+
+        driver = MockEventListenerDriver(
+            batched=False,
+            max_queue_size=2,
+            backpressure_policy=backpressure_policy,
+            on_event_payload_publish=on_event_payload_publish,
+        )
+        mock_event_payloads = [MockEvent().to_dict() for _ in range(5)]
+
+        # The first event is picked up by the publisher, which then blocks until released
+        driver.publish_event(mock_event_payloads[0])
+        wait_for(lambda: driver.batch == [mock_event_payloads[0]] and driver.queue_depth == 1 and not driver._queue)
+        for mock_event_payload in mock_event_payloads[1:]:
+            driver.publish_event(mock_event_payload)
+        release.set()
+        driver.flush_events()
+
+        assert driver.dropped_events == 2
+        assert published == [mock_event_payloads[0], *[mock_event_payloads[i + 1] for i in expected_indexes]]
+
+    def test_publish_event_backpressure_block(self):
+        published = []
+
+        def on_event_payload_publish(event_payload: dict) -> None:
+            time.sleep(0.001)
+            published.append(event_payload)
+
+        driver = MockEventListenerDriver(
+            batched=False,
+            max_queue_size=1,
+            backpressure_policy="block",
+            on_event_payload_publish=on_event_payload_publish,
+        )
+        mock_event_payloads = [MockEvent().to_dict() for _ in range(20)]
+
+        for mock_event_payload in mock_event_payloads:
+            driver.publish_event(mock_event_payload)
+        driver.flush_events()
+
+        assert driver.dropped_events == 0
+        assert published == mock_event_payloads
+
+    def test_shutdown(self):
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=True, flush_interval=60, on_event_payload_batch_publish=mock_fn)
+        mock_event_payload = MockEvent().to_dict()
+
+        driver.publish_event(mock_event_payload)
+        worker = driver._worker
+        driver.shutdown()
+
+        mock_fn.assert_called_once_with([mock_event_payload])
+        assert worker is not None
+        assert not worker.is_alive()
+        assert driver._worker is None
 
     def test__safe_publish_event_payload(self):
         mock_fn = MagicMock()
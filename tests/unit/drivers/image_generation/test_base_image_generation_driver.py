@@ -5,6 +5,7 @@ import pytest
 from griptape.artifacts.image_artifact import ImageArtifact
 from griptape.events import EventBus
 from griptape.events.event_listener import EventListener
+from griptape.utils import RateLimiter
 from tests.mocks.mock_image_generation_driver import MockImageGenerationDriver
 
 
@@ -106,3 +107,11 @@ class TestBaseImageGenerationDriver:
 
         args, _kwargs = call_args[1]
         assert args[0].type == "FinishImageGenerationEvent"
+
+    def test_run_text_to_image_rate_limiter(self):
+        driver = MockImageGenerationDriver(model="foo", rate_limiter=RateLimiter(requests_per_minute=10))
+
+        driver.run_text_to_image(["foo"])
+        driver.run_text_to_image(["bar"])
+
+        assert driver.rate_limiter.requests == 2
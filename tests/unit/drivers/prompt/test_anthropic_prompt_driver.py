@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from schema import Schema
@@ -198,6 +199,28 @@ class TestAnthropicPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_client.return_value.messages.create = AsyncMock(
+            return_value=mock_client.return_value.messages.create.return_value
+        )
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        events = list(mock_stream_client.return_value.messages.create.return_value)
+
+        async def aiter_events():
+            for event in events:
+                yield event
+
+        mock_async_stream_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_stream_client.return_value.messages.create = AsyncMock(return_value=aiter_events())
+
+        return mock_async_stream_client
+
     @pytest.fixture(params=[True, False])
     def prompt_stack(self, request):
         prompt_stack = PromptStack()
@@ -464,6 +487,39 @@ class TestAnthropicPromptDriver:
         event = next(stream)
         assert event.usage.output_tokens == 10
 
+    def test_try_arun(self, mock_client, mock_async_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", extra_params={"foo": "bar"})
+
+        message = asyncio.run(driver.try_arun(prompt_stack))
+
+        driver.try_run(prompt_stack)
+        assert mock_async_client.return_value.messages.create.call_args == (
+            mock_client.return_value.messages.create.call_args
+        )
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_try_astream(self, mock_async_stream_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", stream=True)
+
+        async def astream():
+            return [message_delta async for message_delta in driver.try_astream(prompt_stack)]
+
+        message_deltas = asyncio.run(astream())
+
+        assert mock_async_stream_client.return_value.messages.create.call_args.kwargs["stream"] is True
+        assert message_deltas[0].usage.input_tokens == 5
+        assert [type(message_delta.content) for message_delta in message_deltas[1:5]] == [
+            TextDeltaMessageContent,
+            TextDeltaMessageContent,
+            ActionCallDeltaMessageContent,
+            ActionCallDeltaMessageContent,
+        ]
+        assert message_deltas[4].content.partial_input == '{"foo": "bar"}'
+        assert message_deltas[5].usage.output_tokens == 10
+
     def test_verify_structured_output_strategy(self):
         assert AnthropicPromptDriver(model="foo", structured_output_strategy="tool")
 
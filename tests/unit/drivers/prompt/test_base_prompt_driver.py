@@ -1,15 +1,18 @@
+import asyncio
 import json
 import warnings
 
 import pytest
 
 from griptape.artifacts import ActionArtifact, ErrorArtifact, TextArtifact
-from griptape.common import AudioMessageContent, Message, PromptStack, TextMessageContent
-from griptape.events import FinishPromptEvent, StartPromptEvent
+from griptape.common import AudioMessageContent, DeltaMessage, Message, PromptStack, TextMessageContent
+from griptape.drivers.cache.local import LocalCacheDriver
+from griptape.events import EventBus, EventListener, FinishPromptEvent, StartPromptEvent, TextChunkEvent
 from griptape.events.event_bus import _EventBus
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 from griptape.tools.structured_output.tool import StructuredOutputTool
+from griptape.utils import RateLimiter
 from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
@@ -63,6 +66,156 @@ class TestBasePromptDriver:
             if "audio" in modalities:
                 assert result.has_any_content_type(AudioMessageContent)
 
+    @pytest.mark.parametrize("stream", [True, False])
+    @pytest.mark.parametrize("use_native_tools", [True, False])
+    @pytest.mark.parametrize("tools", [[], [MockTool()]])
+    def test_arun(self, use_native_tools, stream, tools):
+        driver = MockPromptDriver(stream=stream, use_native_tools=use_native_tools, max_attempts=1)
+
+        result = asyncio.run(driver.arun(PromptStack(tools=tools)))
+        expected = driver.run(PromptStack(tools=tools))
+
+        assert [type(content) for content in result.content] == [type(content) for content in expected.content]
+        assert result.to_text() == expected.to_text()
+        assert result.usage.total_tokens == expected.usage.total_tokens
+
+    @pytest.mark.parametrize("stream", [True, False])
+    def test_arun_in_worker_thread_retries(self, stream):
+        driver = MockFailingPromptDriver(max_failures=1, max_attempts=2, max_retry_delay=0, stream=stream)
+
+        result = asyncio.run(driver.arun(TextArtifact("test")))
+
+        assert result.value == "success"
+        assert driver.current_attempt == 1
+
+    def test_astream(self):
+        events = []
+        EventBus.add_event_listener(EventListener(events.append))
+        driver = MockPromptDriver(mock_output="mock output")
+
+        async def astream() -> list[DeltaMessage]:
+            return [message_delta async for message_delta in driver.astream(TextArtifact("test"))]
+
+        message_deltas = asyncio.run(astream())
+
+        assert [message_delta.content.text for message_delta in message_deltas] == ["mock output"]
+        assert [type(event) for event in events] == [StartPromptEvent, TextChunkEvent, FinishPromptEvent]
+        assert events[-1].result == "mock output"
+
+    @pytest.mark.parametrize("stream", [True, False])
+    @pytest.mark.parametrize("use_native_tools", [True, False])
+    @pytest.mark.parametrize("modalities", [["text"], ["text", "audio"]])
+    def test_run_with_cache(self, mocker, stream, use_native_tools, modalities):
+        cache_driver = LocalCacheDriver()
+        driver = MockPromptDriver(
+            temperature=0,
+            stream=stream,
+            use_native_tools=use_native_tools,
+            modalities=modalities,
+            cache_driver=cache_driver,
+        )
+        expected = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()]))
+        try_run = mocker.spy(driver, "try_run")
+        try_stream = mocker.spy(driver, "try_stream")
+        events = []
+        EventBus.add_event_listener(EventListener(events.append))
+
+        result = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()]))
+
+        assert try_run.call_count == try_stream.call_count == 0
+        assert [type(content) for content in result.content] == [type(content) for content in expected.content]
+        assert result.to_text() == expected.to_text()
+        assert result.usage.total_tokens == expected.usage.total_tokens
+        assert (TextChunkEvent in [type(event) for event in events]) == (stream and not use_native_tools)
+        assert cache_driver.hits == 1
+        assert cache_driver.misses == 1
+
+    def test_run_with_cache_keys(self):
+        cache_driver = LocalCacheDriver()
+        driver = MockPromptDriver(temperature=0, cache_driver=cache_driver)
+
+        driver.run(TextArtifact("foo"))
+        driver.run(TextArtifact("foo"))
+        driver.run(TextArtifact("bar"))
+        driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()]))
+        MockPromptDriver(temperature=0, cache_driver=cache_driver, stream=True).run(TextArtifact("foo"))
+        MockPromptDriver(temperature=0, cache_driver=cache_driver, max_tokens=10).run(TextArtifact("foo"))
+
+        assert cache_driver.hits == 2
+        assert cache_driver.misses == 4
+
+    @pytest.mark.parametrize(("temperature", "cache_nondeterministic", "hits"), [(0.5, False, 0), (0.5, True, 1)])
+    def test_run_with_cache_temperature(self, temperature, cache_nondeterministic, hits):
+        cache_driver = LocalCacheDriver()
+        driver = MockPromptDriver(
+            temperature=temperature, cache_driver=cache_driver, cache_nondeterministic=cache_nondeterministic
+        )
+
+        driver.run(TextArtifact("foo"))
+        driver.run(TextArtifact("foo"))
+
+        assert cache_driver.hits == hits
+
+    @pytest.mark.parametrize("stream", [True, False])
+    def test_arun_with_cache(self, mocker, stream):
+        cache_driver = LocalCacheDriver()
+        driver = MockPromptDriver(temperature=0, stream=stream, cache_driver=cache_driver)
+        expected = driver.run(TextArtifact("foo"))
+        try_arun = mocker.spy(driver, "try_arun")
+        try_astream = mocker.spy(driver, "try_astream")
+
+        result = asyncio.run(driver.arun(TextArtifact("foo")))
+
+        assert try_arun.call_count == try_astream.call_count == 0
+        assert result.to_text() == expected.to_text()
+        assert cache_driver.hits == 1
+
+    def test_astream_with_cache(self):
+        cache_driver = LocalCacheDriver()
+        driver = MockPromptDriver(temperature=0, cache_driver=cache_driver)
+
+        async def astream() -> list[DeltaMessage]:
+            return [message_delta async for message_delta in driver.astream(TextArtifact("test"))]
+
+        asyncio.run(astream())
+        message_deltas = asyncio.run(astream())
+
+        assert [message_delta.content.text for message_delta in message_deltas if message_delta.content] == [
+            "mock output"
+        ]
+        assert cache_driver.hits == 1
+        assert cache_driver.misses == 1
+
+    @pytest.mark.parametrize("stream", [True, False])
+    def test_run_with_rate_limiter(self, mocker, stream):
+        rate_limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=10_000)
+        driver = MockPromptDriver(
+            temperature=0, max_tokens=100, stream=stream, rate_limiter=rate_limiter, cache_driver=LocalCacheDriver()
+        )
+        prompt_stack = PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+        acquire = mocker.spy(RateLimiter, "acquire")
+
+        driver.run(prompt_stack)
+        driver.run(prompt_stack)
+
+        assert acquire.call_count == 1
+        assert (
+            acquire.call_args.args[1]
+            == driver.tokenizer.count_tokens(driver.prompt_stack_to_string(prompt_stack)) + 100
+        )
+        assert rate_limiter.requests == 1
+
+    def test_arun_with_rate_limiter(self):
+        rate_limiter = RateLimiter(max_concurrency=1)
+        driver = MockPromptDriver(rate_limiter=rate_limiter)
+
+        async def arun() -> list[Message]:
+            return await asyncio.gather(*(driver.arun(TextArtifact(f"test {i}")) for i in range(3)))
+
+        asyncio.run(arun())
+
+        assert rate_limiter.requests == 3
+
     def test_native_structured_output_strategy(self):
         from schema import Schema
 
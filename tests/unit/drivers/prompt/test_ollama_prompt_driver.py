@@ -1,4 +1,6 @@
+import asyncio
 import json
+from unittest.mock import AsyncMock
 
 import pytest
 from schema import Schema
@@ -187,6 +189,27 @@ class TestOllamaPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("ollama.AsyncClient")
+        mock_async_client.return_value.chat = AsyncMock(return_value=mock_client.return_value.chat.return_value)
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        chunks = list(mock_stream_client.return_value.chat.return_value)
+        mock_stream_client.return_value.chat.return_value = iter(chunks)
+
+        async def aiter_chunks():
+            for chunk in chunks:
+                yield chunk
+
+        mock_async_stream_client = mocker.patch("ollama.AsyncClient")
+        mock_async_stream_client.return_value.chat = AsyncMock(return_value=aiter_chunks())
+
+        return mock_async_stream_client
+
     @pytest.fixture()
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -360,3 +383,25 @@ class TestOllamaPromptDriver:
         event = next(stream)
         assert isinstance(event.content, TextDeltaMessageContent)
         assert event.content.text == ""
+
+    def test_try_arun(self, mock_client, mock_async_client, prompt_stack):
+        driver = OllamaPromptDriver(model="llama", extra_params={"foo": "bar"})
+
+        message = asyncio.run(driver.try_arun(prompt_stack))
+
+        assert driver.try_run(prompt_stack).to_text() == message.to_text()
+        assert mock_async_client.return_value.chat.call_args == mock_client.return_value.chat.call_args
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+
+    def test_try_astream(self, mock_stream_client, mock_async_stream_client, prompt_stack):
+        driver = OllamaPromptDriver(model="llama", stream=True)
+
+        async def astream():
+            return [message_delta async for message_delta in driver.try_astream(prompt_stack)]
+
+        message_deltas = asyncio.run(astream())
+
+        assert message_deltas == list(driver.try_stream(prompt_stack))
+        assert mock_async_stream_client.return_value.chat.call_args == mock_stream_client.return_value.chat.call_args
+        assert [message_delta.content.index for message_delta in message_deltas[1:3]] == [0, 1]
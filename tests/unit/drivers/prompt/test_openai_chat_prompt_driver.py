@@ -1,6 +1,7 @@
+import asyncio
 import base64
 from copy import deepcopy
-from unittest.mock import ANY, MagicMock, Mock
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock
 
 import pytest
 import schema
@@ -456,6 +457,29 @@ class OpenAiApiResponseWithHeaders:
 
 
 class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
+    @pytest.fixture()
+    def mock_async_chat_completion_create(self, mocker, mock_chat_completion_create):
+        mock_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = AsyncMock(
+            return_value=mock_chat_completion_create.return_value
+        )
+
+        return mock_chat_create
+
+    @pytest.fixture()
+    def mock_async_chat_completion_stream_create(self, mocker, mock_chat_completion_stream_create):
+        chunks = list(mock_chat_completion_stream_create.return_value)
+        mock_chat_completion_stream_create.return_value = iter(chunks)
+
+        async def aiter_chunks():
+            for chunk in chunks:
+                yield chunk
+
+        mock_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = AsyncMock(
+            return_value=aiter_chunks()
+        )
+
+        return mock_chat_create
+
     def test_init(self):
         assert OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_4_MODEL)
 
@@ -981,3 +1005,28 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
             max_tokens=1,
         )
         assert event.value[0].value == "model-output"
+
+    def test_try_arun(self, mock_chat_completion_create, mock_async_chat_completion_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(model="gpt-4.1", extra_params={"foo": "bar"})
+
+        message = asyncio.run(driver.try_arun(prompt_stack))
+
+        assert driver.try_run(prompt_stack).to_text() == message.to_text()
+        assert mock_async_chat_completion_create.call_args == mock_chat_completion_create.call_args
+        assert message.value[0].value == "model-output"
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_try_astream(
+        self, mock_chat_completion_stream_create, mock_async_chat_completion_stream_create, prompt_stack
+    ):
+        driver = OpenAiChatPromptDriver(model="gpt-4.1", stream=True, modalities=["text", "audio"])
+
+        async def astream():
+            return [message_delta async for message_delta in driver.try_astream(prompt_stack)]
+
+        message_deltas = asyncio.run(astream())
+
+        assert message_deltas == list(driver.try_stream(prompt_stack))
+        assert mock_async_chat_completion_stream_create.call_args == mock_chat_completion_stream_create.call_args
+        assert len(message_deltas) == 7
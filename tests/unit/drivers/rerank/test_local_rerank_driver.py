@@ -15,3 +15,72 @@ class TestLocalRerankDriver:
         result = driver.run("hello", artifacts=[TextArtifact("foo"), TextArtifact("bar")])
 
         assert len(result) == 2
+
+    def test_run_orders_by_relatedness(self):
+        embeddings = {"hello": [1, 0], "near": [0.9, 0.1], "far": [0, 1]}
+        driver = LocalRerankDriver(embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: embeddings[chunk]))
+        result = driver.run("hello", artifacts=[TextArtifact("far"), TextArtifact("near")])
+
+        assert [artifact.value for artifact in result] == ["near", "far"]
+
+    def test_run_with_calculate_relatedness(self):
+        embeddings = {"hello": [1, 0], "near": [0.9, 0.1], "far": [0, 1]}
+        driver = LocalRerankDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: embeddings[chunk]),
+            calculate_relatedness=lambda x, y: -x[0] * y[0],
+        )
+        result = driver.run("hello", artifacts=[TextArtifact("near"), TextArtifact("far")])
+
+        assert [artifact.value for artifact in result] == ["far", "near"]
+
+    def test_run_with_artifact_embeddings(self):
+        embedded = []
+
+        def mock_output(chunk):
+            embedded.append(chunk)
+
+            return [1, 0]
+
+        driver = LocalRerankDriver(embedding_driver=MockEmbeddingDriver(mock_output=mock_output))
+        result = driver.run(
+            "hello",
+            artifacts=[
+                TextArtifact("far", embedding=[0, 1]),
+                TextArtifact("wrong dimensions", embedding=[0, 1, 0]),
+                TextArtifact("near", embedding=[1, 0]),
+            ],
+        )
+
+        assert embedded == ["hello", "wrong dimensions"]
+        assert [artifact.value for artifact in result] == ["wrong dimensions", "near", "far"]
+
+    def test_run_without_artifact_embeddings(self):
+        embedded = []
+
+        def mock_output(chunk):
+            embedded.append(chunk)
+
+            return [1, 0]
+
+        driver = LocalRerankDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=mock_output), use_artifact_embeddings=False
+        )
+        driver.run("hello", artifacts=[TextArtifact("foo", embedding=[0, 1])])
+
+        assert embedded == ["hello", "foo"]
+
+    def test_run_empty(self, mock_embedding_driver):
+        assert LocalRerankDriver(embedding_driver=mock_embedding_driver).run("hello", artifacts=[]) == []
+
+    @pytest.mark.parametrize(("max_batch_size", "embed_calls", "embed_many_calls"), [(None, 3, 0), (2, 1, 1)])
+    def test_run_embeds_missing_artifacts(self, mocker, max_batch_size, embed_calls, embed_many_calls):
+        embedding_driver = MockEmbeddingDriver(max_batch_size=max_batch_size)
+        embed = mocker.spy(embedding_driver, "embed")
+        embed_many = mocker.spy(embedding_driver, "embed_many")
+
+        LocalRerankDriver(embedding_driver=embedding_driver).run(
+            "hello", artifacts=[TextArtifact("foo"), TextArtifact("bar")]
+        )
+
+        assert embed.call_count == embed_calls
+        assert embed_many.call_count == embed_many_calls
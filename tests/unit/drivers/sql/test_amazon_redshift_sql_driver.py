@@ -163,5 +163,11 @@ class TestAmazonRedshiftSqlDriver:
         rows = [{"first_name": "Bob", "last_name": "Ross"}, {"first_name": "Tony", "last_name": "Hawk"}]
         assert statement_driver.execute_query("query") == [BaseSqlDriver.RowResult(row) for row in rows]
 
+    def test_execute_query_batches(self, statement_driver):
+        rows = [{"first_name": "Bob", "last_name": "Ross"}, {"first_name": "Tony", "last_name": "Hawk"}]
+        assert list(statement_driver.execute_query_batches("query", batch_size=1)) == [
+            [BaseSqlDriver.RowResult(row)] for row in rows
+        ]
+
     def test_get_table_schema(self, describe_table_driver):
         assert describe_table_driver.get_table_schema("dev") == "['first_name', 'last_name']"
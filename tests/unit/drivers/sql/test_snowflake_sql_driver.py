@@ -96,6 +96,19 @@ class TestSnowflakeSqlDriver:
             BaseSqlDriver.RowResult(row) for row in TestSnowflakeSqlDriver.TEST_ROWS
         ]
 
+    def test_execute_query_batches(self, driver, mock_snowflake_engine, mocker):
+        connection_mock = mock_snowflake_engine.connect.return_value.__enter__.return_value
+        result_mock = connection_mock.execution_options.return_value.execute.return_value
+        result_mock.returns_rows = True
+        result_mock.partitions.return_value = iter(
+            [[mocker.MagicMock(_mapping=row)] for row in TestSnowflakeSqlDriver.TEST_ROWS]
+        )
+
+        assert list(driver.execute_query_batches("query", batch_size=1)) == [
+            [BaseSqlDriver.RowResult(row)] for row in TestSnowflakeSqlDriver.TEST_ROWS
+        ]
+        connection_mock.execution_options.assert_called_once_with(yield_per=1)
+
     def test_execute_query_raw(self, driver):
         assert driver.execute_query_raw("query") == TestSnowflakeSqlDriver.TEST_ROWS
 
@@ -19,6 +19,25 @@ class TestSqlDriver:
     def test_execute_query(self, driver):
         assert driver.execute_query("SELECT count(*) FROM test_table")[0].cells == {"count(*)": 1}
 
+    def test_execute_query_batches(self, driver):
+        driver.execute_query("INSERT INTO test_table (name, age, city) VALUES ('Bob', 30, 'Los Angeles');")
+        driver.execute_query("INSERT INTO test_table (name, age, city) VALUES ('Charlie', 22, 'Chicago');")
+
+        batches = list(driver.execute_query_batches("SELECT name FROM test_table", batch_size=2))
+
+        assert [[row.cells for row in batch] for batch in batches] == [
+            [{"name": "Alice"}, {"name": "Bob"}],
+            [{"name": "Charlie"}],
+        ]
+
+    def test_execute_query_batches_without_rows(self, driver):
+        assert list(driver.execute_query_batches("DELETE FROM test_table")) == []
+        assert driver.execute_query("SELECT count(*) FROM test_table")[0].cells == {"count(*)": 0}
+
+    def test_execute_query_batches_invalid_batch_size(self, driver):
+        with pytest.raises(ValueError, match="batch_size must be at least 1."):
+            list(driver.execute_query_batches("SELECT name FROM test_table", batch_size=0))
+
     def test_execute_query_raw(self, driver):
         assert driver.execute_query_raw("SELECT * FROM test_table") == [
             {"age": 25, "city": "New York", "id": 1, "name": "Alice"}
@@ -0,0 +1,155 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers.structure_run.local import ProcessPoolStructureRunDriver
+from griptape.drivers.structure_run.process_pool_structure_run_driver import _shutdown_active_drivers
+from griptape.structures import Agent, Pipeline
+from griptape.tasks import StructureRunTask
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def create_agent() -> Agent:
+    return Agent(prompt_driver=MockPromptDriver(mock_output=lambda _: os.environ.get("KEY", "mock output")))
+
+
+def create_pid_agent() -> Agent:
+    return Agent(prompt_driver=MockPromptDriver(mock_output=lambda _: str(os.getpid())))
+
+
+def create_slow_agent() -> Agent:
+    time.sleep(60)
+
+    return create_agent()
+
+
+def create_sleepy_pid_agent() -> Agent:
+    time.sleep(0.5)
+
+    return create_pid_agent()
+
+
+def create_multiprocessing_agent() -> Agent:
+    process = multiprocessing.get_context("fork").Process(target=os.getpid)
+    process.start()
+    process.join()
+
+    return Agent(prompt_driver=MockPromptDriver(mock_output=lambda _: str(process.exitcode)))
+
+
+def create_failing_agent() -> Agent:
+    raise ValueError("foo")
+
+
+class TestProcessPoolStructureRunDriver:
+    @pytest.fixture()
+    def create_driver(self):
+        drivers = []
+
+        def create_driver(**kwargs) -> ProcessPoolStructureRunDriver:
+            driver = ProcessPoolStructureRunDriver(**{"max_workers": 1, "start_method": "fork", **kwargs})
+            drivers.append(driver)
+
+            return driver
+
+        yield create_driver
+
+        for driver in drivers:
+            driver.shutdown()
+
+    def test_run(self, create_driver):
+        pipeline = Pipeline()
+        driver = create_driver(create_structure=create_agent, start_method="spawn")
+        task = StructureRunTask(structure_run_driver=driver)
+
+        pipeline.add_task(task)
+
+        assert task.run().to_text() == "mock output"
+
+    def test_run_with_args(self, create_driver):
+        driver = create_driver(create_structure=create_agent)
+
+        output = driver.run(TextArtifact("foo"))
+
+        assert isinstance(output, TextArtifact)
+        assert output.value == "mock output"
+
+    def test_run_with_env(self, create_driver):
+        driver = create_driver(create_structure=create_agent, env={"KEY": "value"})
+
+        assert driver.run().to_text() == "value"
+        assert "KEY" not in os.environ
+
+    def test_run_reuses_workers(self, create_driver):
+        driver = create_driver(create_structure=create_pid_agent)
+
+        assert driver.run().to_text() == driver.run().to_text()
+
+    def test_run_with_max_runs_per_worker(self, create_driver):
+        driver = create_driver(create_structure=create_pid_agent, max_runs_per_worker=1)
+
+        assert driver.run().to_text() != driver.run().to_text()
+
+    def test_run_with_max_runs_per_worker_joins_workers(self, create_driver):
+        driver = create_driver(create_structure=create_pid_agent, max_runs_per_worker=1)
+
+        driver.run()
+        worker = driver._idle_workers.queue[0]
+        driver.run()
+
+        assert worker.process.exitcode is not None
+
+    def test_shutdown_joins_workers(self, create_driver):
+        driver = create_driver(create_structure=create_pid_agent)
+
+        driver.run()
+        worker = driver._idle_workers.queue[0]
+        driver.shutdown()
+
+        assert worker.process.exitcode is not None
+
+    def test_shutdown_active_drivers(self, create_driver):
+        driver = create_driver(create_structure=create_pid_agent)
+
+        driver.run()
+        worker = driver._idle_workers.queue[0]
+        _shutdown_active_drivers()
+
+        assert worker.process.exitcode is not None
+        assert driver._workers == {}
+
+    def test_run_starts_processes(self, create_driver):
+        driver = create_driver(create_structure=create_multiprocessing_agent)
+
+        assert driver.run().to_text() == "0"
+
+    def test_run_with_timeout(self, create_driver):
+        driver = create_driver(create_structure=create_slow_agent, timeout=0.1)
+
+        with pytest.raises(TimeoutError, match="Structure run timed out after 0.1 seconds."):
+            driver.run()
+
+        driver.create_structure = create_agent
+        assert driver.run().to_text() == "mock output"
+
+    def test_run_with_error(self, create_driver):
+        driver = create_driver(create_structure=create_failing_agent)
+
+        with pytest.raises(ValueError, match="foo"):
+            driver.run()
+
+    def test_run_concurrently(self, create_driver):
+        driver = create_driver(create_structure=create_sleepy_pid_agent, max_workers=2)
+
+        with ThreadPoolExecutor(2) as executor:
+            pids = list(executor.map(lambda _: driver.run().to_text(), range(2)))
+
+        assert pids[0] != pids[1]
+
+    def test_max_workers(self):
+        with pytest.raises(ValueError, match="max_workers must be at least 1."):
+            ProcessPoolStructureRunDriver(create_structure=create_agent, max_workers=0)
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 from griptape.drivers.vector.amazon_opensearch import AmazonOpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestAmazonOpenSearchVectorStoreDriver:
@@ -18,6 +19,22 @@ class TestAmazonOpenSearchVectorStoreDriver:
     def test_upsert_vector(self, driver):
         assert driver.upsert_vector([0.1, 0.2, 0.3], vector_id="foo", namespace="company") == "foo"
 
+    @pytest.mark.parametrize(("service", "expected_id"), [("es", "foo"), ("aoss", None)])
+    def test_to_bulk_action(self, service, expected_id):
+        driver = AmazonOpenSearchVectorStoreDriver(
+            host="localhost",
+            index_name="test",
+            service=service,
+            session=create_autospec(boto3.Session, instance=True),
+            client=Mock(),
+            embedding_driver=MockEmbeddingDriver(),
+        )
+
+        action = driver._to_bulk_action(driver.Entry(id="foo", vector=[0.1, 0.2]))
+
+        assert action.get("_id") == expected_id
+        assert action["_source"]["vector"] == [0.1, 0.2]
+
     def test_load_entry(self, driver):
         mock_entry = Mock()
         mock_entry.id = "foo2"
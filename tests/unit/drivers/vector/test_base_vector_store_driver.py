@@ -36,6 +36,20 @@ class TestBaseVectorStoreDriver(ABC):
         assert foo_entries[0].to_artifact().value == "foo"
         assert bar_entries[0].to_artifact().value == "bar"
 
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.0, 1.0], namespace="test-namespace", meta={"a": 1}),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1.0, 0.0], namespace="test-namespace"),
+                BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 1.0]),
+            ]
+        )
+
+        assert vector_ids == ["foo", "bar", "foo"]
+        assert len(driver.load_entries(namespace="test-namespace")) == 2
+        assert driver.load_entry("foo", namespace="test-namespace").meta == {"a": 1}
+        assert driver.load_entry("foo").vector == [1.0, 1.0]
+
     def test_query(self, driver):
         vector_id = driver.upsert(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -47,6 +61,14 @@ class TestBaseVectorStoreDriver(ABC):
         assert driver.query("foobar")[0].to_artifact().value == "foobar"
         assert driver.query("foobar")[0].id == vector_id
 
+    def test_load_artifacts(self, driver):
+        driver.upsert(TextArtifact("foobar"), namespace="test-namespace")
+
+        artifacts = driver.load_artifacts(namespace="test-namespace")
+
+        assert [artifact.value for artifact in artifacts] == ["foobar"]
+        assert artifacts[0].embedding == [0, 1]
+
     def test_load_entry(self, driver):
         vector_id = driver.upsert(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -10,3 +10,8 @@ class TestEntry:
     def test_to_artifact(self):
         entry = BaseVectorStoreDriver.Entry(id="test", vector=[], meta={"artifact": TextArtifact("foo").to_json()})
         assert entry.to_artifact().value == "foo"
+        assert entry.to_artifact().embedding is None
+
+    def test_to_artifact_with_vector(self):
+        entry = BaseVectorStoreDriver.Entry(id="test", vector=[0, 1], meta={"artifact": TextArtifact("foo").to_json()})
+        assert entry.to_artifact().embedding == [0.0, 1.0]
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
+from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.drivers.vector.local import LocalVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.unit.drivers.vector.test_base_vector_store_driver import TestBaseVectorStoreDriver
@@ -50,10 +52,124 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
 
     @pytest.mark.parametrize("execution_number", range(1000))
     def test_upsert_collection_meta(self, driver, mocker, execution_number):
-        spy = mocker.spy(driver, "upsert_vector")
+        spy = mocker.spy(driver, "upsert_vectors")
         artifact_1 = TextArtifact("foo bar", id="foo")
         artifact_2 = TextArtifact("bar foo", id="bar")
 
         driver.upsert_collection({"foo": [artifact_1, artifact_2]}, meta={"foo": "bar"})
 
-        assert spy.call_args_list[0].kwargs["meta"]["artifact"] != spy.call_args_list[1].kwargs["meta"]["artifact"]
+        entries = spy.call_args.args[0]
+        assert entries[0].meta["artifact"] != entries[1].meta["artifact"]
+
+    def test_query_vector_namespace_prefix(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", namespace="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="foo-bar")
+
+        assert [entry.id for entry in driver.query_vector([0.0, 1.0], namespace="foo")] == ["foo"]
+
+    def test_query_vectors(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="x")
+        driver.upsert_vector([0.0, 1.0], vector_id="y")
+
+        results = driver.query_vectors([[1.0, 0.1], [0.1, 1.0]], count=1)
+
+        assert [[entry.id for entry in result] for result in results] == [["x"], ["y"]]
+
+
+class TestMatrixIndexLocalVectorStoreDriver(TestLocalVectorStoreDriver):
+    @pytest.fixture()
+    def driver(self):
+        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), use_matrix_index=True)
+
+    def test_query_vector_matches_calculate_relatedness(self, driver):
+        rng = np.random.default_rng(0)
+        default_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+        for i, vector in enumerate(rng.random((100, 8)).tolist()):
+            namespace = "even" if i % 2 == 0 else "odd"
+            driver.upsert_vector(vector, vector_id=str(i), namespace=namespace)
+            default_driver.upsert_vector(vector, vector_id=str(i), namespace=namespace)
+
+        query = rng.random(8).tolist()
+
+        for namespace in [None, "even", "odd"]:
+            expected = default_driver.query_vector(query, count=10, namespace=namespace)
+            result = driver.query_vector(query, count=10, namespace=namespace)
+
+            assert [entry.id for entry in result] == [entry.id for entry in expected]
+            assert [entry.score for entry in result] == pytest.approx([entry.score for entry in expected], rel=1e-5)
+
+    def test_query_vector_after_upsert(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="x")
+
+        assert [entry.id for entry in driver.query_vector([1.0, 0.0])] == ["x"]
+
+        driver.upsert_vector([0.0, 1.0], vector_id="x")
+        driver.upsert_vector([1.0, 0.0], vector_id="y")
+
+        result = driver.query_vector([1.0, 0.0])
+
+        assert [entry.id for entry in result] == ["y", "x"]
+        assert result[1].score == pytest.approx(0.0)
+
+    def test_query_vector_mismatched_dimensions(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="x")
+        driver.query_vector([1.0, 0.0])
+        driver.upsert_vector([1.0, 0.0, 0.0], vector_id="y")
+
+        with pytest.raises(ValueError):
+            driver.query_vector([1.0, 0.0])
+
+    def test_query_vector_empty(self, driver):
+        assert driver.query_vector([1.0, 0.0]) == []
+        assert driver.query_vectors([[1.0, 0.0], [0.0, 1.0]]) == [[], []]
+
+    def test_query_vector_after_entries_changed(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="x")
+        driver.upsert_vector([0.0, 1.0], vector_id="y")
+        driver.query_vector([1.0, 0.0])
+
+        driver.entries["x"] = BaseVectorStoreDriver.Entry(id="x", vector=[0.0, 1.0])
+
+        assert [entry.score for entry in driver.query_vector([1.0, 0.0])] == pytest.approx([0.0, 0.0])
+
+        driver.entries = {"z": BaseVectorStoreDriver.Entry(id="z", vector=[1.0, 0.0]), "y": driver.entries["y"]}
+
+        assert [entry.id for entry in driver.query_vector([1.0, 0.0])] == ["z", "y"]
+
+    def test_query_vector_while_overwriting(self, driver, mocker):
+        driver.upsert_vector([1.0, 0.0], vector_id="x")
+        driver.upsert_vector([0.0, 1.0], vector_id="y")
+        driver.query_vector([1.0, 0.0])
+        norm = np.linalg.norm
+        overwritten = []
+
+        def overwrite_during_scoring(*args, **kwargs):
+            # The first norm computed outside the lock is the query's, so the overwrite lands while the query scores.
+            if not overwritten:
+                overwritten.append(True)
+                driver.upsert_vector([3.0, 4.0], vector_id="x")
+            return norm(*args, **kwargs)
+
+        mocker.patch("numpy.linalg.norm", side_effect=overwrite_during_scoring)
+        result = driver.query_vector([1.0, 0.0], count=1)
+        mocker.stopall()
+
+        assert result[0].id == "x"
+        assert result[0].score == pytest.approx(1.0)
+        assert driver.query_vector([1.0, 0.0], count=1)[0].score == pytest.approx(0.6)
+
+
+class TestBatchedEmbeddingLocalVectorStoreDriver(TestLocalVectorStoreDriver):
+    @pytest.fixture()
+    def driver(self):
+        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(max_batch_size=2))
+
+    def test_upsert_collection_batches_embeddings(self, driver, mocker):
+        spy = mocker.spy(driver.embedding_driver, "try_embed_chunks")
+
+        driver.upsert_collection({"foo": [TextArtifact("foo"), TextArtifact("bar")], "bar": [TextArtifact("baz")]})
+
+        assert [call.args[0] for call in spy.call_args_list] == [["foo", "bar"], ["baz"]]
+        assert [artifact.value for artifact in driver.load_artifacts(namespace="foo")] == ["foo", "bar"]
+        assert [artifact.value for artifact in driver.load_artifacts(namespace="bar")] == ["baz"]
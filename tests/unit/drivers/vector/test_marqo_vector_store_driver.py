@@ -2,6 +2,7 @@ from collections import namedtuple
 
 import pytest
 
+from griptape import utils
 from griptape.artifacts import TextArtifact
 from griptape.drivers.vector.marqo import MarqoVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
@@ -117,6 +118,17 @@ class TestMarqoVectorStorageDriver:
         }
         assert result == expected_return_value["items"][0]["_id"]
 
+    def test_upsert_collection(self, driver, mock_marqo):
+        mock_marqo.index().add_documents.side_effect = lambda docs, **kwargs: {
+            "errors": False,
+            "items": [{"_id": doc["_id"], "result": "created", "status": 201} for doc in docs],
+        }
+
+        result = driver.upsert_collection({"foo": [TextArtifact("a"), TextArtifact("b")]})
+
+        assert result == {"foo": [utils.str_to_hash("a"), utils.str_to_hash("b")]}
+        assert mock_marqo.index().add_documents.call_count == 2
+
     def test_query_vector(self, driver, mock_marqo):
         results = driver.query_vector([0.1, 0.2, 0.3])
         mock_marqo.index().search.assert_called()
@@ -2,8 +2,10 @@ from unittest.mock import Mock, create_autospec, patch
 
 import numpy as np
 import pytest
+from opensearchpy.serializer import JSONSerializer
 
 from griptape.drivers.vector.opensearch import OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestOpenSearchVectorStoreDriver:
@@ -16,6 +18,30 @@ class TestOpenSearchVectorStoreDriver:
     def test_upsert_vector(self, driver):
         assert driver.upsert_vector([0.1, 0.2, 0.3], vector_id="foo", namespace="company") == "foo"
 
+    def test_upsert_vectors(self):
+        client = Mock()
+        client.transport.serializer = JSONSerializer()
+        client.bulk.return_value = {
+            "errors": False,
+            "items": [{"index": {"_id": "foo", "status": 201}}, {"index": {"_id": "bar", "status": 200}}],
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        vector_ids = driver.upsert_vectors(
+            [
+                driver.Entry(id="foo", vector=[0.1, 0.2], namespace="company", meta={"foo": "bar"}),
+                driver.Entry(id="bar", vector=[0.3, 0.4]),
+            ]
+        )
+
+        assert vector_ids == ["foo", "bar"]
+        client.bulk.assert_called_once()
+        body = client.bulk.call_args.kwargs["body"]
+        assert '"_id":"foo"' in body
+        assert '"namespace":"company"' in body
+
     def test_load_entry(self, driver):
         mock_entry = Mock()
         mock_entry.id = "foo2"
@@ -1,9 +1,11 @@
 import os
 import tempfile
 
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
+from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.drivers.vector.local import LocalVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.unit.drivers.vector.test_base_vector_store_driver import TestBaseVectorStoreDriver
@@ -29,3 +31,161 @@ class TestPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+
+class TestLogPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
+    @pytest.fixture()
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    @pytest.fixture()
+    def persist_file(self, temp_dir):
+        return os.path.join(temp_dir, "store.log")
+
+    @pytest.fixture()
+    def driver(self, persist_file):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+    def reopen(self, persist_file):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+    def test_persistence(self, driver, persist_file):
+        driver.upsert(TextArtifact("persistent foobar"))
+        driver.upsert_vector([0.5, 0.25], vector_id="foo", namespace="bar", meta={"foo": "bar"})
+
+        new_driver = self.reopen(persist_file)
+
+        assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+        assert new_driver.load_entry("foo", namespace="bar") == BaseVectorStoreDriver.Entry(
+            id="foo", vector=[0.5, 0.25], meta={"foo": "bar"}, namespace="bar"
+        )
+
+    def test_persistence_appends(self, driver, persist_file):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        size = os.path.getsize(persist_file)
+
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 3
+        assert os.path.getsize(persist_file) > size
+
+    def test_persistence_overwrite(self, driver, persist_file):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        new_driver = self.reopen(persist_file)
+
+        assert len(new_driver.entries) == 1
+        assert new_driver.load_entry("foo").vector == [0.0, 1.0]
+
+    def test_reopen_loads_vectors_lazily(self, driver, persist_file):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+
+        new_driver = self.reopen(persist_file)
+
+        assert all(isinstance(entry.vector, np.ndarray) for entry in new_driver.entries.values())
+        assert new_driver.query_vector([0.0, 1.0], count=1, include_vectors=True)[0].vector == [0.0, 1.0]
+        assert new_driver.load_entry("foo").vector == [1.0, 0.0]
+        assert [entry.vector for entry in new_driver.load_entries()] == [[1.0, 0.0], [0.0, 1.0]]
+
+    def test_reopen_after_truncated_record(self, driver, persist_file):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+
+        with open(persist_file, "r+b") as file:
+            file.truncate(os.path.getsize(persist_file) - 5)
+
+        new_driver = self.reopen(persist_file)
+
+        assert list(new_driver.entries) == ["foo"]
+
+        new_driver.upsert_vector([0.5, 0.5], vector_id="baz")
+
+        assert self.reopen(persist_file).load_entry("baz").vector == [0.5, 0.5]
+
+    def test_reopen_after_truncated_vector(self, driver, persist_file, temp_dir):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+        vectors_file = os.path.join(temp_dir, "store.log.0.vectors")
+
+        with open(vectors_file, "r+b") as file:
+            file.truncate(os.path.getsize(vectors_file) - 1)
+
+        new_driver = self.reopen(persist_file)
+
+        assert list(new_driver.entries) == ["foo"]
+
+        new_driver.upsert_vector([0.5, 0.5], vector_id="baz")
+
+        assert self.reopen(persist_file).load_entry("baz").vector == [0.5, 0.5]
+
+    def test_reopen_json_persist_file(self, persist_file, temp_dir):
+        json_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+        json_driver.upsert_vector([0.5, 0.25], vector_id="foo", namespace="bar", meta={"foo": "bar"})
+
+        new_driver = self.reopen(persist_file)
+
+        assert new_driver.load_entry("foo", namespace="bar") == BaseVectorStoreDriver.Entry(
+            id="foo", vector=[0.5, 0.25], meta={"foo": "bar"}, namespace="bar"
+        )
+        assert sorted(os.listdir(temp_dir)) == ["store.log", "store.log.0.vectors"]
+
+        new_driver.upsert_vector([1.0, 0.0], vector_id="baz")
+        reopened_driver = self.reopen(persist_file)
+
+        assert reopened_driver.load_entry("foo", namespace="bar").vector == [0.5, 0.25]
+        assert reopened_driver.load_entry("baz").vector == [1.0, 0.0]
+
+    def test_reopen_invalid_persist_file(self, persist_file):
+        with open(persist_file, "w") as file:
+            file.write("foobar")
+
+        with pytest.raises(ValueError, match='persist_format="log"'):
+            self.reopen(persist_file)
+
+    def test_compact(self, driver, persist_file, temp_dir):
+        for i in range(10):
+            driver.upsert_vector([float(i), 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        driver.compact()
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 3
+        assert sorted(os.listdir(temp_dir)) == ["store.log", "store.log.1.vectors"]
+
+        new_driver = self.reopen(persist_file)
+
+        assert new_driver.load_entry("foo").vector == [9.0, 1.0]
+        assert new_driver.load_entry("bar").vector == [1.0, 0.0]
+
+    def test_compact_after_reopen(self, driver, persist_file, temp_dir):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        new_driver = self.reopen(persist_file)
+
+        new_driver.compact()
+
+        assert sorted(os.listdir(temp_dir)) == ["store.log", "store.log.1.vectors"]
+        entry = new_driver.entries["foo"]
+        assert isinstance(entry.vector, np.ndarray)
+        assert new_driver.load_entry("foo").vector == [1.0, 0.0]
+
+    def test_compact_in_background(self, driver, persist_file, mocker):
+        mocker.patch.object(LocalVectorStoreDriver, "LOG_COMPACTION_MIN_DEAD_RECORDS", 5)
+        thread = mocker.patch("threading.Thread")
+
+        for i in range(6):
+            driver.upsert_vector([float(i), 1.0], vector_id="foo")
+
+        assert thread.call_count == 0
+
+        driver.upsert_vector([1.0, 1.0], vector_id="foo")
+
+        thread.assert_called_once_with(target=driver.compact, daemon=True)
@@ -57,6 +57,39 @@ class TestPgVectorVectorStoreDriver:
         mock_session.merge.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    @pytest.mark.parametrize(("upsert_batch_size", "expected_statements"), [(1000, 1), (1, 2)])
+    def test_upsert_vectors(self, mock_engine, upsert_batch_size, expected_statements):
+        from sqlalchemy.dialects import postgresql
+
+        conn = mock_engine.begin.return_value.__enter__.return_value
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            engine=mock_engine,
+            table_name=self.table_name,
+            upsert_batch_size=upsert_batch_size,
+        )
+        test_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+
+        returned_ids = driver.upsert_vectors(
+            [
+                driver.Entry(id=test_ids[0], vector=[1.0, 2.0, 3.0]),
+                driver.Entry(id=test_ids[1], vector=[4.0, 5.0, 6.0], namespace="foo", meta={"foo": "bar"}),
+                driver.Entry(id=test_ids[0], vector=[7.0, 8.0, 9.0]),
+            ]
+        )
+        statements = [call.args[0] for call in conn.execute.call_args_list]
+        params = [statement.compile(dialect=postgresql.dialect()).params for statement in statements]
+
+        assert returned_ids == [test_ids[0], test_ids[1], test_ids[0]]
+        assert len(statements) == expected_statements
+        assert "ON CONFLICT (id) DO UPDATE" in str(statements[0].compile(dialect=postgresql.dialect()))
+        assert sorted(value for param in params for key, value in param.items() if key.startswith("id")) == sorted(
+            test_ids
+        )
+        assert [7.0, 8.0, 9.0] in [
+            value for param in params for key, value in param.items() if key.startswith("vector")
+        ]
+
     def test_load_entry(self, mock_session, mock_engine):
         test_id = str(uuid.uuid4())
         test_vec = [0.1, 0.2, 0.3]
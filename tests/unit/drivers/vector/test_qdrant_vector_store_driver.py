@@ -57,6 +57,26 @@ class TestQdrantVectorStoreDriver:
                 points_selector=mock_import.return_value.PointIdsList(points=[vector_id]),
             )
 
+    def test_upsert_vectors(self, driver):
+        driver.upsert_batch_size = 2
+        entries = [driver.Entry(id=str(uuid.uuid4()), vector=[float(i)], meta={"i": i}) for i in range(3)]
+
+        assert driver.upsert_vectors(entries) == [entry.id for entry in entries]
+        assert driver.client.upsert.call_count == 2
+
+        points = driver.client.upsert.call_args_list[0].kwargs["points"]
+        assert points.ids == [entry.id for entry in entries[:2]]
+        assert points.vectors == [[0.0], [1.0]]
+        assert points.payloads == [{"i": 0}, {"i": 1}]
+
+    def test_upsert_vectors_with_content(self, driver):
+        entries = [driver.Entry(id=str(uuid.uuid4()), vector=[float(i)], meta={"i": i}) for i in range(2)]
+
+        driver.upsert_vectors(entries, content="foo")
+
+        points = driver.client.upsert.call_args.kwargs["points"]
+        assert points.payloads == [{"i": 0, "data": "foo"}, {"i": 1, "data": "foo"}]
+
     def test_query_vector(self, driver):
         mock_query_result = [
             MagicMock(
@@ -48,6 +48,20 @@ class TestRedisVectorStorageDriver:
             == "some_vector_id"
         )
 
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value.__enter__.return_value
+
+        assert driver.upsert_vectors(
+            [
+                driver.Entry(id="foo", vector=[1.0, 2.0, 3.0], namespace="some_namespace", meta={"foo": "bar"}),
+                driver.Entry(id="bar", vector=[4.0, 5.0, 6.0]),
+            ]
+        ) == ["foo", "bar"]
+        assert [call.args[0] for call in pipeline.hset.call_args_list] == ["some_namespace:foo", "bar"]
+        assert pipeline.hset.call_args_list[0].kwargs["mapping"]["metadata"] == '{"foo": "bar"}'
+        pipeline.execute.assert_called_once()
+        mock_client.hset.assert_not_called()
+
     def test_load_entry(self, driver, mock_hgetall):
         entry = driver.load_entry("some_vector_id")
         mock_hgetall.assert_called_once_with("some_vector_id")
@@ -1,7 +1,14 @@
+import re
+import threading
+import time
+from concurrent import futures
+
 import pytest
 
+from griptape.artifacts import ListArtifact, TextArtifact
 from griptape.engines import CsvExtractionEngine
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestCsvExtractionEngine:
@@ -11,6 +18,26 @@ class TestCsvExtractionEngine:
             column_names=["header"], prompt_driver=MockPromptDriver(mock_output="header\nmock output")
         )
 
+    @pytest.fixture()
+    def chunked_text(self):
+        return "\n\n".join(f"row {i:02}" for i in range(40))
+
+    def extract_rows(self, prompt_stack):
+        # Later chunks complete first, so results are returned out of order.
+        rows = re.findall(r"row (\d+)", prompt_stack.messages[-1].to_text())
+        time.sleep((40 - int(rows[0])) / 2000)
+
+        return "header\n" + "\n".join(f"row {row}" for row in rows)
+
+    def chunked_engine(self, **kwargs):
+        return CsvExtractionEngine(
+            column_names=["header"],
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="test-model", max_input_tokens=400), mock_output=self.extract_rows
+            ),
+            **kwargs,
+        )
+
     def test_extract_text(self, engine):
         result = engine.extract_text("mock output")
 
@@ -18,6 +45,71 @@ class TestCsvExtractionEngine:
         assert result.value[0].value == "header"
         assert result.value[1].value == "mock output"
 
+    def test_chunked_extract_text(self, chunked_text):
+        engine = self.chunked_engine()
+
+        result = engine.extract_text(chunked_text)
+
+        assert len(engine.chunker.chunk(chunked_text)) > 1
+        assert [row.value for row in result.value] == ["header", *[f"row {i:02}" for i in range(40)]]
+
+    def test_chunked_extract_text_deduplicate(self):
+        text = "\n\n".join(f"row {i % 10:02}" for i in range(40))
+
+        result = self.chunked_engine(deduplicate=True).extract_text(text)
+
+        assert [row.value for row in result.value] == ["header", *[f"row {i:02}" for i in range(10)]]
+
+    def test_chunked_extract_text_bounded_concurrency(self, chunked_text):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def extract_rows(prompt_stack):
+            nonlocal running, max_running
+
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            try:
+                return self.extract_rows(prompt_stack)
+            finally:
+                with lock:
+                    running -= 1
+
+        engine = self.chunked_engine(create_futures_executor=lambda: futures.ThreadPoolExecutor(max_workers=2))
+        engine.prompt_driver.mock_output = extract_rows
+
+        result = engine.extract_text(chunked_text)
+
+        assert len(result.value) == 41
+        assert max_running == 2
+
+    def test_extract_artifacts_stream(self, chunked_text):
+        last_row_yielded = threading.Event()
+
+        def extract_rows(prompt_stack):
+            # The first chunk only completes once the last chunk's rows have been yielded.
+            if "row 00" in prompt_stack.messages[-1].to_text():
+                assert last_row_yielded.wait(timeout=10)
+
+            return self.extract_rows(prompt_stack)
+
+        engine = self.chunked_engine()
+        engine.prompt_driver.mock_output = extract_rows
+        rows = []
+
+        for row in engine.extract_artifacts_stream(ListArtifact([TextArtifact(chunked_text)])):
+            rows.append(row.value)
+
+            if row.value == "row 39":
+                last_row_yielded.set()
+
+        assert rows[0] == "header"
+        assert sorted(rows[1:]) == [f"row {i:02}" for i in range(40)]
+        # Rows are yielded as their chunk completes.
+        assert rows.index("row 39") < rows.index("row 00")
+
     def test_text_to_csv_rows(self, engine):
         result = engine.text_to_csv_rows("key,value\nfoo,bar\nbaz,maz")
 
@@ -29,9 +29,18 @@ class TestJsonExtractionEngine:
         large_text = Path(normpath(join(dirname(__file__), "../../../resources", "test.txt"))).read_text()
 
         extracted = engine.extract_text(large_text * 50)
-        assert len(extracted) == 322
+        # The text is chunked once and every chunk yields the two mocked objects.
+        assert len(extracted) == len(engine.chunker.chunk(large_text * 50)) * 2
         assert extracted[0].value == {"test_key_1": "test_value_1"}
 
+    def test_chunked_extract_text_deduplicate(self, engine):
+        large_text = Path(normpath(join(dirname(__file__), "../../../resources", "test.txt"))).read_text()
+        engine.deduplicate = True
+
+        extracted = engine.extract_text(large_text * 50)
+
+        assert [a.value for a in extracted] == [{"test_key_1": "test_value_1"}, {"test_key_2": "test_value_2"}]
+
     def test_extract_error(self, engine):
         engine.template_schema = lambda: "non serializable"
         with pytest.raises(TypeError):
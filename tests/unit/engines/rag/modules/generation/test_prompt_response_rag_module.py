@@ -5,6 +5,7 @@ from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import PromptResponseRagModule
 from griptape.rules import Rule, Ruleset
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestPromptResponseRagModule:
@@ -29,3 +30,31 @@ class TestPromptResponseRagModule:
         assert "*META*" in system_message
         assert "*TEXT SEGMENT 1*" in system_message
         assert "*TEXT SEGMENT 2*" in system_message
+
+    @pytest.mark.parametrize("max_input_tokens", [0, 500, 800, 1200, 5000])
+    def test_run_packs_text_chunks(self, mocker, max_input_tokens):
+        text_chunks = [TextArtifact(f"*TEXT SEGMENT {i}* " * (i % 5 + 1)) for i in range(30)]
+        context = RagContext(query="test", text_chunks=text_chunks)
+        module = PromptResponseRagModule(
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="foo", max_input_tokens=max_input_tokens + 400, max_output_tokens=4096)
+            ),
+        )
+
+        def fits(num_chunks):
+            system_prompt = module.default_generate_system_template(context, text_chunks[:num_chunks])
+            prompt = module.prompt_driver.prompt_stack_to_string(module.generate_prompt_stack(system_prompt, "test"))
+
+            return len(prompt) < max_input_tokens
+
+        expected_num_chunks = next((n for n in range(len(text_chunks), 0, -1) if fits(n)), 0)
+        generate_system_template = mocker.spy(module, "generate_system_template")
+        run = mocker.spy(module.prompt_driver, "run")
+
+        module.run(context)
+
+        # Packing one chunk at a time would render the template up to 32 times.
+        assert generate_system_template.call_count <= 8
+        assert run.call_args.args[0].messages[0].to_text() == module.default_generate_system_template(
+            context, text_chunks[:expected_num_chunks]
+        )
@@ -7,6 +7,7 @@ from griptape.artifacts import ListArtifact, TextArtifact
 from griptape.common import PromptStack
 from griptape.engines import PromptSummaryEngine
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestPromptSummaryEngine:
@@ -49,3 +50,58 @@ class TestPromptSummaryEngine:
 
         output = engine.summarize_artifacts_rec([], "summary")
         assert output.value == "summary"
+
+    def test_summarize_artifacts_map_reduce(self, mocker):
+        engine = PromptSummaryEngine(
+            strategy="map_reduce",
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="foo", max_input_tokens=1000, max_output_tokens=1000),
+                mock_output=lambda prompt_stack: "summary of " + str(len(prompt_stack.messages[1].to_text())),
+            ),
+        )
+        create_futures_executor = mocker.spy(engine, "create_futures_executor")
+        run = mocker.spy(engine.prompt_driver, "run")
+
+        output = engine.summarize_artifacts(
+            ListArtifact([TextArtifact("foo bar. " * 500), TextArtifact("baz. " * 500)])
+        )
+
+        chunk_count = len(engine.chunker.chunk("foo bar. " * 500 + engine.chunk_joiner + "baz. " * 500))
+        assert chunk_count > 1
+        # One concurrent map over every chunk, then a single reduce.
+        assert create_futures_executor.call_count == 1
+        assert run.call_count == chunk_count + 1
+        assert output.value.startswith("summary of ")
+
+    def test_summarize_artifacts_map_reduce_hierarchical(self, mocker):
+        engine = PromptSummaryEngine(
+            strategy="map_reduce",
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="foo", max_input_tokens=1000, max_output_tokens=1000),
+                mock_output=lambda prompt_stack: "summary " * 20,
+            ),
+        )
+        create_futures_executor = mocker.spy(engine, "create_futures_executor")
+
+        output = engine.summarize_text("foo bar. " * 5000)
+
+        # The partial summaries don't fit into a single prompt, so they are reduced again.
+        assert create_futures_executor.call_count > 1
+        assert output == "summary " * 20
+
+    def test_summarize_artifacts_map_reduce_no_progress(self, mocker):
+        engine = PromptSummaryEngine(
+            strategy="map_reduce",
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="foo", max_input_tokens=1000, max_output_tokens=1000),
+                mock_output=lambda prompt_stack: "summary " * 60,
+            ),
+        )
+        summarize_artifacts_rec = mocker.spy(engine, "summarize_artifacts_rec")
+
+        assert engine.summarize_text("foo bar. " * 5000)
+        summarize_artifacts_rec.assert_called()
+
+    def test_summarize_artifacts_map_reduce_no_artifacts(self):
+        with pytest.raises(ValueError, match="No artifacts to summarize"):
+            PromptSummaryEngine(strategy="map_reduce").summarize_artifacts_map_reduce([])
@@ -0,0 +1,15 @@
+import pytest
+
+from griptape.events import StoreArtifactsProgressEvent
+
+
+class TestStoreArtifactsProgressEvent:
+    @pytest.fixture()
+    def store_artifacts_progress_event(self):
+        return StoreArtifactsProgressEvent(namespace="foo", stored_count=1, total_count=2)
+
+    def test_to_dict(self, store_artifacts_progress_event):
+        assert "timestamp" in store_artifacts_progress_event.to_dict()
+        assert store_artifacts_progress_event.to_dict()["namespace"] == "foo"
+        assert store_artifacts_progress_event.to_dict()["stored_count"] == 1
+        assert store_artifacts_progress_event.to_dict()["total_count"] == 2
@@ -40,6 +40,14 @@ class TestSqlLoader:
         assert artifact[1].value == "id: 2\nname: Bob\nage: 30\ncity: Los Angeles"
         assert artifact[2].value == "id: 3\nname: Charlie\nage: 22\ncity: Chicago"
 
+    def test_load_batches(self, loader):
+        loader.batch_size = 2
+        artifacts = list(loader.load_batches("SELECT * FROM test_table;"))
+
+        assert [len(artifact) for artifact in artifacts] == [2, 1]
+        assert artifacts[0][0].value == "id: 1\nname: Alice\nage: 25\ncity: New York"
+        assert artifacts[1][0].value == "id: 3\nname: Charlie\nage: 22\ncity: Chicago"
+
     def test_load_collection(self, loader):
         sources = ["SELECT * FROM test_table LIMIT 1;", "SELECT * FROM test_table LIMIT 2;"]
         artifacts = loader.load_collection(sources)
@@ -51,3 +59,7 @@ class TestSqlLoader:
 
         assert artifacts[loader.to_key(sources[0])][0].value == "id: 1\nname: Alice\nage: 25\ncity: New York"
         assert artifacts[loader.to_key(sources[1])][0].value == "id: 1\nname: Alice\nage: 25\ncity: New York"
+
+    def test_invalid_batch_size(self, loader):
+        with pytest.raises(ValueError, match="batch_size must be at least 1."):
+            SqlLoader(sql_driver=loader.sql_driver, batch_size=0)
@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from griptape.artifacts import TextArtifact
 from griptape.common import PromptStack
 from griptape.memory.structure import BaseConversationMemory, ConversationMemory, Run
@@ -177,3 +179,50 @@ class TestConversationMemory:
         assert prompt_stack.messages[2].content[0].artifact.value == "bar2"
         assert prompt_stack.messages[-2].content[0].artifact.value == "foo"
         assert prompt_stack.messages[-1].content[0].artifact.value == "bar"
+
+    # Per-run token counts only seed the search, so misleading counts must not change the result.
+    @pytest.mark.parametrize("run_token_count", [None, 0, 10_000])
+    def test_add_to_prompt_stack_autopruning_matches_linear_search(self, mocker, run_token_count):
+        runs = [Run(input=TextArtifact("foo" * (i % 7 + 1)), output=TextArtifact(f"bar{i}")) for i in range(50)]
+        memory = ConversationMemory(autoprune=True, autoload=False, runs=runs)
+        if run_token_count is not None:
+            mocker.patch.object(
+                MockTokenizer, "count_tokens_batch", side_effect=lambda texts: [run_token_count] * len(texts)
+            )
+
+        def linear_search(prompt_driver, prompt_stack):
+            for num_runs in range(len(runs), 0, -1):
+                temp_stack = PromptStack(messages=[*prompt_stack.messages, *memory.to_prompt_stack(num_runs).messages])
+                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
+                    prompt_driver.prompt_stack_to_string(temp_stack)
+                )
+                if tokens_left > 0:
+                    return num_runs
+            return 0
+
+        for max_input_tokens in range(0, 1500, 37):
+            prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=max_input_tokens))
+            prompt_stack = PromptStack()
+            prompt_stack.add_system_message("fizz")
+            memory._run_token_counts.clear()
+
+            memory.add_to_prompt_stack(prompt_driver, prompt_stack)
+
+            assert len(prompt_stack.messages) == 1 + 2 * linear_search(
+                prompt_driver, PromptStack(messages=[prompt_stack.messages[0]])
+            )
+
+    def test_add_to_prompt_stack_autopruning_caches_run_token_counts(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=100))
+        memory = ConversationMemory(
+            autoprune=True,
+            autoload=False,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(20)],
+        )
+        count_tokens_batch = mocker.spy(prompt_driver.tokenizer, "count_tokens_batch")
+
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+        memory.add_run(Run(input=TextArtifact("foo"), output=TextArtifact("bar")))
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        assert [len(call.args[0]) for call in count_tokens_batch.call_args_list] == [20, 1]
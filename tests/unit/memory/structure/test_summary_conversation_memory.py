@@ -1,10 +1,12 @@
 import json
 
 from griptape.artifacts import TextArtifact
+from griptape.common import PromptStack
 from griptape.memory.structure import Run, SummaryConversationMemory
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestSummaryConversationMemory:
@@ -114,3 +116,30 @@ class TestSummaryConversationMemory:
         assert restored_memory.summary_index == 2
         assert restored_memory.meta["summary"] == "test summary"
         assert restored_memory.meta["summary_index"] == 2
+
+    def test_add_to_prompt_stack_autopruning(self):
+        memory = SummaryConversationMemory(
+            autoprune=True,
+            autoload=False,
+            summary="foobar",
+            summary_index=10,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(20)],
+        )
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=100))
+
+        prompt_stack = memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        # Only the summary and the most recent run fit.
+        assert [message.to_text() for message in prompt_stack.messages] == [
+            "Summary of the conversation so far: foobar",
+            "foo19",
+            "bar19",
+        ]
+
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=1000))
+
+        prompt_stack = memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        # The summary and every unsummarized run fit.
+        assert len(prompt_stack.messages) == 21
+        assert prompt_stack.messages[0].to_text() == "Summary of the conversation so far: foobar"
@@ -15,6 +15,12 @@ class TestBlobArtifactStorage:
 
         assert storage.load_artifacts("test").value == [artifact]
 
+    def test_store_artifacts(self, storage):
+        artifacts = [BlobArtifact(b"foo"), BlobArtifact(b"bar")]
+        storage.store_artifacts("test", artifacts)
+
+        assert storage.load_artifacts("test").value == artifacts
+
     def test_load_artifacts(self, storage):
         artifact = BlobArtifact(b"foo", name="foo")
         storage.store_artifact("test", artifact)
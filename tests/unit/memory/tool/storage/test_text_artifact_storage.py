@@ -1,6 +1,12 @@
+from unittest.mock import Mock
+
 import pytest
 
 from griptape.artifacts import BlobArtifact, TextArtifact
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+from griptape.events import EventBus, EventListener, StoreArtifactsProgressEvent
+from griptape.memory.task.storage import TextArtifactStorage
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.utils import defaults
 
 
@@ -15,6 +21,41 @@ class TestTextArtifactStorage:
 
         assert storage.load_artifacts("test").value[0].value == "foo"
 
+    def test_store_artifacts(self, storage):
+        mock_handler = Mock()
+        EventBus.add_event_listener(EventListener(on_event=mock_handler, event_types=[StoreArtifactsProgressEvent]))
+        storage.batch_size = 2
+        storage.store_artifacts("test", [TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")])
+
+        assert [artifact.value for artifact in storage.load_artifacts("test")] == ["foo", "bar", "baz"]
+        assert [
+            (event.namespace, event.stored_count, event.total_count)
+            for event in [call.args[0] for call in mock_handler.call_args_list]
+        ] == [("test", 2, 3), ("test", 3, 3)]
+
+    def test_store_artifacts_with_overridden_upsert(self, mocker):
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        upsert = mocker.patch.object(LocalVectorStoreDriver, "upsert", return_value="foo")
+        upsert_vectors = mocker.spy(vector_store_driver, "upsert_vectors")
+        storage = TextArtifactStorage(vector_store_driver=vector_store_driver)
+
+        storage.store_artifacts("test", [TextArtifact("foo"), TextArtifact("bar")])
+
+        assert upsert.call_count == 2
+        upsert_vectors.assert_not_called()
+
+    def test_batch_size_validation(self):
+        with pytest.raises(ValueError, match="batch_size must be at least 1."):
+            TextArtifactStorage(
+                vector_store_driver=LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()), batch_size=0
+            )
+
+    def test_store_artifacts_with_non_text_artifact(self, storage):
+        with pytest.raises(ValueError):
+            storage.store_artifacts("test", [TextArtifact("foo"), BlobArtifact(b"bar")])
+
+        assert not bool(storage.load_artifacts("test"))
+
     def test_load_artifacts(self, storage):
         artifact = TextArtifact("foo", name="foo")
         storage.store_artifact("test", artifact)
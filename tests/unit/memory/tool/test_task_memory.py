@@ -35,6 +35,13 @@ class TestTaskMemory:
         assert memory.store_artifact("test", InfoArtifact("foo1", name="foobar")).name == "foobar"
         assert memory.store_artifact("test", ListArtifact([TextArtifact("foo1")])) is None
 
+    def test_store_list_artifact(self, memory, mocker):
+        mock_store_artifact = mocker.patch.object(TextArtifactStorage, "store_artifact")
+
+        assert memory.store_artifact("test", ListArtifact([TextArtifact("foo1"), TextArtifact("foo2")])) is None
+        assert [artifact.value for artifact in memory.load_artifacts("test")] == ["foo1", "foo2"]
+        mock_store_artifact.assert_not_called()
+
     def test_find_input_memory(self, memory):
         assert memory.find_input_memory(memory.name) == memory
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from typing import Literal, Optional, Union
@@ -174,3 +175,34 @@ class TestBaseSchema:
 
     def test_types_override(self):
         assert MockSerializable().to_dict(types_overrides={"foo": int})
+
+    def test_from_attrs_cls_cached(self):
+        schema_cls = BaseSchema.from_attrs_cls(MockSerializable)
+
+        assert BaseSchema.from_attrs_cls(MockSerializable) is schema_cls
+        assert BaseSchema.from_attrs_cls(MockSerializable, serializable_overrides={"bar": False}) is not schema_cls
+        assert BaseSchema.from_attrs_cls(MockSerializable, types_overrides={"foo": int}) is not schema_cls
+        assert BaseSchema.from_attrs_cls(
+            MockSerializable, serializable_overrides={"bar": False}
+        ) is BaseSchema.from_attrs_cls(MockSerializable, serializable_overrides={"bar": False})
+
+    def test_from_attrs_cls_cached_concurrently(self):
+        BaseSchema.clear_schema_cache(MockSerializable)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            schema_classes = list(executor.map(lambda _: BaseSchema.from_attrs_cls(MockSerializable), range(32)))
+
+        assert all(schema_cls is schema_classes[0] for schema_cls in schema_classes)
+
+    def test_clear_schema_cache(self):
+        schema_cls = BaseSchema.from_attrs_cls(MockSerializable)
+        text_artifact_schema_cls = BaseSchema.from_attrs_cls(TextArtifact)
+
+        BaseSchema.clear_schema_cache(MockSerializable)
+
+        assert BaseSchema.from_attrs_cls(MockSerializable) is not schema_cls
+        assert BaseSchema.from_attrs_cls(TextArtifact) is text_artifact_schema_cls
+
+        BaseSchema.clear_schema_cache()
+
+        assert BaseSchema.from_attrs_cls(TextArtifact) is not text_artifact_schema_cls
@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 from unittest.mock import Mock
 
@@ -197,6 +198,18 @@ class TestAgent:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        task = PromptTask("test")
+        agent = Agent(prompt_driver=MockPromptDriver(), conversation_memory=ConversationMemory())
+        agent.add_task(task)
+
+        result = asyncio.run(agent.arun())
+
+        assert result is agent
+        assert "mock output" in result.output_task.output.to_text()
+        assert task.state == BaseTask.State.FINISHED
+        assert len(agent.conversation_memory.runs) == 1
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         agent = Agent(prompt_driver=MockPromptDriver())
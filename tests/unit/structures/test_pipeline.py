@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -331,6 +332,26 @@ class TestPipeline:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        prompt_task = PromptTask("test")
+        code_task = CodeExecutionTask(on_run=lambda task: TextArtifact(f"{task.parents[0].output.value}!"))
+        pipeline = Pipeline(tasks=[prompt_task, code_task])
+
+        result = asyncio.run(pipeline.arun())
+
+        assert result is pipeline
+        assert pipeline.output.value == "mock output!"
+        assert prompt_task.state == BaseTask.State.FINISHED
+        assert code_task.state == BaseTask.State.FINISHED
+
+    def test_arun_with_error_artifact(self, error_artifact_task):
+        end_task = PromptTask("end")
+        pipeline = Pipeline(tasks=[error_artifact_task, end_task])
+
+        asyncio.run(pipeline.arun())
+
+        assert end_task.state == BaseTask.State.PENDING
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         pipeline = Pipeline()
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from griptape.events import FinishStructureRunEvent, FinishTaskEvent, StartTaskEvent
@@ -72,6 +74,7 @@ class TestStructure:
                     "parent_ids": agent.tasks[0].parent_ids,
                     "child_ids": agent.tasks[0].child_ids,
                     "max_meta_memory_entries": agent.tasks[0].max_meta_memory_entries,
+                    "priority": agent.tasks[0].priority,
                     "context": agent.tasks[0].context,
                     "rulesets": [],
                     "rules": [],
@@ -170,3 +173,90 @@ class TestStructure:
         for idx, event in enumerate(events):
             assert isinstance(event, expected_event_types[idx])
         assert len(EventBus.event_listeners) == 0
+
+    def test_arun_stream(self):
+        from griptape.events import (
+            EventBus,
+            FinishPromptEvent,
+            StartPromptEvent,
+            StartStructureRunEvent,
+        )
+
+        agent = Agent()
+
+        async def arun_stream() -> list:
+            return [event async for event in agent.arun_stream()]
+
+        events = asyncio.run(arun_stream())
+
+        assert [type(event) for event in events] == [
+            StartStructureRunEvent,
+            StartTaskEvent,
+            StartPromptEvent,
+            FinishPromptEvent,
+            FinishTaskEvent,
+        ]
+        assert agent.output.value == "mock output"
+        assert len(EventBus.event_listeners) == 0
+
+    def test_arun_stream_concurrent(self):
+        from griptape.events import StartStructureRunEvent
+
+        agents = [Agent(prompt_driver=MockPromptDriver(mock_output=f"output {i}")) for i in range(3)]
+
+        async def arun_stream(agent: Agent) -> list:
+            return [event async for event in agent.arun_stream(event_types=[StartStructureRunEvent])]
+
+        async def arun_streams() -> list:
+            return await asyncio.gather(*(arun_stream(agent) for agent in agents))
+
+        for agent, events in zip(agents, asyncio.run(arun_streams())):
+            assert [event.structure_id for event in events] == [agent.id]
+        assert [agent.output.value for agent in agents] == ["output 0", "output 1", "output 2"]
+
+    def test_arun_stream_raises(self):
+        pipeline = Pipeline(tasks=[PromptTask(parent_ids=["missing"])])
+
+        async def arun_stream() -> list:
+            return [event async for event in pipeline.arun_stream()]
+
+        with pytest.raises(ValueError, match="Task with id missing doesn't exist."):
+            asyncio.run(arun_stream())
+
+    def test_find_task(self):
+        pipeline = Pipeline(tasks=[PromptTask(id="foo"), PromptTask(id="bar")])
+
+        assert pipeline.find_task("bar") is pipeline.tasks[1]
+        assert pipeline.try_find_task("baz") is None
+
+        with pytest.raises(ValueError, match="Task with id baz doesn't exist."):
+            pipeline.find_task("baz")
+
+    def test_find_task_after_add_and_insert(self):
+        pipeline = Pipeline(tasks=[PromptTask(id="foo")])
+        pipeline.find_task("foo")
+
+        pipeline.add_task(PromptTask(id="bar"))
+        pipeline.insert_task(pipeline.find_task("foo"), PromptTask(id="baz"))
+
+        assert [task.id for task in pipeline.tasks] == ["foo", "baz", "bar"]
+        assert pipeline.find_task("baz").parents == [pipeline.find_task("foo")]
+        assert pipeline.find_task("bar").parents == [pipeline.find_task("baz")]
+
+    def test_find_task_after_tasks_replaced(self):
+        pipeline = Pipeline(tasks=[PromptTask(id="foo")])
+        pipeline.find_task("foo")
+
+        pipeline._tasks = [PromptTask(id="bar")]
+
+        assert pipeline.try_find_task("foo") is None
+        assert pipeline.find_task("bar") is pipeline.tasks[0]
+
+    def test_find_task_after_agent_task_replaced(self):
+        agent = Agent(tasks=[PromptTask(id="foo")])
+        agent.find_task("foo")
+
+        agent.add_task(PromptTask(id="bar"))
+
+        assert agent.try_find_task("foo") is None
+        assert agent.find_task("bar") is agent.task
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import time
 
 import pytest
@@ -7,6 +9,7 @@ from griptape.memory.structure import ConversationMemory
 from griptape.rules import Rule, Ruleset
 from griptape.structures import Workflow
 from griptape.tasks import BaseTask, CodeExecutionTask, PromptTask
+from tests.mocks.mock_task import MockTask
 from tests.mocks.mock_tool.tool import MockTool
 
 
@@ -201,6 +204,56 @@ class TestWorkflow:
         assert task1.state == BaseTask.State.FINISHED
         assert task2.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        def fn(task):
+            return TextArtifact(" ".join(sorted(parent.output.value for parent in task.parents)))
+
+        start_task = CodeExecutionTask(on_run=lambda _: TextArtifact("start"), id="start")
+        prompt_task = PromptTask("test", id="prompt", parent_ids=["start"])
+        code_task = CodeExecutionTask(on_run=fn, id="code", parent_ids=["start"])
+        end_task = CodeExecutionTask(on_run=fn, id="end", parent_ids=["prompt", "code"])
+        workflow = Workflow(tasks=[start_task, prompt_task, code_task, end_task])
+
+        result = asyncio.run(workflow.arun())
+
+        assert result is workflow
+        assert workflow.output.value == "mock output start"
+        assert all(task.is_finished() for task in workflow.tasks)
+
+    def test_arun_max_concurrency(self):
+        running = []
+        max_running = []
+        # Each task waits for another one to be running, so two tasks are guaranteed to overlap.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fn(task):
+            running.append(task.id)
+            max_running.append(len(running))
+            barrier.wait()
+            running.remove(task.id)
+            return TextArtifact(task.id)
+
+        workflow = Workflow(tasks=[CodeExecutionTask(on_run=fn) for _ in range(6)], max_concurrency=2)
+        asyncio.run(workflow.arun())
+
+        assert all(isinstance(task.output, TextArtifact) for task in workflow.tasks)
+        assert max(max_running) == 2
+
+    def test_arun_with_error_artifact(self, error_artifact_task):
+        def fn(task):
+            time.sleep(0.1)
+            return TextArtifact("done")
+
+        slow_task = CodeExecutionTask(on_run=fn)
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task, slow_task])
+        workflow = Workflow(tasks=[slow_task, error_artifact_task, end_task])
+
+        asyncio.run(workflow.arun())
+
+        assert slow_task.is_finished()
+        assert end_task.state == BaseTask.State.PENDING
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         workflow = Workflow()
@@ -767,6 +820,78 @@ class TestWorkflow:
 
         assert workflow.output is not None
 
+    def test_run_does_not_wait_for_unrelated_tasks(self):
+        finished = []
+        fast_child_finished = threading.Event()
+
+        def fn(task):
+            if task.id == "waiting":
+                # Only set once fast_child has run, which it can't if it waits for this task to finish.
+                fast_child_finished.wait(timeout=5)
+            finished.append(task.id)
+            if task.id == "fast_child":
+                fast_child_finished.set()
+            return TextArtifact(task.id)
+
+        waiting_task = CodeExecutionTask(on_run=fn, id="waiting")
+        fast_task = CodeExecutionTask(on_run=fn, id="fast")
+        fast_child_task = CodeExecutionTask(on_run=fn, id="fast_child", parent_ids=["fast"])
+        end_task = CodeExecutionTask(on_run=fn, id="end", parent_ids=["waiting", "fast_child"])
+        workflow = Workflow(tasks=[waiting_task, fast_task, fast_child_task, end_task])
+
+        workflow.run()
+
+        assert finished == ["fast", "fast_child", "waiting", "end"]
+
+    def test_run_max_concurrency(self):
+        running = []
+        max_running = []
+        # Each task waits for another one to be running, so two tasks are guaranteed to overlap.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fn(task):
+            running.append(task.id)
+            max_running.append(len(running))
+            barrier.wait()
+            running.remove(task.id)
+            return TextArtifact(task.id)
+
+        workflow = Workflow(tasks=[CodeExecutionTask(on_run=fn) for _ in range(6)], max_concurrency=2)
+        workflow.run()
+
+        assert all(isinstance(task.output, TextArtifact) for task in workflow.tasks)
+        assert max(max_running) == 2
+
+    def test_run_priority(self):
+        run_order = []
+
+        def fn(task):
+            run_order.append(task.id)
+            return TextArtifact(task.id)
+
+        workflow = Workflow(
+            tasks=[
+                CodeExecutionTask(on_run=fn, id="low", priority=-1),
+                CodeExecutionTask(on_run=fn, id="default"),
+                CodeExecutionTask(on_run=fn, id="high", priority=1),
+            ],
+            max_concurrency=1,
+        )
+        workflow.run()
+
+        assert run_order == ["high", "default", "low"]
+
+    def test_priority_round_trip(self):
+        workflow = Workflow(tasks=[MockTask(id="low", priority=-1), MockTask(id="high", priority=1)])
+        serialized_workflow = workflow.to_dict()
+
+        for task in serialized_workflow["tasks"]:
+            task["module_name"] = "tests.mocks.mock_task"
+
+        deserialized_workflow = Workflow.from_dict(serialized_workflow)
+
+        assert [task.priority for task in deserialized_workflow.tasks] == [-1, 1]
+
     def test_nested_tasks(self):
         workflow = Workflow(
             tasks=[
@@ -192,6 +192,7 @@ class TestBaseTask:
             "parent_ids": task.parent_ids,
             "child_ids": task.child_ids,
             "max_meta_memory_entries": task.max_meta_memory_entries,
+            "priority": task.priority,
             "context": task.context,
         }
         assert expected_task_dict == task.to_dict()
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import nullcontext
 
 import pytest
@@ -27,6 +28,27 @@ class TestPromptTask:
 
         assert task.run().to_text() == "mock output"
 
+    def test_arun(self):
+        task = PromptTask("test")
+        Pipeline().add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "mock output"
+        assert task.is_finished()
+
+    @pytest.mark.parametrize(
+        ("reflect_on_tool_use", "expected"),
+        [(True, "mock output"), (False, "ack test-value")],
+    )
+    def test_arun_with_tools(self, reflect_on_tool_use, expected):
+        task = PromptTask(
+            tools=[MockTool()],
+            prompt_driver=MockPromptDriver(use_native_tools=True),
+            reflect_on_tool_use=reflect_on_tool_use,
+        )
+
+        assert asyncio.run(task.arun()).to_text() == expected
+        assert len(task.subtasks) == (2 if reflect_on_tool_use else 1)
+
     def test_to_text(self):
         task = PromptTask("{{ test }}", context={"test": "test value"})
 
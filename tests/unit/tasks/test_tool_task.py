@@ -249,6 +249,7 @@ class TestToolTask:
             "parent_ids": task.parent_ids,
             "child_ids": task.child_ids,
             "max_meta_memory_entries": task.max_meta_memory_entries,
+            "priority": task.priority,
             "context": task.context,
             "rulesets": [],
             "rules": [],
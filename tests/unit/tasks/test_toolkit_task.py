@@ -394,6 +394,7 @@ class TestToolkitSubtask:
             "parent_ids": [],
             "child_ids": [],
             "max_meta_memory_entries": 20,
+            "priority": 0,
             "context": {},
             "rulesets": [],
             "rules": [],
@@ -0,0 +1,52 @@
+import ast
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LAZY_PACKAGES = ["griptape.drivers", "griptape.tools", "griptape.tasks"]
+
+# Heavy dependencies that importing the lazy packages must not pull in.
+COLD_START_BUDGET = ["anthropic", "boto3", "cohere", "numpy", "openai", "tiktoken", "griptape.drivers.prompt"]
+
+
+class TestImports:
+    @pytest.mark.parametrize("package", LAZY_PACKAGES)
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_lazy_imports(self, package):
+        module = importlib.import_module(package)
+        lazy_imports = module._LAZY_IMPORTS
+        type_checking_imports = {}
+
+        for node in ast.walk(ast.parse(Path(module.__file__).read_text())):
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING":
+                for import_from in node.body:
+                    for alias in import_from.names:
+                        type_checking_imports[alias.name] = f".{import_from.module}"
+
+        assert type_checking_imports == lazy_imports
+        assert set(module.__all__) == set(lazy_imports)
+        assert set(module.__all__) <= set(dir(module))
+
+        for name in module.__all__:
+            assert getattr(module, name).__name__ == name
+
+    def test_cold_start(self):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {', '.join(LAZY_PACKAGES)}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported_modules = {
+            line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")
+        }
+
+        assert not [
+            module
+            for module in imported_modules
+            for budgeted_module in COLD_START_BUDGET
+            if module == budgeted_module or module.startswith(f"{budgeted_module}.")
+        ]
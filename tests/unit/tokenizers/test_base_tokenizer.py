@@ -12,3 +12,8 @@ class TestBaseTokenizer:
             assert tokenizer.max_output_tokens == 1000
 
             assert "gpt2 not found" in caplog.text
+
+    def test_count_tokens_batch(self):
+        tokenizer = MockTokenizer(model="foo")
+
+        assert tokenizer.count_tokens_batch(["foo", "", "foo bar"]) == [3, 0, 7]
@@ -14,6 +14,7 @@ class TestHuggingFaceTokenizer:
         from_pretrained.return_value.apply_chat_template.return_value = [1, 2, 3]
         from_pretrained.return_value.decode.return_value = "foo\n\nUser: bar"
         from_pretrained.return_value.encode.return_value = [1, 2, 3]
+        from_pretrained.return_value.return_value = {"input_ids": [[1, 2, 3], [1]]}
 
         return tokenizer
 
@@ -24,6 +25,9 @@ class TestHuggingFaceTokenizer:
     def test_token_count(self, tokenizer):
         assert tokenizer.count_tokens("foo bar huzzah") == 3
 
+    def test_token_count_batch(self, tokenizer):
+        assert tokenizer.count_tokens_batch(["foo bar huzzah", "foo"]) == [3, 1]
+
     def test_input_tokens_left(self, tokenizer):
         assert tokenizer.count_input_tokens_left("foo bar huzzah") == 1021
 
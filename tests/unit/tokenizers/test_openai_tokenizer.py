@@ -1,4 +1,5 @@
 import pytest
+import tiktoken
 
 from griptape.tokenizers import OpenAiTokenizer
 
@@ -32,6 +33,19 @@ class TestOpenAiTokenizer:
     def test_token_count_for_text(self, tokenizer, expected):
         assert tokenizer.count_tokens("foo bar huzzah") == expected
 
+    @pytest.mark.parametrize("tokenizer", ["gpt-4o", "not-a-real-model"], indirect=["tokenizer"])
+    def test_token_count_batch(self, tokenizer):
+        texts = ["foo bar huzzah", "", "foo"]
+
+        assert tokenizer.count_tokens_batch(texts) == [tokenizer.count_tokens(text) for text in texts]
+
+    @pytest.mark.parametrize("tokenizer", ["gpt-4o"], indirect=["tokenizer"])
+    def test_encoding_is_cached(self, tokenizer, mocker):
+        encoding_for_model = mocker.spy(tiktoken, "encoding_for_model")
+
+        assert tokenizer.encoding is tokenizer.encoding
+        assert encoding_for_model.call_count == 1
+
     def test_initialize_with_unknown_model(self):
         tokenizer = OpenAiTokenizer(model="not-a-real-model")
         assert tokenizer.max_input_tokens == OpenAiTokenizer.DEFAULT_MAX_TOKENS - OpenAiTokenizer.TOKEN_OFFSET
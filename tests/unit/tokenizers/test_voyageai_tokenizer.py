@@ -8,6 +8,7 @@ class TestVoyageAiTokenizer:
     def mock_client(self, mocker):
         mock_client = mocker.patch("voyageai.Client")
         mock_client.return_value.count_tokens.return_value = 5
+        mock_client.return_value.tokenize.return_value = [[1, 2, 3, 4, 5], [1]]
 
         return mock_client
 
@@ -23,6 +24,10 @@ class TestVoyageAiTokenizer:
     def test_token_count(self, tokenizer, expected):
         assert tokenizer.count_tokens("foo bar huzzah") == expected
 
+    @pytest.mark.parametrize("tokenizer", ["voyage-2"], indirect=["tokenizer"])
+    def test_token_count_batch(self, tokenizer):
+        assert tokenizer.count_tokens_batch(["foo bar huzzah", "foo"]) == [5, 1]
+
     @pytest.mark.parametrize(
         ("tokenizer", "expected"),
         [("voyage-large-2", 15995), ("voyage-code-2", 15995), ("voyage-2", 3995), ("voyage-lite-02-instruct", 3995)],
@@ -0,0 +1,139 @@
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from griptape.tools.mcp.sessions import McpSessionPool
+
+
+class TestMcpSessionPool:
+    @pytest.fixture()
+    def connection(self):
+        return {"transport": "stdio", "command": "foo", "args": []}
+
+    @pytest.fixture()
+    def sessions(self, mocker):
+        sessions = []
+
+        @asynccontextmanager
+        async def create_session(connection):
+            session = mocker.MagicMock(
+                initialize=mocker.AsyncMock(),
+                call_tool=mocker.AsyncMock(return_value="result"),
+                list_tools=mocker.AsyncMock(return_value="tools"),
+                closed=False,
+            )
+            sessions.append(session)
+
+            try:
+                yield session
+            finally:
+                session.closed = True
+
+        mocker.patch("griptape.tools.mcp.sessions.create_session", create_session)
+
+        return sessions
+
+    @pytest.fixture()
+    def session_pool(self):
+        session_pool = McpSessionPool()
+
+        yield session_pool
+
+        session_pool.close()
+
+    def test_get_session(self, session_pool, connection):
+        session = session_pool.get_session(connection)
+
+        assert session_pool.get_session(dict(connection)) is session
+        assert session_pool.get_session({**connection, "args": ["bar"]}) is not session
+
+    def test_call_tool(self, session_pool, sessions, connection):
+        session = session_pool.get_session(connection)
+
+        for _ in range(3):
+            assert session_pool.run(session.call_tool("foo", {"bar": "baz"})) == "result"
+
+        assert len(sessions) == 1
+        sessions[0].initialize.assert_awaited_once()
+        assert sessions[0].call_tool.await_count == 3
+
+    def test_call_tool_concurrently(self, session_pool, sessions, connection):
+        session = session_pool.get_session(connection)
+
+        async def call_tools() -> list:
+            return await asyncio.gather(*(session.call_tool("foo", {"bar": i}) for i in range(5)))
+
+        assert session_pool.run(call_tools()) == ["result"] * 5
+        assert len(sessions) == 1
+        assert sessions[0].call_tool.await_count == 5
+
+    def test_call_tool_reconnects(self, session_pool, sessions, connection):
+        session = session_pool.get_session(connection)
+
+        session_pool.run(session.call_tool("foo", {}))
+        sessions[0].call_tool.side_effect = anyio.ClosedResourceError()
+
+        with pytest.raises(anyio.ClosedResourceError):
+            session_pool.run(session.call_tool("foo", {}))
+
+        assert sessions[0].call_tool.await_count == 2
+        assert sessions[0].closed
+        assert session_pool.run(session.call_tool("foo", {})) == "result"
+        assert len(sessions) == 2
+        assert not sessions[1].closed
+
+    def test_call_tool_retries_connecting(self, mocker, session_pool, sessions, connection):
+        from griptape.tools.mcp import sessions as sessions_module
+
+        create_session = sessions_module.create_session
+        failures = [anyio.ClosedResourceError()]
+
+        @asynccontextmanager
+        async def create_session_failing_once(connection):
+            if failures:
+                raise failures.pop()
+            async with create_session(connection) as session:
+                yield session
+
+        mocker.patch("griptape.tools.mcp.sessions.create_session", create_session_failing_once)
+        session = session_pool.get_session(connection)
+
+        assert session_pool.run(session.call_tool("foo", {})) == "result"
+        assert len(sessions) == 1
+        sessions[0].call_tool.assert_awaited_once()
+
+    def test_list_tools_reconnects(self, session_pool, sessions, connection):
+        session = session_pool.get_session(connection)
+
+        session_pool.run(session.list_tools())
+        sessions[0].list_tools.side_effect = anyio.ClosedResourceError()
+
+        assert session_pool.run(session.list_tools()) == "tools"
+        assert len(sessions) == 2
+        assert sessions[0].closed
+        assert not sessions[1].closed
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="ExceptionGroup is built in from Python 3.11")
+    def test_list_tools_reconnects_on_exception_group(self, session_pool, sessions, connection):
+        session = session_pool.get_session(connection)
+
+        session_pool.run(session.list_tools())
+        sessions[0].list_tools.side_effect = ExceptionGroup(  # noqa: F821
+            "unhandled errors in a TaskGroup", [anyio.BrokenResourceError()]
+        )
+
+        assert session_pool.run(session.list_tools()) == "tools"
+        assert len(sessions) == 2
+        assert sessions[0].closed
+
+    def test_close(self, session_pool, sessions, connection):
+        session_pool.run(session_pool.get_session(connection).call_tool("foo", {}))
+
+        session_pool.close()
+
+        assert sessions[0].closed
+        assert session_pool.run(session_pool.get_session(connection).call_tool("foo", {})) == "result"
+        assert len(sessions) == 2
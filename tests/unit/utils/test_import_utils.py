@@ -1,6 +1,7 @@
 import pytest
 
 from griptape.utils import import_optional_dependency, is_dependency_installed
+from griptape.utils.import_utils import lazy_imports
 
 
 class TestImportUtils:
@@ -16,3 +17,16 @@ class TestImportUtils:
         assert is_dependency_installed("boto3") is True
 
         assert is_dependency_installed("foobar") is False
+
+    def test_lazy_imports(self):
+        from griptape.utils.j2 import J2
+
+        module_globals = {"__name__": "griptape.utils"}
+        module_getattr, module_dir = lazy_imports(module_globals, {"J2": ".j2"})
+
+        assert module_getattr("J2") is J2
+        assert module_globals["J2"] is J2
+        assert module_dir() == ["J2", "__name__"]
+
+        with pytest.raises(AttributeError, match="module 'griptape.utils' has no attribute 'foo'"):
+            module_getattr("foo")
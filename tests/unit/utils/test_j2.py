@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from griptape.utils import J2
+
+
+class TestJ2:
+    def test_render(self):
+        assert J2("rulesets/rulesets.j2").render(rulesets=[]) == ""
+
+    def test_render_without_template_name(self):
+        with pytest.raises(ValueError, match="template_name is required."):
+            J2().render()
+
+    def test_render_from_string(self):
+        assert J2().render_from_string("{{ foo }} {{ bar }}", foo="foo", bar="bar") == "foo bar"
+
+    def test_shared_environment(self, tmp_path):
+        assert J2().environment is J2("rulesets/rulesets.j2").environment
+        assert J2(templates_dir=str(tmp_path)).environment is J2.get_environment(str(tmp_path))
+        assert J2(templates_dir=str(tmp_path)).environment is not J2().environment
+
+    def test_templates_are_compiled_once(self, mocker):
+        J2.precompile()
+        compile_spy = mocker.spy(J2().environment, "compile")
+
+        template = "{{ foo }} " + uuid.uuid4().hex
+
+        J2("rulesets/rulesets.j2").render(rulesets=[])
+        J2().render_from_string(template, foo="foo")
+        J2().render_from_string(template, foo="bar")
+
+        assert compile_spy.call_count == 1
+
+    def test_render_from_string_with_custom_environment(self):
+        environment = Environment(loader=DictLoader({}), variable_start_string="[[", variable_end_string="]]")
+
+        assert J2(environment=environment).render_from_string("[[ foo ]] {{ foo }}", foo="bar") == "bar {{ foo }}"
+
+    def test_precompile(self, tmp_path):
+        (tmp_path / "foo.j2").write_text("{{ foo }}")
+        (tmp_path / "bar").mkdir()
+        (tmp_path / "bar" / "baz.j2").write_text("{{ baz }}")
+        (tmp_path / "README.md").write_text("not a template")
+
+        assert J2.precompile(str(tmp_path)) == 2
+        assert J2("bar/baz.j2", templates_dir=str(tmp_path)).render(baz="baz") == "baz"
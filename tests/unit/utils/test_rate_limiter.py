@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
+from griptape.utils import RateLimiter
+
+
+class TestRateLimiter:
+    @pytest.fixture()
+    def sleep(self, mocker):
+        return mocker.patch("griptape.utils.rate_limiter.time.sleep")
+
+    def test_requests_per_minute(self, sleep):
+        rate_limiter = RateLimiter(requests_per_minute=60)
+
+        for _ in range(60):
+            with rate_limiter.acquire():
+                pass
+
+        assert all(call.args[0] == 0 for call in sleep.call_args_list)
+        assert rate_limiter.throttled_requests == 0
+
+        with rate_limiter.acquire():
+            pass
+        with rate_limiter.acquire():
+            pass
+
+        assert sleep.call_args_list[-2].args[0] == pytest.approx(1, abs=0.05)
+        assert sleep.call_args_list[-1].args[0] == pytest.approx(2, abs=0.05)
+        assert rate_limiter.requests == 62
+        assert rate_limiter.throttled_requests == 2
+
+    def test_tokens_per_minute(self, sleep):
+        rate_limiter = RateLimiter(tokens_per_minute=600)
+
+        with rate_limiter.acquire(500):
+            pass
+        with rate_limiter.acquire(200):
+            pass
+
+        assert sleep.call_args_list[0].args[0] == 0
+        assert sleep.call_args_list[1].args[0] == pytest.approx(10, abs=0.05)
+
+    def test_max_concurrency(self):
+        rate_limiter = RateLimiter(max_concurrency=2)
+        lock = threading.Lock()
+        release = threading.Event()
+        in_flight = []
+        max_in_flight = []
+
+        def request() -> None:
+            with rate_limiter.acquire():
+                with lock:
+                    in_flight.append(1)
+                    max_in_flight.append(len(in_flight))
+                release.wait(timeout=10)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        # Holds the first two requests until the other six are waiting for a slot.
+        deadline = time.monotonic() + 10
+        while len(rate_limiter._slot_waiters) < 6 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert max(max_in_flight) == 2
+        assert rate_limiter.requests == 8
+        assert rate_limiter.throttled_requests > 0
+        assert rate_limiter.average_wait_time > 0
+
+    def test_aacquire(self, mocker):
+        sleep = mocker.patch("griptape.utils.rate_limiter.asyncio.sleep", return_value=None)
+        rate_limiter = RateLimiter(requests_per_minute=1, max_concurrency=1)
+
+        async def run() -> None:
+            async with rate_limiter.aacquire():
+                pass
+            async with rate_limiter.aacquire():
+                pass
+
+        asyncio.run(run())
+
+        assert sleep.call_args_list[1].args[0] == pytest.approx(60, abs=0.05)
+        assert rate_limiter.throttled_requests == 1
+
+    def test_aacquire_more_waiters_than_threads(self):
+        rate_limiter = RateLimiter(max_concurrency=1)
+
+        async def request() -> None:
+            async with rate_limiter.aacquire():
+                await asyncio.to_thread(time.sleep, 0.001)
+
+        async def run() -> None:
+            asyncio.get_running_loop().set_default_executor(futures.ThreadPoolExecutor(max_workers=2))
+
+            await asyncio.wait_for(asyncio.gather(*[request() for _ in range(20)]), timeout=10)
+
+        asyncio.run(run())
+
+        assert rate_limiter.requests == 20
+        assert rate_limiter._in_flight == 0
+
+    def test_aacquire_cancelled_waiter(self):
+        rate_limiter = RateLimiter(max_concurrency=1)
+
+        async def request() -> None:
+            async with rate_limiter.aacquire():
+                pass
+
+        async def run() -> None:
+            async with rate_limiter.aacquire():
+                waiting = asyncio.create_task(request())
+                await asyncio.sleep(0)
+                waiting.cancel()
+                await asyncio.gather(waiting, return_exceptions=True)
+
+                assert not rate_limiter._slot_waiters
+
+            async with rate_limiter.aacquire():
+                granted = asyncio.create_task(request())
+                await asyncio.sleep(0)
+            # The slot was granted to the waiter but it's cancelled before it resumes.
+            granted.cancel()
+            await asyncio.gather(granted, return_exceptions=True)
+
+            await asyncio.wait_for(request(), timeout=10)
+
+        asyncio.run(run())
+
+        assert rate_limiter._in_flight == 0
+
+    def test_reset_stats(self, sleep):
+        rate_limiter = RateLimiter(requests_per_minute=1)
+
+        for _ in range(2):
+            with rate_limiter.acquire():
+                pass
+        rate_limiter.reset_stats()
+
+        assert rate_limiter.requests == 0
+        assert rate_limiter.throttled_requests == 0
+        assert rate_limiter.total_wait_time == 0
+
+    def test_get_shared(self):
+        rate_limiter = RateLimiter.get_shared("test-get-shared", requests_per_minute=10)
+
+        assert RateLimiter.get_shared("test-get-shared") is rate_limiter
+        assert RateLimiter.get_shared("test-get-shared-other") is not rate_limiter
+        assert rate_limiter.requests_per_minute == 10
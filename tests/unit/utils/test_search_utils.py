@@ -0,0 +1,33 @@
+import pytest
+
+from griptape.utils import find_max_fitting
+
+
+class TestSearchUtils:
+    @pytest.mark.parametrize("boundary", [0, 1, 2, 17, 99, 100])
+    @pytest.mark.parametrize("estimate", [-5, 0, 1, 16, 17, 18, 50, 100, 500])
+    def test_find_max_fitting(self, boundary, estimate):
+        probes = []
+
+        def fits(n: int) -> bool:
+            probes.append(n)
+
+            return n <= boundary
+
+        assert find_max_fitting(fits, 100, estimate=estimate) == boundary
+        assert 0 not in probes
+        assert len(probes) <= 2 * 7 + 2
+
+    def test_find_max_fitting_accurate_estimate(self):
+        probes = []
+
+        def fits(n: int) -> bool:
+            probes.append(n)
+
+            return n <= 42
+
+        assert find_max_fitting(fits, 100, estimate=42) == 42
+        assert probes == [42, 43]
+
+    def test_find_max_fitting_empty(self):
+        assert find_max_fitting(lambda _: pytest.fail("fits should not be called"), 0, estimate=0) == 0